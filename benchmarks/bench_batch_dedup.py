@@ -0,0 +1,44 @@
+"""
+Batch Deduplication Benchmark — hinlang
+=========================================
+
+Compares per-text batch conversion with the vocabulary-deduplicated path
+on Zipf-distributed Hinglish messages.
+
+Run::
+
+    python benchmarks/bench_batch_dedup.py [n_messages]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import hinlang
+from corpus import zipf_messages
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    messages = zipf_messages(n)
+    engine = hinlang.RomanToHindi()
+
+    t0 = time.perf_counter()
+    plain = engine.transliterate_batch(messages, dedupe=False)
+    t1 = time.perf_counter()
+    deduped = engine.transliterate_batch(messages)
+    t2 = time.perf_counter()
+
+    assert plain == deduped
+    tokens = sum(len(m.split()) for m in messages)
+    distinct = len({w for m in messages for w in m.split()})
+    print(f"messages: {n}  tokens: {tokens}  distinct tokens: {distinct} "
+          f"({100.0 * distinct / tokens:.1f}%)")
+    print(f"per-text: {t1 - t0:8.3f} s")
+    print(f"deduped:  {t2 - t1:8.3f} s  ({(t1 - t0) / (t2 - t1):.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
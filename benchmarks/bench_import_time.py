@@ -0,0 +1,72 @@
+"""
+Import-Time Budget Check — hinlang
+====================================
+
+Measures the cold-start cost of ``import hinlang`` and of the first
+engine with ``python -X importtime`` and compares it with the budgets
+documented in the README ("Startup time"). Each import runs in a fresh
+interpreter ``--repeat`` times and the fastest run is kept, which
+filters out most scheduling noise; a loaded machine can still exceed
+the budgets, so this is a benchmark, not a unit test.
+
+Exits with status 1 if a budget is exceeded.
+
+Run::
+
+    python benchmarks/bench_import_time.py [--repeat N]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(__file__), '..')
+
+# Budgets in microseconds, cumulative as reported by ``-X importtime``
+BUDGETS_US = {
+    "hinlang": 5000,                   # import hinlang
+    "hinlang.roman_to_hindi": 50000,   # first engine, with re and the dictionary
+}
+
+
+def cumulative_us(stderr, module):
+    """Cumulative import time of ``module`` in ``-X importtime`` output."""
+    for line in stderr.splitlines():
+        if line.startswith("import time:") and line.split("|")[-1].strip() == module:
+            return int(line.split("|")[1])
+    raise ValueError("%s not in -X importtime output" % module)
+
+
+def measure(module, repeat):
+    """Fastest cumulative import time of ``module`` over ``repeat`` fresh interpreters."""
+    # Compile the bytecode first, as an installed package has it
+    subprocess.run([sys.executable, "-c", "import " + module], cwd=ROOT, check=True)
+    best = None
+    for _ in range(repeat):
+        stderr = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import " + module],
+            cwd=ROOT, capture_output=True, text=True, check=True,
+        ).stderr
+        elapsed = cumulative_us(stderr, module)
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check hinlang's import-time budgets.")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per import (fastest kept)")
+    args = parser.parse_args(argv)
+
+    over = False
+    for module, budget in BUDGETS_US.items():
+        elapsed = measure(module, args.repeat)
+        status = "ok" if elapsed <= budget else "OVER BUDGET"
+        over |= elapsed > budget
+        print(f"{module:>25}: {elapsed / 1e3:7.1f} ms (budget {budget / 1e3:.0f} ms)  {status}")
+    return 1 if over else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,211 @@
+"""
+Throughput & Latency Benchmark Suite — hinlang
+================================================
+
+Measures the public API on synthetic Zipf-distributed corpora (see
+``corpus.py``) and writes the results as JSON:
+
+* ``calls``: tokens per second and p50/p99 per-call latency of
+  ``to_hindi``, ``to_roman``, ``convert`` and ``detect_script``, one call
+  per message. An untimed warm-up round fills the module-level word
+  caches, as in a long-running service; the percentiles cover every
+  call of the timed rounds.
+* ``batch``: tokens per second of ``to_hindi_batch`` and
+  ``to_roman_batch`` over the whole corpus.
+* ``paths``: per-word cost of the dictionary path and the
+  out-of-dictionary (character) path of each engine, measured
+  separately with caching disabled.
+
+Compare two runs to tell whether a release got faster or slower::
+
+    python benchmarks/bench_suite.py --output before.json
+    python benchmarks/bench_suite.py --output after.json
+
+Run::
+
+    python benchmarks/bench_suite.py [--messages N] [--vocab N] [--skew S]
+                                     [--repeat N] [--output results.json]
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import hinlang
+from hinlang.dictionary import ROMAN_TO_HINDI, hindi_to_roman
+from corpus import zipf_messages, zipf_vocab
+
+# Bump when the JSON layout changes
+SCHEMA_VERSION = 2
+
+
+def percentile(sorted_values, q):
+    """Nearest-rank percentile of an ascending list, ``q`` in ``[0, 1]``."""
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))]
+
+
+def bench_calls(func, texts, repeat):
+    """
+    Time ``func`` once per text over ``repeat`` rounds, after one untimed
+    warm-up round.
+
+    Percentiles are taken over every timed call, so slow calls show up
+    in p99 even when they are fast in another round. Throughput and the
+    mean come from the wall-clock time of the timed rounds.
+    """
+    clock = time.perf_counter_ns
+    for text in texts:
+        func(text)
+
+    latencies = []
+    record = latencies.append
+    begin = clock()
+    for _ in range(repeat):
+        for text in texts:
+            start = clock()
+            func(text)
+            record(clock() - start)
+    total = (clock() - begin) / 1e9
+    latencies.sort()
+    calls = len(latencies)
+    tokens = sum(len(text.split()) for text in texts) * repeat
+    return {
+        "calls": calls,
+        "tokens": tokens,
+        "seconds": total,
+        "tokens_per_sec": tokens / total if total else 0.0,
+        "p50_us": percentile(latencies, 0.50) / 1e3,
+        "p99_us": percentile(latencies, 0.99) / 1e3,
+        "mean_us": total * 1e6 / calls if calls else 0.0,
+    }
+
+
+def bench_batch(func, texts, repeat):
+    """Time one ``func(texts)`` call; keep the fastest of ``repeat`` rounds."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(texts)
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    tokens = sum(len(text.split()) for text in texts)
+    return {
+        "texts": len(texts),
+        "tokens": tokens,
+        "seconds": best,
+        "tokens_per_sec": tokens / best if best else 0.0,
+    }
+
+
+def bench_words(convert, words, repeat):
+    """Per-word cost of ``convert`` over ``words``, fastest of ``repeat`` rounds."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for word in words:
+            convert(word)
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return {
+        "words": len(words),
+        "seconds": best,
+        "words_per_sec": len(words) / best if best else 0.0,
+        "ns_per_word": best * 1e9 / len(words) if words else 0.0,
+    }
+
+
+def bench_paths(vocab, repeat):
+    """Dictionary-path and character-path timings of both engines."""
+    # Fresh engines without a word cache, so every word takes its path
+    r2h = hinlang.RomanToHindi()
+    h2r = hinlang.HindiToRoman()
+    reverse = hindi_to_roman()
+
+    roman_unknown = [w for w in vocab if w not in ROMAN_TO_HINDI]
+    hindi_unknown = [h for h in r2h.transliterate_batch(roman_unknown) if h not in reverse]
+    return {
+        "roman_to_hindi": {
+            "dictionary": bench_words(r2h._convert_word, list(ROMAN_TO_HINDI), repeat),
+            "character": bench_words(r2h._convert_word, roman_unknown, repeat),
+        },
+        "hindi_to_roman": {
+            "dictionary": bench_words(h2r._convert_word, list(reverse), repeat),
+            "character": bench_words(h2r._convert_word, hindi_unknown, repeat),
+        },
+    }
+
+
+def run(messages=10000, vocab_size=20000, skew=1.1, seed=42, repeat=3):
+    """Run the whole suite and return the results as a JSON-ready dict."""
+    roman = zipf_messages(messages, vocab_size, skew, seed, "roman")
+    devanagari = zipf_messages(messages, vocab_size, skew, seed, "devanagari")
+    mixed = zipf_messages(messages, vocab_size, skew, seed, "mixed")
+
+    return {
+        "schema": SCHEMA_VERSION,
+        "hinlang": hinlang.__version__,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "params": {
+            "messages": messages, "vocab": vocab_size, "skew": skew,
+            "seed": seed, "repeat": repeat,
+        },
+        "calls": {
+            "to_hindi": bench_calls(hinlang.to_hindi, roman, repeat),
+            "to_roman": bench_calls(hinlang.to_roman, devanagari, repeat),
+            "convert": bench_calls(hinlang.convert, mixed, repeat),
+            "detect_script": bench_calls(hinlang.detect_script, mixed, repeat),
+        },
+        "batch": {
+            "to_hindi_batch": bench_batch(hinlang.to_hindi_batch, roman, repeat),
+            "to_roman_batch": bench_batch(hinlang.to_roman_batch, devanagari, repeat),
+        },
+        "paths": bench_paths(zipf_vocab(vocab_size, seed), repeat),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark hinlang and write JSON results.")
+    parser.add_argument("--messages", type=int, default=10000, help="Messages per corpus")
+    parser.add_argument("--vocab", type=int, default=20000, help="Vocabulary size")
+    parser.add_argument("--skew", type=float, default=1.1, help="Zipf exponent")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--repeat", type=int, default=3,
+        help="Timed rounds per measurement; the fastest round is kept, "
+             "except for per-call latencies, which use every round",
+    )
+    parser.add_argument("--output", "-o", help="Write JSON here instead of stdout")
+    args = parser.parse_args(argv)
+
+    results = run(args.messages, args.vocab, args.skew, args.seed, args.repeat)
+    text = json.dumps(results, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    for name, stats in results["calls"].items():
+        print(f"{name:>15}: {stats['tokens_per_sec']:>12,.0f} tok/s  "
+              f"p50 {stats['p50_us']:8.1f} µs  p99 {stats['p99_us']:8.1f} µs", file=sys.stderr)
+    for name, stats in results["batch"].items():
+        print(f"{name:>15}: {stats['tokens_per_sec']:>12,.0f} tok/s", file=sys.stderr)
+    for engine, paths in results["paths"].items():
+        for path, stats in paths.items():
+            print(f"{engine:>15} {path:>10}: {stats['ns_per_word']:8.0f} ns/word", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Synthetic Corpus Generator — hinlang
+======================================
+
+Zipf-distributed chat messages in Roman, Devanagari or mixed script,
+shared by the benchmarks.
+
+The vocabulary is the built-in dictionary padded with random
+pseudo-words, ranked so that dictionary words are the most frequent.
+Devanagari messages use the Devanagari form of the same vocabulary, and
+mixed messages draw each word from either script.
+
+Run::
+
+    python benchmarks/corpus.py [--messages N] [--script mixed] > corpus.txt
+"""
+
+import argparse
+import itertools
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import hinlang
+from hinlang.dictionary import ROMAN_TO_HINDI
+
+SCRIPTS = ("roman", "devanagari", "mixed")
+
+
+def zipf_vocab(vocab_size=20000, seed=42):
+    """Return ``vocab_size`` Roman words, dictionary words first."""
+    return _build_vocab(random.Random(seed), vocab_size)
+
+
+def _build_vocab(rng, vocab_size):
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    vocab = list(ROMAN_TO_HINDI)
+    while len(vocab) < vocab_size:
+        vocab.append(''.join(rng.choice(letters) for _ in range(rng.randint(3, 9))))
+    return vocab[:vocab_size]
+
+
+def zipf_messages(n_messages, vocab_size=20000, s=1.1, seed=42, script="roman",
+                  mix=0.3):
+    """
+    Build ``n_messages`` short messages whose words follow Zipf's law.
+
+    Args:
+        n_messages: Number of messages.
+        vocab_size: Distinct words to draw from.
+        s: Zipf exponent; higher values skew towards the top words.
+        seed: Random seed; equal arguments give equal corpora.
+        script: ``"roman"``, ``"devanagari"`` or ``"mixed"``.
+        mix: For ``"mixed"``, the share of words written in Devanagari.
+
+    Returns:
+        List of message strings.
+    """
+    if script not in SCRIPTS:
+        raise ValueError("script must be one of %s" % (", ".join(SCRIPTS),))
+    rng = random.Random(seed)
+    vocab = _build_vocab(rng, vocab_size)
+    devanagari = vocab
+    if script != "roman":
+        devanagari = hinlang.RomanToHindi().transliterate_batch(vocab)
+
+    cum_weights = list(itertools.accumulate(1.0 / (rank ** s) for rank in range(1, vocab_size + 1)))
+    ranks = range(vocab_size)
+    messages = []
+    for _ in range(n_messages):
+        picks = rng.choices(ranks, cum_weights=cum_weights, k=rng.randint(3, 15))
+        if script == "roman":
+            words = [vocab[i] for i in picks]
+        elif script == "devanagari":
+            words = [devanagari[i] for i in picks]
+        else:
+            words = [devanagari[i] if rng.random() < mix else vocab[i] for i in picks]
+        message = ' '.join(words)
+        if script == "roman":
+            message = message.capitalize()
+        messages.append(message + rng.choice(['', '!', '?', '...']))
+    return messages
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write a synthetic Hinglish corpus to stdout.")
+    parser.add_argument("--messages", type=int, default=10000)
+    parser.add_argument("--vocab", type=int, default=20000)
+    parser.add_argument("--skew", type=float, default=1.1, help="Zipf exponent")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--script", choices=SCRIPTS, default="roman")
+    parser.add_argument("--mix", type=float, default=0.3,
+                        help="Devanagari share of words in mixed text")
+    args = parser.parse_args(argv)
+
+    for message in zipf_messages(args.messages, args.vocab, args.skew, args.seed,
+                                 args.script, args.mix):
+        print(message)
+
+
+if __name__ == "__main__":
+    main()
@@ -29,26 +29,43 @@ __version__ = "1.0.0"
 __author__ = "hinlangpy contributors"
 __license__ = "MIT"
 
-from hinlang.roman_to_hindi import RomanToHindi
-from hinlang.hindi_to_roman import HindiToRoman
-from hinlang.detector import detect_script
+# Submodules are imported on first use, so ``import hinlang`` itself
+# stays within the import-time budget (see README, "Startup time").
+# ``_thread`` is built in, while ``threading`` costs milliseconds to import.
+from _thread import allocate_lock
 
 # ── Module-level singleton instances (lazy, created once) ──
+_CACHE_SIZE = 4096
+
 _r2h = None
 _h2r = None
+_init_lock = allocate_lock()
+_stats_enabled = False
 
 
 def _get_r2h():
     global _r2h
     if _r2h is None:
-        _r2h = RomanToHindi()
+        with _init_lock:
+            if _r2h is None:
+                from hinlang.roman_to_hindi import RomanToHindi
+                engine = RomanToHindi(cache_size=_CACHE_SIZE)
+                if _stats_enabled:
+                    engine.enable_stats()
+                _r2h = engine
     return _r2h
 
 
 def _get_h2r():
     global _h2r
     if _h2r is None:
-        _h2r = HindiToRoman()
+        with _init_lock:
+            if _h2r is None:
+                from hinlang.hindi_to_roman import HindiToRoman
+                engine = HindiToRoman(cache_size=_CACHE_SIZE)
+                if _stats_enabled:
+                    engine.enable_stats()
+                _h2r = engine
     return _h2r
 
 
@@ -98,7 +115,7 @@ def to_roman(text: str) -> str:
     return _get_h2r().transliterate(text)
 
 
-def convert(text: str) -> str:
+def convert(text: str, mode: str = "whole") -> str:
     """
     Auto-detect input script and convert to the other.
 
@@ -108,6 +125,11 @@ def convert(text: str) -> str:
 
     Args:
         text: Input text in either script.
+        mode: ``"whole"`` (default) sends the entire text through one
+            engine. ``"spans"`` splits it with :func:`segment_scripts`
+            and converts only the runs written in the source script,
+            copying runs already in the target script (and all
+            whitespace) through untouched.
 
     Returns:
         Converted text in the opposite script.
@@ -119,20 +141,48 @@ def convert(text: str) -> str:
 
         >>> hinlang.convert("क्या हाल है")
         'kya haal hai'
+
+        >>> hinlang.convert("Aaj मौसम accha hai", mode="spans")
+        'आज मौसम अच्छा है'
     """
-    script = detect_script(text)
-    if script == "devanagari":
-        return to_roman(text)
-    else:
-        return to_hindi(text)
+    if mode not in ("whole", "spans"):
+        raise ValueError("mode must be 'whole' or 'spans', not %r" % (mode,))
+
+    if mode == "spans":
+        return _convert_spans(text)
+    # Detection and tokenization share one pass (see hinlang.fused)
+    from hinlang.fused import convert_fused
+    return convert_fused(_get_r2h, _get_h2r, text)
+
+
+def _convert_spans(text):
+    from hinlang.detector import detect_script, segment_scripts
+
+    source = "devanagari" if detect_script(text) == "devanagari" else "roman"
+    engine = _get_h2r() if source == "devanagari" else _get_r2h()
+    pieces = []
+    for start, end, script in segment_scripts(text):
+        run = text[start:end]
+        if script == source:
+            run = ''.join(engine.transliterate_iter((run,)))
+        pieces.append(run)
+    return ''.join(pieces) if pieces else text
 
 
-def to_hindi_batch(texts: list) -> list:
+def to_hindi_batch(texts: list, workers: int = 1, chunksize: int = 1024,
+                   backend: str = "process", dedupe: bool = True) -> list:
     """
     Convert a list of Roman Hindi strings to Devanagari.
 
     Args:
         texts: List of Roman/Hinglish text strings.
+        workers: Number of workers. ``1`` (default) converts
+            in the calling process; larger values spread the batch
+            across a pool.
+        chunksize: Number of strings sent to a worker per task.
+        backend: ``"process"`` (default) or ``"thread"``.
+        dedupe: Convert each distinct word only once (default). Repeated
+            outputs share one string object.
 
     Returns:
         List of Devanagari (Hindi) text strings.
@@ -141,17 +191,28 @@ def to_hindi_batch(texts: list) -> list:
 
         >>> hinlang.to_hindi_batch(["Namaste", "Kya haal hai"])
         ['नमस्ते', 'क्या हाल है']
+
+        >>> hinlang.to_hindi_batch(texts, workers=8)  # uses 8 processes
     """
-    engine = _get_r2h()
-    return [engine.transliterate(t) for t in texts]
+    return _get_r2h().transliterate_batch(
+        texts, workers=workers, chunksize=chunksize, backend=backend, dedupe=dedupe
+    )
 
 
-def to_roman_batch(texts: list) -> list:
+def to_roman_batch(texts: list, workers: int = 1, chunksize: int = 1024,
+                   backend: str = "process", dedupe: bool = True) -> list:
     """
     Convert a list of Devanagari strings to Roman Hinglish.
 
     Args:
         texts: List of Devanagari (Hindi) text strings.
+        workers: Number of workers. ``1`` (default) converts
+            in the calling process; larger values spread the batch
+            across a pool.
+        chunksize: Number of strings sent to a worker per task.
+        backend: ``"process"`` (default) or ``"thread"``.
+        dedupe: Convert each distinct word only once (default). Repeated
+            outputs share one string object.
 
     Returns:
         List of Roman/Hinglish text strings.
@@ -160,9 +221,82 @@ def to_roman_batch(texts: list) -> list:
 
         >>> hinlang.to_roman_batch(["नमस्ते", "क्या हाल है"])
         ['namaste', 'kya haal hai']
+
+        >>> hinlang.to_roman_batch(texts, workers=8)  # uses 8 processes
+    """
+    return _get_h2r().transliterate_batch(
+        texts, workers=workers, chunksize=chunksize, backend=backend, dedupe=dedupe
+    )
+
+
+def enable_stats(enabled: bool = True):
+    """
+    Turn runtime counters on or off for the module-level engines.
+
+    Engines created later (on first use) start with the same setting.
+    See :meth:`RomanToHindi.enable_stats`.
+
+    Args:
+        enabled: ``True`` to start counting, ``False`` to stop.
+    """
+    global _stats_enabled
+    with _init_lock:
+        _stats_enabled = enabled
+        for engine in (_r2h, _h2r):
+            if engine is not None:
+                engine.enable_stats(enabled)
+
+
+def stats() -> dict:
+    """
+    Return the counters of the module-level engines.
+
+    Returns:
+        ``{"roman_to_hindi": Stats, "hindi_to_roman": Stats}``; an entry
+        is ``None`` while stats are disabled or before the engine has
+        been used.
+
+    Example::
+
+        >>> hinlang.enable_stats()
+        >>> hinlang.to_hindi("Namaste dosto")
+        >>> hinlang.stats()["roman_to_hindi"].dictionary_hits
+        2
     """
-    engine = _get_h2r()
-    return [engine.transliterate(t) for t in texts]
+    return {
+        "roman_to_hindi": _r2h.stats() if _r2h is not None else None,
+        "hindi_to_roman": _h2r.stats() if _h2r is not None else None,
+    }
+
+
+# ── Lazily imported names: attribute -> submodule ──
+_LAZY_NAMES = {
+    "RomanToHindi": "roman_to_hindi",
+    "HindiToRoman": "hindi_to_roman",
+    "detect_script": "detector",
+    "detect_script_info": "detector",
+    "segment_scripts": "detector",
+    "ato_hindi": "aio",
+    "ato_roman": "aio",
+    "aconvert": "aio",
+    "aiter_hindi": "aio",
+    "aiter_roman": "aio",
+    "transliterate_jsonl": "records",
+    "transliterate_csv": "records",
+}
+
+
+def __getattr__(name):
+    module = _LAZY_NAMES.get(name)
+    if module is None:
+        raise AttributeError("module 'hinlang' has no attribute %r" % (name,))
+    value = getattr(__import__("hinlang." + module, None, None, [name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_NAMES))
 
 
 # ── Public API listing ──
@@ -173,6 +307,17 @@ __all__ = [
     "to_hindi_batch",
     "to_roman_batch",
     "detect_script",
+    "detect_script_info",
+    "segment_scripts",
+    "enable_stats",
+    "stats",
+    "ato_hindi",
+    "ato_roman",
+    "aconvert",
+    "aiter_hindi",
+    "aiter_roman",
+    "transliterate_jsonl",
+    "transliterate_csv",
     "RomanToHindi",
     "HindiToRoman",
     "__version__",
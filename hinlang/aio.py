@@ -0,0 +1,209 @@
+"""
+hinlang.aio
+============
+
+asyncio-native transliteration.
+
+The coroutines here convert text in slices of ``yield_every`` tokens and
+hand control back to the event loop between slices, so one large message
+does not stall every other coroutine on the loop. Very large inputs can
+instead be sent to an executor through an :class:`Offload`, which also
+caps how many conversions run there at once.
+
+Usage::
+
+    import hinlang
+
+    async def handle(message):
+        return await hinlang.ato_hindi(message)
+
+    async def handle_log(lines):
+        async for piece in hinlang.aiter_hindi(lines):
+            await sink.write(piece)
+"""
+
+import asyncio
+
+from hinlang import _get_h2r, _get_r2h, detect_script
+from hinlang.stream import ChunkSplitter
+
+# Default number of tokens converted between two yields to the loop
+YIELD_EVERY = 256
+
+
+class Offload:
+    """
+    Run large conversions in an executor, with bounded concurrency.
+
+    Args:
+        executor: A ``concurrent.futures`` executor, or ``None`` for the
+            loop's default thread pool.
+        max_concurrent: Maximum number of conversions in flight on the
+            executor; further callers wait (backpressure).
+        min_chars: Inputs shorter than this are converted on the loop
+            with cooperative yielding instead.
+
+    Example::
+
+        offload = Offload(max_concurrent=4, min_chars=100_000)
+        await hinlang.ato_roman(document, offload=offload)
+    """
+
+    def __init__(self, executor=None, max_concurrent: int = 4, min_chars: int = 1 << 16):
+        if max_concurrent < 1:
+            raise ValueError("max_concurrent must be a positive integer")
+        self.executor = executor
+        self.max_concurrent = max_concurrent
+        self.min_chars = min_chars
+        self._semaphore = None
+
+    async def run(self, func, *args):
+        """Run ``func(*args)`` in the executor once a slot is free."""
+        if self._semaphore is None:
+            # Created lazily so it binds to the running loop
+            self._semaphore = asyncio.Semaphore(self.max_concurrent)
+        async with self._semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, func, *args)
+
+
+async def atransliterate(engine, text: str, yield_every: int = YIELD_EVERY,
+                         offload: Offload = None) -> str:
+    """
+    Cooperatively run ``engine.transliterate(text)``.
+
+    The result is identical to the synchronous call.
+
+    Args:
+        engine: A ``RomanToHindi`` or ``HindiToRoman`` instance.
+        text: Input text.
+        yield_every: Tokens converted between yields to the event loop.
+        offload: Optional :class:`Offload` for large inputs.
+    """
+    if yield_every < 1:
+        raise ValueError("yield_every must be a positive integer")
+    if not text:
+        return ""
+    if offload is not None and len(text) >= offload.min_chars:
+        return await offload.run(engine.transliterate, text)
+
+    tokens = engine._tokenizer.tokenize(text)
+    if len(tokens) <= yield_every:
+        return ' '.join(engine._convert_tokens(tokens))
+
+    result = []
+    for start in range(0, len(tokens), yield_every):
+        if start:
+            await asyncio.sleep(0)
+        result.extend(engine._convert_tokens(tokens[start:start + yield_every]))
+    return ' '.join(result)
+
+
+async def aiter_transliterate(engine, chunks, yield_every: int = YIELD_EVERY):
+    """
+    Async counterpart of ``engine.transliterate_iter``.
+
+    Args:
+        engine: A ``RomanToHindi`` or ``HindiToRoman`` instance.
+        chunks: Async or regular iterable of text chunks.
+        yield_every: Tokens converted between yields to the event loop.
+
+    Yields:
+        Converted text pieces with whitespace preserved exactly.
+    """
+    if yield_every < 1:
+        raise ValueError("yield_every must be a positive integer")
+
+    splitter = ChunkSplitter()
+
+    if hasattr(chunks, "__aiter__"):
+        async for chunk in chunks:
+            head = splitter.feed(chunk)
+            if head:
+                async for piece in _aconvert_complete(engine, head, yield_every):
+                    yield piece
+    else:
+        for chunk in chunks:
+            head = splitter.feed(chunk)
+            if head:
+                async for piece in _aconvert_complete(engine, head, yield_every):
+                    yield piece
+
+    tail = splitter.flush()
+    if tail:
+        async for piece in _aconvert_complete(engine, tail, yield_every):
+            yield piece
+
+
+async def _aconvert_complete(engine, text, yield_every):
+    # Convert text that ends on a word boundary, yielding every N tokens
+    repl = engine._sub_token
+    out = []
+    last = 0
+    count = 0
+    for match in engine._tokenizer.pattern.finditer(text):
+        out.append(text[last:match.start()])
+        out.append(repl(match))
+        last = match.end()
+        count += 1
+        if count == yield_every:
+            yield ''.join(out)
+            out = []
+            count = 0
+            await asyncio.sleep(0)
+    out.append(text[last:])
+    piece = ''.join(out)
+    if piece:
+        yield piece
+
+
+# ────────────────────────────────────────────────
+#  Module-level convenience coroutines
+# ────────────────────────────────────────────────
+
+async def ato_hindi(text: str, yield_every: int = YIELD_EVERY, offload: Offload = None) -> str:
+    """
+    Async :func:`hinlang.to_hindi`.
+
+    Example::
+
+        >>> await hinlang.ato_hindi("Namaste Dosto")
+        'नमस्ते दोस्तो'
+    """
+    return await atransliterate(_get_r2h(), text, yield_every, offload)
+
+
+async def ato_roman(text: str, yield_every: int = YIELD_EVERY, offload: Offload = None) -> str:
+    """
+    Async :func:`hinlang.to_roman`.
+
+    Example::
+
+        >>> await hinlang.ato_roman("नमस्ते दोस्तो")
+        'namaste dosto'
+    """
+    return await atransliterate(_get_h2r(), text, yield_every, offload)
+
+
+async def aconvert(text: str, yield_every: int = YIELD_EVERY, offload: Offload = None) -> str:
+    """
+    Async :func:`hinlang.convert` (auto-detects the direction).
+
+    Example::
+
+        >>> await hinlang.aconvert("Kya haal hai")
+        'क्या हाल है'
+    """
+    if detect_script(text) == "devanagari":
+        return await ato_roman(text, yield_every, offload)
+    return await ato_hindi(text, yield_every, offload)
+
+
+def aiter_hindi(chunks, yield_every: int = YIELD_EVERY):
+    """Async-iterate Roman ``chunks`` as Devanagari, preserving whitespace."""
+    return aiter_transliterate(_get_r2h(), chunks, yield_every)
+
+
+def aiter_roman(chunks, yield_every: int = YIELD_EVERY):
+    """Async-iterate Devanagari ``chunks`` as Roman, preserving whitespace."""
+    return aiter_transliterate(_get_h2r(), chunks, yield_every)
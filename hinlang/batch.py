@@ -0,0 +1,65 @@
+"""
+hinlang.batch
+==============
+
+Vocabulary-deduplicated batch conversion.
+
+In real message batches the number of distinct tokens is a small
+fraction of the total. :func:`transliterate_deduped` splits every text
+on whitespace, tokenizes each distinct token once, converts each
+distinct core word exactly once, and rebuilds the outputs from that
+vocabulary. Identical outputs are returned as the same string object,
+so the result list does not hold duplicate copies.
+"""
+
+
+def transliterate_deduped(engine, texts) -> list:
+    """
+    Transliterate ``texts`` with ``engine``, converting each distinct word once.
+
+    The result is identical to ``[engine.transliterate(t) for t in texts]``.
+
+    Args:
+        engine: A ``RomanToHindi`` or ``HindiToRoman`` instance.
+        texts: Iterable of input strings.
+
+    Returns:
+        List of converted strings, in input order.
+    """
+    match = engine._tokenizer.pattern.match
+    table = engine._suffix_table
+    texts = texts if isinstance(texts, list) else list(texts)
+
+    # Pass 1: distinct texts and distinct whitespace-delimited tokens
+    done = {}      # input text -> its tokens, later its output
+    pieces = {}    # token -> converted token
+    for text in texts:
+        if text not in done:
+            tokens = done[text] = text.split() if text else []
+            for token in tokens:
+                if token not in pieces:
+                    pieces[token] = None
+
+    # Pass 2: tokenize each distinct token once, convert each distinct core once
+    split = {}     # token -> (prefix, core, suffix)
+    vocab = {}     # core word -> converted core
+    for token in pieces:
+        parts = split[token] = match(token).groups('')
+        if parts[1]:
+            vocab[parts[1]] = None
+    cores = list(vocab)
+    vocab = dict(zip(cores, engine._convert_words(cores)))
+
+    for token, (prefix, core, suffix) in split.items():
+        if core:
+            pieces[token] = prefix + vocab[core] + suffix.translate(table)
+        else:
+            pieces[token] = prefix
+
+    # Pass 3: rebuild outputs, sharing identical ones
+    outputs = {}   # output -> the one shared instance of it
+    for text, tokens in done.items():
+        out = ' '.join([pieces[token] for token in tokens])
+        done[text] = outputs.setdefault(out, out)
+
+    return [done[text] for text in texts]
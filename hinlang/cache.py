@@ -0,0 +1,100 @@
+"""
+hinlang.cache
+==============
+
+Bounded, approximately-LRU memoization for per-word conversions.
+
+Both engines can keep one of these to remember the character-level
+result for words that miss the dictionary. Hinglish traffic is highly
+repetitive, so a few thousand entries absorb most of the repeats.
+"""
+
+import threading
+from collections import namedtuple
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "evictions", "maxsize", "currsize"])
+
+
+class WordCache:
+    """
+    Approximately least-recently-used cache of ``{word: converted}`` pairs.
+
+    Args:
+        maxsize: Maximum number of entries kept. Once the cache is full,
+            an entry that has not been read since it was inserted (or
+            last given a second chance) is evicted.
+
+    Reads never lock: a hit is a plain dict lookup plus, the first time
+    an entry is read, setting its "referenced" mark. Only ``put`` and
+    ``clear`` take the internal lock. Eviction is second-chance (CLOCK):
+    the oldest entry is evicted unless it was read, in which case it is
+    moved to the back and its mark cleared. Under concurrent use the
+    hit/miss counters are approximate.
+
+    Example::
+
+        cache = WordCache(maxsize=2)
+        cache.put("dosto", "दोस्तो")
+        cache.get("dosto")   # 'दोस्तो'
+        cache.info()         # CacheInfo(hits=1, misses=0, ...)
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be a positive integer")
+        self.maxsize = maxsize
+        self._data = {}              # insertion order = eviction order
+        self._referenced = set()     # keys read since insertion
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        """Return the cached value for ``key`` or ``None`` on a miss."""
+        value = self._data.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        if key not in self._referenced:
+            self._referenced.add(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        """Store ``value`` under ``key``, evicting an old entry if full."""
+        data = self._data
+        referenced = self._referenced
+        with self._lock:
+            if key not in data:
+                referenced.discard(key)
+            data[key] = value
+            while len(data) > self.maxsize:
+                oldest = next(iter(data))
+                if oldest in referenced:
+                    # Second chance: move to the back, clear the mark
+                    referenced.discard(oldest)
+                    data[oldest] = data.pop(oldest)
+                else:
+                    del data[oldest]
+                    self.evictions += 1
+
+    def clear(self):
+        """Drop all entries. Hit/miss/eviction counters are kept."""
+        with self._lock:
+            self._data.clear()
+            self._referenced.clear()
+
+    def info(self) -> CacheInfo:
+        """Return a snapshot of the cache statistics."""
+        with self._lock:
+            return CacheInfo(
+                self.hits, self.misses, self.evictions, self.maxsize, len(self._data)
+            )
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        # Membership only: no hit/miss counting, no LRU reordering
+        return key in self._data
@@ -12,11 +12,18 @@ Usage::
     hinlangpy --to-roman "क्या हाल है"
     hinlangpy --interactive
     hinlangpy --file input.txt --output output.txt
+    hinlangpy --stats --file input.txt
+    hinlangpy --file big.txt --output big.hi.txt --jobs 8
+    hinlangpy --input-dir subs/ --output-dir subs.hi/ --glob "*.srt" --jobs 8
+    hinlangpy --file chats.jsonl --output chats.hi.jsonl --fields message,title
     echo "Namaste" | hinlangpy
+    tail -f chat.log | hinlangpy --line-buffered
+    hinlangpy --serve --socket /tmp/hinlang.sock &
+    HINLANG_SOCKET=/tmp/hinlang.sock hinlangpy "Namaste"
 """
 
+import os
 import sys
-import argparse
 
 # Fix Windows console encoding for Devanagari output
 if sys.platform == 'win32':
@@ -29,6 +36,12 @@ if sys.platform == 'win32':
 
 def main():
     """Entry point for the ``hinlangpy`` CLI command."""
+    # Plain text through a running daemon skips argparse and the engines
+    if _daemon_fast_path(sys.argv[1:]):
+        return
+
+    import argparse
+
     parser = argparse.ArgumentParser(
         prog="hinlangpy",
         description="Hinglish ↔ Hindi (Devanagari) Transliterator",
@@ -38,7 +51,8 @@ def main():
                "  hinlangpy --to-hindi \"Kya haal hai\"\n"
                "  hinlangpy --to-roman \"क्या हाल है\"\n"
                "  hinlangpy --interactive\n"
-               "  echo \"Namaste\" | hinlangpy",
+               "  echo \"Namaste\" | hinlangpy\n"
+               "  tail -f chat.log | hinlangpy --line-buffered",
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
 
@@ -66,12 +80,81 @@ def main():
         "--output", "-o", dest="output_file", default=None,
         help="Output file (default: stdout)"
     )
+    parser.add_argument(
+        "--input-dir", default=None,
+        help="Convert every file matching --glob under this directory"
+    )
+    parser.add_argument(
+        "--output-dir", default=None,
+        help="Where --input-dir results go (same relative paths)"
+    )
+    parser.add_argument(
+        "--glob", default="*.txt",
+        help="File pattern for --input-dir, matched recursively (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--jobs", "-j", type=int, default=1,
+        help="Worker processes for --file/--input-dir (0 = all cores; default: 1)"
+    )
+    parser.add_argument(
+        "--fields", default=None,
+        help="Convert only these comma-separated JSONL fields or CSV/TSV columns"
+    )
+    parser.add_argument(
+        "--format", dest="record_format", choices=("jsonl", "csv", "tsv"), default=None,
+        help="Record format for --fields (default: from the --file extension)"
+    )
+    parser.add_argument(
+        "--no-header", dest="header", action="store_false",
+        help="CSV/TSV input has no header row (--fields are column numbers)"
+    )
+    parser.add_argument(
+        "--line-buffered", action="store_true",
+        help="Flush the output after every line (for pipelines)"
+    )
+    parser.add_argument(
+        "--stats", action="store_true",
+        help="Print conversion statistics to stderr after the run "
+             "(--jobs worker processes are not counted)"
+    )
+    parser.add_argument(
+        "--serve", action="store_true",
+        help="Run a daemon with warm engines on --socket"
+    )
+    parser.add_argument(
+        "--socket", default=os.environ.get("HINLANG_SOCKET"),
+        help="Daemon socket path (default: $HINLANG_SOCKET); text arguments "
+             "are sent to the daemon when it runs"
+    )
+    parser.add_argument(
+        "--client", action="store_true",
+        help="Require the daemon instead of falling back to converting locally"
+    )
     parser.add_argument(
         "--version", "-v", action="store_true",
         help="Show version"
     )
 
     args = parser.parse_args()
+    if args.jobs < 0:
+        parser.error("--jobs must be 0 (all cores) or a positive number")
+    if args.jobs != 1 and not (args.input_file or args.input_dir):
+        parser.error("--jobs requires --file or --input-dir")
+    if bool(args.input_dir) != bool(args.output_dir):
+        parser.error("--input-dir and --output-dir go together")
+    if (args.serve or args.client) and not args.socket:
+        parser.error("--serve/--client need --socket or $HINLANG_SOCKET")
+    if args.client and not args.text:
+        parser.error("--client converts text arguments")
+    if args.fields:
+        if args.text or args.input_dir or args.jobs != 1:
+            parser.error("--fields reads records from --file or stdin")
+        if args.record_format is None:
+            args.record_format = _record_format(args.input_file)
+        if args.record_format is None:
+            parser.error("--fields needs --format when the input is not a .jsonl/.csv/.tsv file")
+    elif args.record_format:
+        parser.error("--format requires --fields")
 
     # Lazy import to keep CLI fast
     import hinlang
@@ -81,32 +164,64 @@ def main():
         print(f"hinlangpy v{hinlang.__version__}")
         return
 
+    if args.stats:
+        hinlang.enable_stats()
+    try:
+        _run(hinlang, parser, args)
+    finally:
+        if args.stats:
+            _print_stats(hinlang)
+
+
+def _run(hinlang, parser, args):
+    """Dispatch to the selected mode."""
+    # Daemon
+    if args.serve:
+        _serve_mode(args)
+        return
+
     # Interactive mode
     if args.interactive:
         _interactive_mode(hinlang)
         return
 
+    # Record mode
+    if args.fields:
+        _records_mode(args)
+        return
+
+    # Directory mode
+    if args.input_dir:
+        _dir_mode(hinlang, args)
+        return
+
     # File mode
     if args.input_file:
         _file_mode(hinlang, args)
         return
 
-    # Get text from args or stdin
-    if args.text:
-        text = ' '.join(args.text)
-    elif not sys.stdin.isatty():
-        text = sys.stdin.read().strip()
-    else:
-        parser.print_help()
+    # Stream stdin when no text is given
+    if not args.text:
+        if sys.stdin.isatty():
+            parser.print_help()
+            return
+        _stream(hinlang, args, sys.stdin, sys.stdout)
         return
 
+    text = ' '.join(args.text)
+
     # Convert
-    if args.force_hindi:
-        result = hinlang.to_hindi(text)
-    elif args.force_roman:
-        result = hinlang.to_roman(text)
-    else:
-        result = hinlang.convert(text)
+    result = None
+    if args.socket:
+        result = _daemon_convert(args.socket, _text_op(args.force_hindi, args.force_roman),
+                                 text, required=args.client)
+    if result is None:
+        if args.force_hindi:
+            result = hinlang.to_hindi(text)
+        elif args.force_roman:
+            result = hinlang.to_roman(text)
+        else:
+            result = hinlang.convert(text)
 
     # Output
     if args.output_file:
@@ -117,6 +232,103 @@ def main():
         print(result)
 
 
+# ── Daemon ──
+
+# Options the fast path understands; anything else goes through argparse
+_FAST_OPTIONS = {"--to-hindi": "hindi", "-H": "hindi", "--to-roman": "roman", "-R": "roman"}
+
+# Seconds to wait for the daemon before converting locally instead
+_DAEMON_TIMEOUT = 1.0
+
+
+def _text_op(force_hindi, force_roman):
+    """Daemon operation for the direction options."""
+    if force_hindi:
+        return "hindi"
+    if force_roman:
+        return "roman"
+    return "convert"
+
+
+def _daemon_fast_path(argv):
+    """
+    Answer ``hinlangpy [-H|-R] [--client] [--socket PATH] TEXT...``
+    through the daemon without importing argparse or building engines.
+
+    Returns:
+        ``True`` if the request was answered; ``False`` to run the full
+        CLI (which falls back to converting locally).
+    """
+    path = os.environ.get("HINLANG_SOCKET")
+    force_hindi = force_roman = required = False
+    words = []
+    argv = iter(argv)
+    for arg in argv:
+        if arg in _FAST_OPTIONS:
+            force_hindi |= _FAST_OPTIONS[arg] == "hindi"
+            force_roman |= _FAST_OPTIONS[arg] == "roman"
+        elif arg == "--client":
+            required = True
+        elif arg == "--socket":
+            path = next(argv, None)
+        elif arg.startswith("-"):
+            return False
+        else:
+            words.append(arg)
+    if not path or not words or (force_hindi and force_roman):
+        return False
+
+    result = _daemon_convert(path, _text_op(force_hindi, force_roman), ' '.join(words),
+                             required=required)
+    if result is None:
+        return False
+    print(result)
+    return True
+
+
+def _daemon_convert(path, op, text, required=False):
+    """
+    Convert ``text`` through the daemon on ``path``.
+
+    Returns ``None`` when no daemon answers within ``_DAEMON_TIMEOUT``
+    seconds or the request fails, unless ``required``, in which case the
+    error is reported and the CLI exits.
+    """
+    from hinlang.client import Client
+
+    try:
+        with Client(path, timeout=_DAEMON_TIMEOUT) as client:
+            return client.request(op, text)
+    except (OSError, ValueError) as exc:
+        if required:
+            print(f"Error: no hinlangpy daemon on {path}: {exc}", file=sys.stderr)
+            sys.exit(1)
+        return None
+
+
+def _serve_mode(args):
+    """Run the daemon until interrupted."""
+    from hinlang.daemon import serve
+
+    def ready(server):
+        print(f"Serving on {args.socket} (pid {os.getpid()})", file=sys.stderr)
+
+    try:
+        serve(args.socket, ready)
+    except OSError as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        sys.exit(1)
+
+
+def _print_stats(hinlang):
+    """Print the module-level engines' counters to stderr."""
+    from hinlang.counters import format_stats
+
+    for name, stats in hinlang.stats().items():
+        if stats is not None:
+            print(format_stats(name, stats), file=sys.stderr)
+
+
 def _interactive_mode(hinlang):
     """Interactive REPL mode."""
     print("=" * 55)
@@ -175,29 +387,207 @@ def _interactive_mode(hinlang):
 
 
 def _file_mode(hinlang, args):
-    """File translation mode."""
+    """File translation mode (streamed, constant memory)."""
+    if args.jobs != 1:
+        _parallel_file_mode(hinlang, args)
+        return
+
     try:
-        with open(args.input_file, 'r', encoding='utf-8') as f:
-            content = f.read()
+        src = open(args.input_file, 'r', encoding='utf-8', newline='')
     except FileNotFoundError:
         print(f"Error: File not found: {args.input_file}", file=sys.stderr)
         sys.exit(1)
 
-    # Convert
+    with src:
+        if args.output_file:
+            with open(args.output_file, 'w', encoding='utf-8', newline='') as dst:
+                _stream(hinlang, args, src, dst)
+            print(f"Translated: {args.input_file} → {args.output_file}")
+        else:
+            _stream(hinlang, args, src, sys.stdout)
+
+
+def _parallel_file_mode(hinlang, args):
+    """Convert one large file with ``--jobs`` worker processes."""
+    import time
+    from hinlang.parallel import map_file
+
+    if not os.path.isfile(args.input_file):
+        print(f"Error: File not found: {args.input_file}", file=sys.stderr)
+        sys.exit(1)
+
+    jobs = args.jobs or os.cpu_count() or 1
+    start = time.perf_counter()
+    if args.output_file:
+        with open(args.output_file, 'wb') as dst:
+            size = map_file(_engines(hinlang, args), args.input_file, dst.write, jobs)
+    else:
+        sys.stdout.flush()
+        size = map_file(_engines(hinlang, args), args.input_file, sys.stdout.buffer.write, jobs)
+        sys.stdout.buffer.flush()
+    elapsed = time.perf_counter() - start
+
+    mb = size / 1e6
+    print(f"Converted {mb:.1f} MB in {elapsed:.2f} s "
+          f"({mb / elapsed if elapsed else 0:.1f} MB/s, {jobs} jobs)", file=sys.stderr)
+
+
+def _dir_mode(hinlang, args):
+    """Convert a directory tree of files with a worker pool."""
+    import time
+    from pathlib import Path
+    from hinlang.parallel import map_files
+
+    src_root = Path(args.input_dir)
+    dst_root = Path(args.output_dir)
+    if not src_root.is_dir():
+        print(f"Error: Directory not found: {args.input_dir}", file=sys.stderr)
+        sys.exit(1)
+
+    # Skip earlier results when the output directory is inside the input
+    dst_resolved = dst_root.resolve()
+    pairs = [
+        (str(path), str(dst_root / path.relative_to(src_root)))
+        for path in sorted(src_root.rglob(args.glob))
+        if path.is_file() and dst_resolved not in path.resolve().parents
+    ]
+
+    jobs = args.jobs or os.cpu_count() or 1
+    start = time.perf_counter()
+    files = failed = read = written = 0
+    for src, n_read, n_written, error in map_files(_engines(hinlang, args), pairs, jobs):
+        if error is None:
+            files += 1
+            read += n_read
+            written += n_written
+        else:
+            failed += 1
+            print(f"Error: {src}: {error}", file=sys.stderr)
+    elapsed = time.perf_counter() - start
+
+    mb = read / 1e6
+    print(f"Converted {files} files ({mb:.1f} MB → {written / 1e6:.1f} MB) in {elapsed:.2f} s: "
+          f"{files / elapsed if elapsed else 0:.0f} files/s, "
+          f"{mb / elapsed if elapsed else 0:.1f} MB/s, {jobs} jobs"
+          + (f"; {failed} failed" if failed else ""), file=sys.stderr)
+    if failed:
+        sys.exit(1)
+
+
+# File extensions --fields recognises when --format is not given
+_RECORD_FORMATS = {".jsonl": "jsonl", ".ndjson": "jsonl", ".csv": "csv", ".tsv": "tsv"}
+
+
+def _record_format(path):
+    """Record format implied by the extension of ``path``, or ``None``."""
+    if not path:
+        return None
+    return _RECORD_FORMATS.get(os.path.splitext(path)[1].lower())
+
+
+def _records_mode(args):
+    """Convert selected fields of JSONL/CSV/TSV records, streaming."""
+    from hinlang.records import transliterate_csv, transliterate_jsonl
+
+    fields = [field.strip() for field in args.fields.split(",") if field.strip()]
     if args.force_hindi:
-        result = hinlang.to_hindi(content)
+        direction = "hindi"
     elif args.force_roman:
-        result = hinlang.to_roman(content)
+        direction = "roman"
     else:
-        result = hinlang.convert(content)
+        direction = "auto"
 
-    # Output
-    if args.output_file:
-        with open(args.output_file, 'w', encoding='utf-8') as f:
-            f.write(result)
-        print(f"Translated: {args.input_file} → {args.output_file}")
+    def convert(src, dst):
+        if args.record_format == "jsonl":
+            transliterate_jsonl(src, dst, fields, direction)
+        else:
+            delimiter = "\t" if args.record_format == "tsv" else ","
+            transliterate_csv(src, dst, fields, direction, delimiter, args.header)
+
+    def convert_to_output(src):
+        if args.output_file:
+            with open(args.output_file, 'w', encoding='utf-8', newline='') as dst:
+                convert(src, dst)
+        else:
+            convert(src, sys.stdout)
+
+    try:
+        if args.input_file:
+            try:
+                src = open(args.input_file, 'r', encoding='utf-8', newline='')
+            except FileNotFoundError:
+                print(f"Error: File not found: {args.input_file}", file=sys.stderr)
+                sys.exit(1)
+            with src:
+                convert_to_output(src)
+        else:
+            convert_to_output(sys.stdin)
+    except ValueError as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        sys.exit(1)
+
+
+def _engines(hinlang, args):
+    """``(roman_to_hindi, hindi_to_roman)`` for the chosen direction."""
+    if args.force_hindi:
+        return hinlang._get_r2h(), None
+    if args.force_roman:
+        return None, hinlang._get_h2r()
+    return hinlang._get_r2h(), hinlang._get_h2r()
+
+
+def _stream(hinlang, args, src, dst):
+    """
+    Convert ``src`` into ``dst`` chunk by chunk, preserving whitespace.
+
+    With ``--to-hindi``/``--to-roman`` the whole input goes through one
+    engine. Otherwise the direction is detected line by line, so mixed
+    logs convert each line the way ``hinlang.convert`` would. Memory
+    stays bounded even for a single huge line: a line is read in pieces
+    of ``CHUNK_SIZE`` characters and its direction is fixed by the first.
+    """
+    from hinlang.stream import CHUNK_SIZE
+
+    if args.force_hindi:
+        engine = hinlang._get_r2h()
+    elif args.force_roman:
+        engine = hinlang._get_h2r()
     else:
-        print(result)
+        engine = None
+
+    if engine is not None and not args.line_buffered:
+        engine.transliterate_to(src, dst)
+        return
+
+    from hinlang.detector import detect_script
+
+    readline = src.readline
+    write = dst.write
+    while True:
+        first = readline(CHUNK_SIZE)
+        if not first:
+            break
+        line_engine = engine
+        if line_engine is None:
+            if detect_script(first) == "devanagari":
+                line_engine = hinlang._get_h2r()
+            else:
+                line_engine = hinlang._get_r2h()
+        for piece in line_engine.transliterate_iter(_line_pieces(readline, first, CHUNK_SIZE)):
+            write(piece)
+        if args.line_buffered:
+            dst.flush()
+
+
+def _line_pieces(readline, first, size):
+    """Yield ``first`` and the rest of its line, ``size`` characters at a time."""
+    piece = first
+    yield piece
+    while not piece.endswith('\n'):
+        piece = readline(size)
+        if not piece:
+            return
+        yield piece
 
 
 if __name__ == "__main__":
@@ -0,0 +1,176 @@
+"""
+hinlang.client
+===============
+
+Client side of the conversion daemon (see :mod:`hinlang.daemon`).
+
+Starting Python, importing the package and building the engines costs
+tens of milliseconds, while converting a short message takes
+microseconds. A daemon pays the start-up once; a :class:`Client` keeps
+one connection to it open and sends any number of requests over it.
+
+This module imports only ``os``, which Python's ``site`` start-up has
+already loaded, and the built-in ``_socket``, so a short-lived process
+that only forwards one request (``hinlangpy`` with ``$HINLANG_SOCKET``
+set) starts as fast as Python itself allows.
+
+Protocol
+--------
+
+Every request and response is an ASCII header line followed by a UTF-8
+payload of exactly the announced number of bytes::
+
+    <op> <length>\\n<payload>         op: hindi | roman | convert
+    ok <length>\\n<payload>           the converted text
+    error <length>\\n<message>        the request was not understood or failed
+
+``hindi``, ``roman`` and ``convert`` behave like :func:`hinlang.to_hindi`,
+:func:`hinlang.to_roman` and :func:`hinlang.convert`. A connection may
+carry any number of requests; the server answers them in order. The
+framing is simple enough for shell tools, e.g.::
+
+    printf 'hindi 7\\nnamaste' | nc -U -q1 /tmp/hinlang.sock
+
+Usage::
+
+    from hinlang.client import Client
+
+    with Client("/tmp/hinlang.sock") as client:
+        client.to_hindi("Namaste dosto")    # 'नमस्ते दोस्तो'
+"""
+
+import os
+import _socket
+
+# Operations a request may name
+OPS = ("hindi", "roman", "convert")
+
+# Payloads larger than this are refused
+MAX_PAYLOAD_BYTES = 1 << 26
+
+# Longest header line accepted, newline included
+MAX_HEADER_BYTES = 64
+
+_RECV_SIZE = 1 << 16
+
+
+def default_socket_path():
+    """``$HINLANG_SOCKET``, or ``None`` if it is not set."""
+    return os.environ.get("HINLANG_SOCKET") or None
+
+
+def frame(head: bytes, payload: bytes) -> bytes:
+    """Encode one ``<head> <length>\\n<payload>`` frame."""
+    return b"%s %d\n%s" % (head, len(payload), payload)
+
+
+def parse_header(line: bytes):
+    """
+    Split a header line into ``(word, payload_length)``.
+
+    Raises:
+        ValueError: If the line is malformed or announces too large a
+            payload.
+    """
+    word, _, length = line.rstrip(b"\n").partition(b" ")
+    if not line.endswith(b"\n") or not word or not length.isdigit():
+        raise ValueError("malformed header %r" % (line,))
+    length = int(length)
+    if length > MAX_PAYLOAD_BYTES:
+        raise ValueError("payload of %d bytes exceeds %d" % (length, MAX_PAYLOAD_BYTES))
+    return word.decode("ascii", "replace"), length
+
+
+class Client:
+    """
+    A persistent connection to a conversion daemon.
+
+    Args:
+        path: Socket file path (default: ``$HINLANG_SOCKET``).
+        timeout: Socket timeout in seconds, or ``None`` to wait forever.
+
+    Raises:
+        ValueError: If no path is given and ``$HINLANG_SOCKET`` is unset.
+        OSError: If no daemon listens on ``path``.
+
+    Example::
+
+        >>> with Client("/tmp/hinlang.sock") as client:
+        ...     client.convert("Kya haal hai")
+        'क्या हाल है'
+    """
+
+    def __init__(self, path=None, timeout=None):
+        path = path or default_socket_path()
+        if not path:
+            raise ValueError("no socket path given and $HINLANG_SOCKET is not set")
+        sock = _socket.socket(_socket.AF_UNIX, _socket.SOCK_STREAM)
+        try:
+            sock.settimeout(timeout)
+            sock.connect(path)
+        except OSError:
+            sock.close()
+            raise
+        self._sock = sock
+        self._buffer = b""
+
+    def _recv(self):
+        data = self._sock.recv(_RECV_SIZE)
+        if not data:
+            raise ConnectionError("server closed the connection")
+        return data
+
+    def _read_frame(self):
+        buffer = self._buffer
+        end = buffer.find(b"\n")
+        while end < 0:
+            if len(buffer) >= MAX_HEADER_BYTES:
+                raise ValueError("malformed header %r" % (buffer[:MAX_HEADER_BYTES],))
+            buffer += self._recv()
+            end = buffer.find(b"\n")
+        word, length = parse_header(buffer[:end + 1])
+
+        parts = [buffer[end + 1:]]
+        received = len(parts[0])
+        while received < length:
+            data = self._recv()
+            parts.append(data)
+            received += len(data)
+        data = b"".join(parts)
+        self._buffer = data[length:]
+        return word, data[:length]
+
+    def request(self, op: str, text: str) -> str:
+        """
+        Send one request and return the converted text.
+
+        Raises:
+            ValueError: If the server rejects the request.
+            OSError: If the connection fails.
+        """
+        self._sock.sendall(frame(op.encode("ascii"), text.encode("utf-8")))
+        status, payload = self._read_frame()
+        if status != "ok":
+            raise ValueError(payload.decode("utf-8", "replace"))
+        return payload.decode("utf-8")
+
+    def to_hindi(self, text: str) -> str:
+        """Like :func:`hinlang.to_hindi`, converted by the daemon."""
+        return self.request("hindi", text)
+
+    def to_roman(self, text: str) -> str:
+        """Like :func:`hinlang.to_roman`, converted by the daemon."""
+        return self.request("roman", text)
+
+    def convert(self, text: str) -> str:
+        """Like :func:`hinlang.convert`, converted by the daemon."""
+        return self.request("convert", text)
+
+    def close(self):
+        self._sock.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
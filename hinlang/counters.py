@@ -0,0 +1,221 @@
+"""
+hinlang.counters
+=================
+
+Opt-in runtime counters for the transliteration engines.
+
+``engine.enable_stats()`` installs counting versions of the engine's
+word-conversion methods and a timing proxy around its tokenizer (and
+the tokenizer's compiled pattern) as instance attributes, and
+``engine.enable_stats(False)`` removes them again. A disabled engine
+therefore runs exactly the same code as one that never had stats: the
+overhead is paid only while counting.
+
+Counters are per process and not locked: under heavy multi-threaded
+use they are a close approximation. Process-pool workers count in their
+own processes and do not report back.
+
+Usage::
+
+    converter = RomanToHindi(cache_size=4096)
+    converter.enable_stats()
+    converter.transliterate("Namaste dosto, kya haal hai")
+    converter.stats().dictionary_hits   # 4 ("haal" takes the character rules)
+"""
+
+from collections import namedtuple
+from time import perf_counter
+
+Stats = namedtuple("Stats", [
+    "tokens", "words", "characters",
+    "dictionary_hits", "special_hits", "cache_hits",
+    "lexicon_hits", "inflected_words", "character_words",
+    "tokenize_seconds", "convert_seconds", "character_seconds",
+])
+Stats.__doc__ = """\
+Snapshot of an engine's counters, returned by ``engine.stats()``.
+
+``tokens`` counts tokens matched by the tokenizer, in every conversion
+path (batch conversion tokenizes each distinct whitespace-separated
+token once); ``words`` counts word conversions (batch conversion
+converts each distinct word once) and ``characters`` their length.
+Every converted word is counted in exactly one of ``dictionary_hits``
+(built-in or custom words), ``special_hits``, ``cache_hits``,
+``lexicon_hits``, ``inflected_words`` (stem + suffix) and
+``character_words`` (character rules). ``convert_seconds`` is the
+total time spent converting words, ``character_seconds`` the part of it
+spent in the character rules.
+"""
+
+
+class StatsRecorder:
+    """Mutable counters behind one engine's :class:`Stats`."""
+
+    __slots__ = (
+        "tokens", "words", "characters",
+        "dictionary_hits", "special_hits", "cache_hits",
+        "unknown_words", "inflected_words", "character_words",
+        "tokenize_seconds", "convert_seconds", "character_seconds",
+    )
+
+    def __init__(self):
+        for name in self.__slots__:
+            setattr(self, name, 0)
+        self.tokenize_seconds = self.convert_seconds = self.character_seconds = 0.0
+
+    def snapshot(self) -> Stats:
+        """Return the current counters as a :class:`Stats`."""
+        return Stats(
+            self.tokens, self.words, self.characters,
+            self.dictionary_hits, self.special_hits, self.cache_hits,
+            self.unknown_words - self.inflected_words - self.character_words,
+            self.inflected_words, self.character_words,
+            self.tokenize_seconds, self.convert_seconds, self.character_seconds,
+        )
+
+
+class _TimedPattern:
+    # Stands in for the tokenizer's compiled pattern, which the batch,
+    # streaming and asyncio paths use directly
+
+    def __init__(self, pattern, stats):
+        self._pattern = pattern
+        self._stats = stats
+
+    def __getattr__(self, name):
+        return getattr(self._pattern, name)
+
+    def match(self, string, *args):
+        stats = self._stats
+        start = perf_counter()
+        match = self._pattern.match(string, *args)
+        stats.tokenize_seconds += perf_counter() - start
+        if match is not None:
+            stats.tokens += 1
+        return match
+
+    def sub(self, repl, string, count=0):
+        stats = self._stats
+
+        def counted_repl(match):
+            stats.tokens += 1
+            return repl(match)
+
+        # Scanning and converting interleave; the conversions time themselves
+        start = perf_counter()
+        converting = stats.convert_seconds
+        result = self._pattern.sub(counted_repl, string, count)
+        stats.tokenize_seconds += perf_counter() - start - (stats.convert_seconds - converting)
+        return result
+
+    def finditer(self, string, *args):
+        stats = self._stats
+        matches = self._pattern.finditer(string, *args)
+        while True:
+            start = perf_counter()
+            match = next(matches, None)
+            stats.tokenize_seconds += perf_counter() - start
+            if match is None:
+                return
+            stats.tokens += 1
+            yield match
+
+
+class _TimedTokenizer:
+    # Stands in for an engine's shared tokenizer while stats are enabled
+
+    def __init__(self, tokenizer, stats):
+        self._tokenizer = tokenizer
+        self._stats = stats
+        self.pattern = _TimedPattern(tokenizer.pattern, stats)
+
+    def tokenize(self, text):
+        stats = self._stats
+        start = perf_counter()
+        tokens = self._tokenizer.tokenize(text)
+        stats.tokenize_seconds += perf_counter() - start
+        stats.tokens += len(tokens)
+        return tokens
+
+
+# Engine methods replaced by counting versions while stats are enabled
+_INSTRUMENTED = ("_tokenizer", "_convert_word", "_convert_unknown",
+                 "_convert_inflected", "_convert_chars")
+
+
+def instrument(engine, classify):
+    """
+    Start counting on ``engine`` and return its :class:`StatsRecorder`.
+
+    Args:
+        engine: A ``RomanToHindi`` or ``HindiToRoman`` instance.
+        classify: ``classify(word)`` returns the name of the counter a
+            word lookup hits before the out-of-dictionary path
+            (``"dictionary_hits"``, ``"special_hits"`` or
+            ``"cache_hits"``), or ``None``.
+    """
+    stats = StatsRecorder()
+    cls = type(engine)
+    convert_word = cls._convert_word.__get__(engine)
+    convert_unknown = cls._convert_unknown.__get__(engine)
+    convert_chars = cls._convert_chars.__get__(engine)
+
+    def counted_convert_word(word):
+        start = perf_counter()
+        hit = classify(word)
+        if hit is not None:
+            setattr(stats, hit, getattr(stats, hit) + 1)
+        converted = convert_word(word)
+        stats.convert_seconds += perf_counter() - start
+        stats.words += 1
+        stats.characters += len(word)
+        return converted
+
+    def counted_convert_unknown(word):
+        stats.unknown_words += 1
+        return convert_unknown(word)
+
+    def counted_convert_chars(word):
+        start = perf_counter()
+        converted = convert_chars(word)
+        stats.character_seconds += perf_counter() - start
+        stats.character_words += 1
+        return converted
+
+    engine._tokenizer = _TimedTokenizer(cls._tokenizer, stats)
+    engine._convert_word = counted_convert_word
+    engine._convert_unknown = counted_convert_unknown
+    engine._convert_chars = counted_convert_chars
+
+    convert_inflected = getattr(cls, "_convert_inflected", None)
+    if convert_inflected is not None:
+        convert_inflected = convert_inflected.__get__(engine)
+
+        def counted_convert_inflected(word):
+            converted = convert_inflected(word)
+            if converted is not None:
+                stats.inflected_words += 1
+            return converted
+
+        engine._convert_inflected = counted_convert_inflected
+    return stats
+
+
+def uninstrument(engine):
+    """Remove the counting methods :func:`instrument` installed."""
+    for name in _INSTRUMENTED:
+        engine.__dict__.pop(name, None)
+
+
+def format_stats(name, stats: Stats) -> str:
+    """One human-readable line for ``stats``, as printed by ``hinlangpy --stats``."""
+    return (
+        "%s: %d tokens, %d words (%d chars): %d dictionary, %d special, "
+        "%d cache, %d lexicon, %d inflected, %d character; "
+        "tokenize %.3f s, convert %.3f s (character %.3f s)" % (
+            name, stats.tokens, stats.words, stats.characters,
+            stats.dictionary_hits, stats.special_hits, stats.cache_hits,
+            stats.lexicon_hits, stats.inflected_words, stats.character_words,
+            stats.tokenize_seconds, stats.convert_seconds, stats.character_seconds,
+        )
+    )
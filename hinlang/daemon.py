@@ -0,0 +1,157 @@
+"""
+hinlang.daemon
+===============
+
+A resident conversion server on a Unix domain socket.
+
+The server builds both engines once and answers requests from any
+number of :class:`~hinlang.client.Client` connections (the protocol is
+described in :mod:`hinlang.client`). Every connection is served by its
+own thread; all of them share the module-level engines and their word
+caches, which is safe because engines never lock on reads (see
+:mod:`hinlang.parallel`).
+
+The socket file is created readable and writable by its owner only, and
+removed again when the server stops.
+
+Usage::
+
+    hinlangpy --serve --socket /tmp/hinlang.sock &
+    export HINLANG_SOCKET=/tmp/hinlang.sock
+    hinlangpy "Namaste dosto"        # answered by the daemon
+"""
+
+import os
+import socket
+import socketserver
+
+from hinlang import _get_h2r, _get_r2h, convert, to_hindi, to_roman
+from hinlang.client import MAX_HEADER_BYTES, frame, parse_header
+
+_FUNCTIONS = {
+    "hindi": to_hindi,
+    "roman": to_roman,
+    "convert": convert,
+}
+
+
+class _Handler(socketserver.StreamRequestHandler):
+
+    def handle(self):
+        readline = self.rfile.readline
+        read = self.rfile.read
+        write = self.wfile.write
+        while True:
+            line = readline(MAX_HEADER_BYTES)
+            if not line:
+                return
+            try:
+                op, length = parse_header(line)
+            except ValueError as exc:
+                # The stream can't be re-synchronised; report and hang up
+                write(frame(b"error", str(exc).encode("utf-8")))
+                return
+            payload = read(length)
+            if len(payload) < length:
+                return
+
+            function = _FUNCTIONS.get(op)
+            if function is None:
+                write(frame(b"error", ("unknown op %r" % (op,)).encode("utf-8")))
+                continue
+            try:
+                text = payload.decode("utf-8")
+            except UnicodeDecodeError as exc:
+                write(frame(b"error", str(exc).encode("utf-8")))
+                continue
+            try:
+                result = function(text)
+            except Exception as exc:
+                # A failed conversion must not drop the connection
+                write(frame(b"error", ("%s: %s" % (type(exc).__name__, exc)).encode("utf-8")))
+                continue
+            write(frame(b"ok", result.encode("utf-8")))
+
+
+class Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """
+    Threaded Unix socket server with warm engines.
+
+    Args:
+        path: Socket file path. A stale socket left by a crashed server
+            is replaced.
+
+    Raises:
+        OSError: If another server already listens on ``path``.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, path):
+        # Warm both engines before accepting the first request
+        _get_r2h()
+        _get_h2r()
+        _remove_stale_socket(path)
+        umask = os.umask(0o177)
+        try:
+            super().__init__(path, _Handler)
+        finally:
+            os.umask(umask)
+
+    def server_close(self):
+        super().server_close()
+        try:
+            os.remove(self.server_address)
+        except OSError:
+            pass
+
+
+def _remove_stale_socket(path):
+    """Remove ``path`` if it is a socket nobody listens on."""
+    if not os.path.exists(path):
+        return
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(path)
+    except ConnectionRefusedError:
+        os.remove(path)
+        return
+    except OSError:
+        return    # not a socket: let bind() report it
+    finally:
+        probe.close()
+    raise OSError("a server is already listening on %s" % path)
+
+
+def serve(path, ready=None):
+    """
+    Serve conversions on the Unix socket ``path`` until interrupted.
+
+    ``SIGTERM`` and ``Ctrl+C`` stop the server cleanly, removing the
+    socket file.
+
+    Args:
+        path: Socket file path.
+        ready: Optional callable invoked with the :class:`Server` once
+            it accepts connections.
+
+    Raises:
+        OSError: If another server already listens on ``path``.
+    """
+    import signal
+    import sys
+
+    with Server(path) as server:
+        try:
+            previous = signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+        except ValueError:
+            previous = None     # not the main thread
+        try:
+            if ready is not None:
+                ready(server)
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            if previous is not None:
+                signal.signal(signal.SIGTERM, previous)
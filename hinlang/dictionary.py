@@ -7,7 +7,8 @@ Contains 500+ commonly used Hindi words for accurate transliteration.
 
 The forward dict (ROMAN_TO_HINDI) is the source of truth.
 The reverse dict (HINDI_TO_ROMAN) is auto-generated from it,
-with manual overrides for preferred spellings.
+with manual overrides for preferred spellings. It is built on first
+use (see :func:`hindi_to_roman`), not at import time.
 """
 
 # ════════════════════════════════════════════════
@@ -271,10 +272,6 @@ ROMAN_TO_HINDI = {
 #  HINDI → ROMAN  (auto-generated + overrides)
 # ════════════════════════════════════════════════
 
-# Auto-build reverse dictionary (prefer first occurrence for duplicates)
-_seen_hindi = set()
-HINDI_TO_ROMAN = {}
-
 # Manual overrides — preferred romanizations for ambiguous Devanagari
 _HINDI_TO_ROMAN_OVERRIDES = {
     'मैं':    'main',
@@ -299,14 +296,34 @@ _HINDI_TO_ROMAN_OVERRIDES = {
     'श्री':   'shri',
 }
 
-# Build from forward dict
-for roman, hindi in ROMAN_TO_HINDI.items():
-    if hindi not in _seen_hindi:
-        HINDI_TO_ROMAN[hindi] = roman
-        _seen_hindi.add(hindi)
+_hindi_to_roman = None
+
+
+def hindi_to_roman() -> dict:
+    """
+    Return the Devanagari → Roman dictionary, building it on first call.
+
+    The reverse of ``ROMAN_TO_HINDI`` (the first Roman spelling wins for
+    duplicate Devanagari words), with ``_HINDI_TO_ROMAN_OVERRIDES``
+    applied on top. Also available as ``dictionary.HINDI_TO_ROMAN``.
+    """
+    global _hindi_to_roman
+    if _hindi_to_roman is None:
+        # Prefer first occurrence for duplicates
+        table = {}
+        for roman, hindi in ROMAN_TO_HINDI.items():
+            if hindi not in table:
+                table[hindi] = roman
+        table.update(_HINDI_TO_ROMAN_OVERRIDES)
+        _hindi_to_roman = table
+    return _hindi_to_roman
+
+
+def __getattr__(name):
+    if name == "HINDI_TO_ROMAN":
+        return hindi_to_roman()
+    raise AttributeError("module 'hinlang.dictionary' has no attribute %r" % (name,))
 
-# Apply overrides
-HINDI_TO_ROMAN.update(_HINDI_TO_ROMAN_OVERRIDES)
 
 # ── Special words ──
 SPECIALS = {
@@ -0,0 +1,86 @@
+"""
+hinlang.fused
+==============
+
+Single-pass detect-and-convert for :func:`hinlang.convert`.
+
+Pure-ASCII text cannot contain Devanagari, so it goes straight to the
+Roman → Devanagari engine with no detection at all. Other messages are
+tokenized once, speculatively, for the engine matching the script of
+their first letter. The script statistics are summed from the token
+cores (every letter lives in a core, whichever tokenizer produced it)
+using per-word letter counts memoized across calls. If the guess holds,
+the tokens are converted as they are; otherwise the text is handed to
+the other engine, exactly as a separate detection pass would have sent
+it.
+
+Inputs longer than :data:`SPECULATE_MAX_CHARS` are detected first and
+then converted, so no large token list is built and thrown away.
+"""
+
+import re
+
+from hinlang.detector import _DEVANAGARI_LETTER, _count_letters, _label, detect_script
+
+# Longest input tokenized speculatively before the direction is known
+SPECULATE_MAX_CHARS = 1 << 14
+
+# Per-word letter counts kept before the memo is reset
+_COUNTS_MAXSIZE = 1 << 16
+
+_counts = {}   # core word -> (ASCII letters, Devanagari letters)
+
+_FIRST_LETTER = re.compile('[A-Za-z]|' + _DEVANAGARI_LETTER.pattern)
+
+
+def convert_fused(get_r2h, get_h2r, text: str) -> str:
+    """
+    Convert ``text`` in the direction :func:`~hinlang.detect_script` picks.
+
+    The result is identical to::
+
+        get_h2r().transliterate(text) if detect_script(text) == "devanagari"
+        else get_r2h().transliterate(text)
+
+    Args:
+        get_r2h: Callable returning the ``RomanToHindi`` engine.
+        get_h2r: Callable returning the ``HindiToRoman`` engine. Neither
+            is called unless its engine is needed, so Roman-only callers
+            never build the Devanagari → Roman engine.
+        text: Input text in either script.
+
+    Returns:
+        Converted text.
+    """
+    if not text:
+        return ""
+    if text.isascii():
+        return get_r2h().transliterate(text)
+    if len(text) > SPECULATE_MAX_CHARS:
+        if detect_script(text) == "devanagari":
+            return get_h2r().transliterate(text)
+        return get_r2h().transliterate(text)
+
+    first = _FIRST_LETTER.search(text)
+    if first is None:
+        # No letters: detected as "empty", which converts to Devanagari
+        return get_r2h().transliterate(text)
+    guess = get_r2h() if first.group().isascii() else get_h2r()
+    tokens = guess._tokenizer.tokenize(text)
+
+    counts = _counts
+    roman = devanagari = 0
+    for _, core, _ in tokens:
+        if core:
+            letters = counts.get(core)
+            if letters is None:
+                if len(counts) >= _COUNTS_MAXSIZE:
+                    counts.clear()
+                letters = counts[core] = _count_letters(core)
+            roman += letters[0]
+            devanagari += letters[1]
+
+    engine = get_h2r() if _label(roman, devanagari) == "devanagari" else get_r2h()
+    if engine is guess:
+        return ' '.join(engine._convert_tokens(tokens))
+    return engine.transliterate(text)
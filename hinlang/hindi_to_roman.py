@@ -13,7 +13,104 @@ Usage::
     # namaste dosto
 """
 
-from hinlang.dictionary import HINDI_TO_ROMAN
+import threading
+
+from hinlang.batch import transliterate_deduped
+from hinlang.cache import WordCache
+from hinlang.dictionary import hindi_to_roman
+from hinlang.stream import iter_transliterate, read_chunks
+from hinlang.tokenizer import DEVANAGARI_TOKENIZER
+
+
+# ════════════════════════════════════════════════
+#  CHARACTER TABLES  (shared, built once per process)
+# ════════════════════════════════════════════════
+
+_VOWEL_MAP = {
+    'अ': 'a',   'आ': 'aa',  'इ': 'i',   'ई': 'ee',
+    'उ': 'u',   'ऊ': 'oo',  'ए': 'e',   'ऐ': 'ai',
+    'ओ': 'o',   'औ': 'au',  'ऋ': 'ri',  'ॠ': 'ri',
+    'ऑ': 'o',
+}
+
+_MATRA_MAP = {
+    'ा': 'aa',  'ि': 'i',   'ी': 'ee',  'ु': 'u',
+    'ू': 'oo',  'े': 'e',   'ै': 'ai',  'ो': 'o',
+    'ौ': 'au',  'ृ': 'ri',  'ॉ': 'o',
+}
+
+_CONSONANT_MAP = {
+    'क': 'k',   'ख': 'kh',  'ग': 'g',   'घ': 'gh',  'ङ': 'ng',
+    'च': 'ch',  'छ': 'chh', 'ज': 'j',   'झ': 'jh',  'ञ': 'ny',
+    'ट': 't',   'ठ': 'th',  'ड': 'd',   'ढ': 'dh',  'ण': 'n',
+    'त': 't',   'थ': 'th',  'द': 'd',   'ध': 'dh',  'न': 'n',
+    'प': 'p',   'फ': 'ph',  'ब': 'b',   'भ': 'bh',  'म': 'm',
+    'य': 'y',   'र': 'r',   'ल': 'l',   'व': 'v',
+    'श': 'sh',  'ष': 'sh',  'स': 's',   'ह': 'h',
+    'क्ष': 'ksh', 'त्र': 'tr', 'ज्ञ': 'gya', 'श्र': 'shr',
+}
+
+_NUKTA_MAP = {
+    'क़': 'q',   'ख़': 'kh',  'ग़': 'gh',  'ज़': 'z',
+    'ड़': 'd',   'ढ़': 'dh',  'फ़': 'f',   'य़': 'y',
+}
+
+_SPECIAL_MAP = {
+    'ं': 'n',    'ँ': 'n',    'ः': 'h',
+    '्': '',     'ॐ': 'om',
+}
+
+_DIGIT_MAP = {
+    '०': '0', '१': '1', '२': '2', '३': '3', '४': '4',
+    '५': '5', '६': '6', '७': '7', '८': '8', '९': '9',
+}
+
+_PUNCT_MAP = {
+    '।': '.', '॥': '||',
+}
+
+# Per-character table for trailing punctuation (``str.translate``)
+_SUFFIX_TABLE = {ord(k): v for k, v in _PUNCT_MAP.items()}
+
+
+# ════════════════════════════════════════════════
+#  AKSHARA TABLE  (consonant + matra/virama clusters)
+# ════════════════════════════════════════════════
+
+_VIRAMA = '्'
+
+
+def _build_akshara_table():
+    # Every single character of the Devanagari block. Digits, punctuation
+    # and signs (bar the virama) win over letters; a nukta, or a matra or
+    # virama with no consonant before it, stands for itself.
+    table = {}
+    for cp in range(0x0900, 0x0980):
+        ch = chr(cp)
+        for source in (_DIGIT_MAP, _PUNCT_MAP, _SPECIAL_MAP, _CONSONANT_MAP, _VOWEL_MAP):
+            if ch in source and ch != _VIRAMA:
+                table[ch] = source[ch]
+                break
+        else:
+            table[ch] = ch
+
+    # Every consonant with a virama or a matra attached. Conjuncts such
+    # as क्ष are a consonant+virama cluster followed by a consonant.
+    for consonant, roman in _CONSONANT_MAP.items():
+        if len(consonant) == 1:
+            table[consonant + _VIRAMA] = roman
+            for matra, vowel in _MATRA_MAP.items():
+                table[consonant + matra] = roman + vowel
+    return table
+
+
+_AKSHARA_TABLE = _build_akshara_table()
+
+# Bare consonant followed by another Devanagari character: inherent 'a'
+_WITH_A = {
+    consonant: roman + 'a'
+    for consonant, roman in _CONSONANT_MAP.items() if len(consonant) == 1
+}
 
 
 class HindiToRoman:
@@ -24,6 +121,16 @@ class HindiToRoman:
       1. Dictionary lookup (500+ common words)
       2. Character-level Devanagari decomposition (for unknown words)
 
+    Args:
+        cache_size: Number of character-level conversions to memoize in
+            an LRU cache. ``0`` (default) disables the cache.
+
+    Thread safety:
+        One engine may be shared by any number of threads, including on
+        free-threaded Python. Conversions read an immutable snapshot of
+        the custom words without locking; ``add_word``/``add_words``
+        build a new snapshot and swap it in atomically.
+
     Example::
 
         converter = HindiToRoman()
@@ -31,53 +138,18 @@ class HindiToRoman:
         converter.transliterate("क्या हाल है")      # 'kya haal hai'
     """
 
-    def __init__(self):
-        # ── Character maps ──
-        self._vowel_map = {
-            'अ': 'a',   'आ': 'aa',  'इ': 'i',   'ई': 'ee',
-            'उ': 'u',   'ऊ': 'oo',  'ए': 'e',   'ऐ': 'ai',
-            'ओ': 'o',   'औ': 'au',  'ऋ': 'ri',  'ॠ': 'ri',
-            'ऑ': 'o',
-        }
-
-        self._matra_map = {
-            'ा': 'aa',  'ि': 'i',   'ी': 'ee',  'ु': 'u',
-            'ू': 'oo',  'े': 'e',   'ै': 'ai',  'ो': 'o',
-            'ौ': 'au',  'ृ': 'ri',  'ॉ': 'o',
-        }
-
-        self._consonant_map = {
-            'क': 'k',   'ख': 'kh',  'ग': 'g',   'घ': 'gh',  'ङ': 'ng',
-            'च': 'ch',  'छ': 'chh', 'ज': 'j',   'झ': 'jh',  'ञ': 'ny',
-            'ट': 't',   'ठ': 'th',  'ड': 'd',   'ढ': 'dh',  'ण': 'n',
-            'त': 't',   'थ': 'th',  'द': 'd',   'ध': 'dh',  'न': 'n',
-            'प': 'p',   'फ': 'ph',  'ब': 'b',   'भ': 'bh',  'म': 'm',
-            'य': 'y',   'र': 'r',   'ल': 'l',   'व': 'v',
-            'श': 'sh',  'ष': 'sh',  'स': 's',   'ह': 'h',
-            'क्ष': 'ksh', 'त्र': 'tr', 'ज्ञ': 'gya', 'श्र': 'shr',
-        }
-
-        self._nukta_map = {
-            'क़': 'q',   'ख़': 'kh',  'ग़': 'gh',  'ज़': 'z',
-            'ड़': 'd',   'ढ़': 'dh',  'फ़': 'f',   'य़': 'y',
-        }
-
-        self._special_map = {
-            'ं': 'n',    'ँ': 'n',    'ः': 'h',
-            '्': '',     'ॐ': 'om',
-        }
-
-        self._digit_map = {
-            '०': '0', '१': '1', '२': '2', '३': '3', '४': '4',
-            '५': '5', '६': '6', '७': '7', '८': '8', '९': '9',
-        }
-
-        self._punct_map = {
-            '।': '.', '॥': '||',
-        }
+    _suffix_table = _SUFFIX_TABLE
+    _tokenizer = DEVANAGARI_TOKENIZER
 
-        # Word dictionary
-        self._dictionary = dict(HINDI_TO_ROMAN)
+    def __init__(self, cache_size: int = 0):
+        # Word dictionary: shared read-only base (built by the first
+        # engine) + per-instance overlay
+        self._base = hindi_to_roman()
+        self._custom = {}
+        self._lexicons = ()
+        self._write_lock = threading.Lock()
+        self._cache = WordCache(cache_size) if cache_size else None
+        self._stats = None
 
     # ── Public API ──
 
@@ -93,7 +165,7 @@ class HindiToRoman:
 
             converter.add_word("ब्रह", "bruh")
         """
-        self._dictionary[hindi.strip()] = roman.lower().strip()
+        self._publish({hindi.strip(): roman.lower().strip()})
 
     def add_words(self, mapping: dict):
         """
@@ -106,8 +178,89 @@ class HindiToRoman:
 
             converter.add_words({"ब्रह": "bruh", "वाइब": "vibe"})
         """
-        for hindi, roman in mapping.items():
-            self._dictionary[hindi.strip()] = roman.lower().strip()
+        self._publish({
+            hindi.strip(): roman.lower().strip() for hindi, roman in mapping.items()
+        })
+
+    def open_lexicon(self, path):
+        """
+        Attach a memory-mapped lexicon (see :mod:`hinlang.lexicon`).
+
+        Lexicons are consulted, in the order they were opened, for words
+        that are neither custom words nor in the built-in dictionary;
+        hits are memoized in the word cache like any other conversion.
+        Process-pool workers reopen the same file and share its pages.
+
+        Args:
+            path: Lexicon file path, or an open ``Lexicon``.
+
+        Returns:
+            The attached ``Lexicon``.
+
+        Example::
+
+            converter.open_lexicon("names-hi.hlex")
+        """
+        from hinlang.lexicon import Lexicon
+
+        lexicon = path if isinstance(path, Lexicon) else Lexicon(path)
+        with self._write_lock:
+            self._lexicons = self._lexicons + (lexicon,)
+        if self._cache is not None:
+            self._cache.clear()
+        return lexicon
+
+    def cache_info(self):
+        """
+        Return word-cache statistics, or ``None`` if caching is disabled.
+
+        Example::
+
+            >>> HindiToRoman(cache_size=1024).cache_info()
+            CacheInfo(hits=0, misses=0, evictions=0, maxsize=1024, currsize=0)
+        """
+        if self._cache is None:
+            return None
+        return self._cache.info()
+
+    def cache_clear(self):
+        """Drop all memoized word conversions."""
+        if self._cache is not None:
+            self._cache.clear()
+
+    def enable_stats(self, enabled: bool = True):
+        """
+        Turn the runtime counters (see :mod:`hinlang.counters`) on or off.
+
+        Enabling starts from zero; enabling again keeps counting.
+        Disabled (the default) counting costs nothing.
+
+        Args:
+            enabled: ``True`` to start counting, ``False`` to stop and
+                discard the counters.
+        """
+        from hinlang.counters import instrument, uninstrument
+
+        if not enabled:
+            uninstrument(self)
+            self._stats = None
+        elif self._stats is None:
+            self._stats = instrument(self, self._classify_word)
+
+    def stats(self):
+        """
+        Return the runtime counters, or ``None`` if stats are disabled.
+
+        Example::
+
+            >>> converter.enable_stats()
+            >>> converter.transliterate("नमस्ते दोस्तो")
+            >>> converter.stats().dictionary_hits
+            2
+        """
+        if self._stats is None:
+            return None
+        return self._stats.snapshot()
 
     def transliterate(self, text: str) -> str:
         """
@@ -127,128 +280,195 @@ class HindiToRoman:
         if not text:
             return ""
 
-        words = text.split()
-        result = []
+        return ' '.join(self._convert_tokens(self._tokenizer.tokenize(text)))
 
-        for word in words:
-            prefix, core, suffix = self._strip_punctuation(word)
-            converted_suffix = ''.join(
-                self._punct_map.get(ch, ch) for ch in suffix
-            )
-            if core:
-                roman_word = self._convert_word(core)
-            else:
-                roman_word = ''
-            result.append(prefix + roman_word + converted_suffix)
+    def transliterate_batch(self, texts, workers: int = 1, chunksize: int = 1024,
+                            backend: str = "process", dedupe: bool = True) -> list:
+        """
+        Transliterate a list of strings.
+
+        Args:
+            texts: List of input strings.
+            workers: Number of workers. ``1`` (default) converts
+                in the calling process. With more, each worker process
+                gets its own copy of this engine (custom words included)
+                once; worker threads share this engine.
+            chunksize: Number of strings sent to a worker per task.
+            backend: ``"process"`` (default) or ``"thread"``. Threads
+                share this engine and scale on free-threaded Python.
+            dedupe: Convert each distinct word (and each distinct text)
+                only once per batch or chunk and share repeated output
+                strings. Output is the same either way.
+
+        Returns:
+            List of converted strings, in input order.
+
+        Example::
+
+            >>> converter.transliterate_batch(["नमस्ते", "क्या हाल है"])
+            ['namaste', 'kya haal hai']
+        """
+        if workers > 1:
+            from hinlang.parallel import map_batch
+            return map_batch(self, texts, workers, chunksize, backend, dedupe)
+        if dedupe:
+            return transliterate_deduped(self, texts)
+        transliterate = self.transliterate
+        return [transliterate(t) for t in texts]
+
+    def transliterate_iter(self, chunks):
+        """
+        Lazily transliterate an iterable of text chunks.
+
+        Whitespace (spaces, tabs, newlines) is preserved exactly, and a
+        word split across two chunks is converted as one word.
+
+        Args:
+            chunks: Iterable of strings, e.g. an open text file.
 
-        return ' '.join(result)
+        Yields:
+            Converted text pieces, in order.
+
+        Example::
+
+            >>> ''.join(converter.transliterate_iter(["नमस्ते\n  दोस्तो"]))
+            'namaste\n  dosto'
+        """
+        return iter_transliterate(self._tokenizer.pattern, self._sub_token, chunks)
+
+    def transliterate_to(self, source, writer) -> int:
+        """
+        Stream-transliterate ``source`` into ``writer``.
+
+        Args:
+            source: A string, a readable text file object, or an
+                iterable of strings.
+            writer: Object with a ``write(str)`` method.
+
+        Returns:
+            Number of characters written.
+        """
+        write = writer.write
+        written = 0
+        for piece in self.transliterate_iter(read_chunks(source)):
+            write(piece)
+            written += len(piece)
+        return written
+
+    # ── Pickling (used by process pools) ──
+
+    def __getstate__(self):
+        # Only the per-instance state travels; shared tables stay behind
+        cache = self._cache
+        return {
+            "cache_size": cache.maxsize if cache is not None else 0,
+            "custom": self._custom,
+            "lexicons": [lexicon.path for lexicon in self._lexicons],
+        }
+
+    def __setstate__(self, state):
+        self.__init__(cache_size=state["cache_size"])
+        self._custom = dict(state["custom"])
+        for path in state.get("lexicons", ()):
+            self.open_lexicon(path)
 
     # ── Internal ──
 
-    def _is_devanagari(self, ch):
-        cp = ord(ch)
-        return 0x0900 <= cp <= 0x097F
-
-    def _strip_punctuation(self, word):
-        prefix = ''
-        suffix = ''
-        while word and not (self._is_devanagari(word[0]) or word[0].isalnum()):
-            prefix += word[0]
-            word = word[1:]
-        while word and not (self._is_devanagari(word[-1]) or word[-1].isalnum()):
-            suffix = word[-1] + suffix
-            word = word[:-1]
-        return prefix, word, suffix
+    def _publish(self, entries):
+        # Copy-on-write: readers always see a complete snapshot of the
+        # custom words, and the swap itself is a single attribute store.
+        with self._write_lock:
+            snapshot = dict(self._custom)
+            snapshot.update(entries)
+            self._custom = snapshot
+        if self._cache is not None:
+            self._cache.clear()
+
+    def _convert_tokens(self, tokens):
+        # ``tokens`` are (prefix, core, suffix) tuples from the tokenizer
+        convert = self._convert_word
+        table = _SUFFIX_TABLE
+        result = []
+        for prefix, core, suffix in tokens:
+            if core:
+                result.append(prefix + convert(core) + suffix.translate(table))
+            else:
+                result.append(prefix)
+        return result
+
+    def _convert_words(self, words):
+        # Bulk hook used by batch conversion; subclasses may vectorize it
+        convert = self._convert_word
+        return [convert(word) for word in words]
+
+    def _sub_token(self, match):
+        prefix, core, suffix = match.groups()
+        if core:
+            return prefix + self._convert_word(core) + suffix.translate(_SUFFIX_TABLE)
+        return prefix
 
     def _convert_word(self, word):
         if not word:
             return word
 
         # Dictionary lookup
-        if word in self._dictionary:
-            return self._dictionary[word]
-
-        # Character-level romanization
+        custom = self._custom
+        if word in custom:
+            return custom[word]
+        if word in self._base:
+            return self._base[word]
+
+        cache = self._cache
+        if cache is None:
+            return self._convert_unknown(word)
+        converted = cache.get(word)
+        if converted is None:
+            converted = self._convert_unknown(word)
+            cache.put(word, converted)
+        return converted
+
+    def _classify_word(self, word):
+        # Stats: the counter a lookup of ``word`` stops at before the
+        # out-of-dictionary path, mirroring _convert_word
+        if word in self._custom or word in self._base:
+            return "dictionary_hits"
+        if word and self._cache is not None and word in self._cache:
+            return "cache_hits"
+        return None
+
+    def _convert_unknown(self, word):
+        # Out-of-dictionary word: attached lexicons, then the character rules
+        for lexicon in self._lexicons:
+            converted = lexicon.get(word)
+            if converted is not None:
+                return converted
+        return self._convert_chars(word)
+
+    def _convert_chars(self, word):
+        # Akshara-level romanization: a bare consonant is held back until
+        # the next character shows whether it takes a matra, a virama or
+        # the inherent 'a'; every other character is a single lookup.
+        table = _AKSHARA_TABLE
+        get = table.get
+        with_a = _WITH_A
         result = []
-        i = 0
-        length = len(word)
-
-        while i < length:
-            ch = word[i]
-
-            # Digit
-            if ch in self._digit_map:
-                result.append(self._digit_map[ch])
-                i += 1
-                continue
-
-            # Punctuation
-            if ch in self._punct_map:
-                result.append(self._punct_map[ch])
-                i += 1
-                continue
-
-            # Special chars (anusvara, chandrabindu, visarga)
-            if ch in self._special_map and ch != '्':
-                result.append(self._special_map[ch])
-                i += 1
-                continue
-
-            # 2-char conjunct consonants
-            if i + 1 < length:
-                two_char = word[i:i + 2]
-                if two_char in self._consonant_map:
-                    roman = self._consonant_map[two_char]
-                    i += 2
-                    if i < length and word[i] == '्':
-                        i += 1
-                    elif i < length and word[i] in self._matra_map:
-                        roman += self._matra_map[word[i]]
-                        i += 1
-                    else:
-                        if i < length and self._is_devanagari(word[i]):
-                            roman += 'a'
-                    result.append(roman)
+        append = result.append
+        pending = ''
+
+        for ch in word:
+            if pending:
+                cluster = get(pending + ch)
+                if cluster is not None:
+                    append(cluster)
+                    pending = ''
                     continue
+                append(with_a[pending] if '\u0900' <= ch <= '\u097f' else table[pending])
+                pending = ''
+            if ch in with_a:
+                pending = ch
+            else:
+                append(get(ch, ch))
 
-            # Nukta consonant
-            if ch in self._nukta_map:
-                roman = self._nukta_map[ch]
-                i += 1
-                if i < length and word[i] == '्':
-                    i += 1
-                elif i < length and word[i] in self._matra_map:
-                    roman += self._matra_map[word[i]]
-                    i += 1
-                else:
-                    if i < length and self._is_devanagari(word[i]):
-                        roman += 'a'
-                result.append(roman)
-                continue
-
-            # Regular consonant
-            if ch in self._consonant_map:
-                roman = self._consonant_map[ch]
-                i += 1
-                if i < length and word[i] == '्':
-                    i += 1
-                elif i < length and word[i] in self._matra_map:
-                    roman += self._matra_map[word[i]]
-                    i += 1
-                else:
-                    if i < length and self._is_devanagari(word[i]):
-                        roman += 'a'
-                result.append(roman)
-                continue
-
-            # Independent vowel
-            if ch in self._vowel_map:
-                result.append(self._vowel_map[ch])
-                i += 1
-                continue
-
-            # Fallback
-            result.append(ch)
-            i += 1
-
+        if pending:
+            append(table[pending])
         return ''.join(result)
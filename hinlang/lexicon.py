@@ -0,0 +1,348 @@
+"""
+hinlang.lexicon
+================
+
+Memory-mapped binary lexicons for very large word lists.
+
+A lexicon file holds sorted UTF-8 keys with their values, an offset
+index for binary search, and a blocked Bloom filter (all of a key's
+bits fall in one 64-bit word) that rejects most unknown words before
+any search. Blocking costs accuracy, so the filter is sized with the
+blocked filter's own false-positive rate, not the classic formula.
+Engines open it with ``mmap`` and read only the pages a lookup touches:
+a multi-million-entry lexicon costs no Python objects per entry (bar
+one sampled key per :data:`SAMPLE_EVERY`), and every process on the
+host that opens the same file shares one copy through the OS page
+cache.
+
+Build a lexicon from a tab-separated ``key<TAB>value`` file::
+
+    python -m hinlang.lexicon names.tsv names.hlex --lowercase-keys
+
+and attach it to an engine::
+
+    converter = RomanToHindi()
+    converter.open_lexicon("names.hlex")
+
+File layout (little-endian)::
+
+    header   magic "HINLEX\\0\\0", version u32, hashes u32,
+             count u64, bloom_bytes u64
+    bloom    bloom_bytes / 8 × u64 blocks
+    index    count × u32 offsets into the data section
+    data     per entry: key_len u16, value_len u16, key, value
+"""
+
+import mmap
+import struct
+import sys
+from bisect import bisect_right
+from hashlib import blake2b
+from math import ceil, exp, log
+
+MAGIC = b"HINLEX\0\0"
+VERSION = 1
+
+_HEADER = struct.Struct("<8sIIQQ")
+_OFFSET = struct.Struct("<I")
+_LENGTHS = struct.Struct("<HH")
+_BLOCK = struct.Struct("<Q")
+
+# Default Bloom filter false-positive rate
+FALSE_POSITIVE_RATE = 0.01
+
+# Every SAMPLE_EVERY-th key is kept in memory to narrow binary searches
+SAMPLE_EVERY = 256
+
+# A 64-bit block holds at most this many 6-bit bit positions per key
+_MAX_HASHES = 10
+
+
+def _bloom_probe(key: bytes, hashes: int, blocks: int):
+    # (block number, bit mask) for ``key``; blake2b is stable across
+    # processes, unlike ``hash()``
+    digest = int.from_bytes(blake2b(key, digest_size=16).digest(), "little")
+    mask = 0
+    bits = digest >> 64
+    for _ in range(hashes):
+        mask |= 1 << (bits & 63)
+        bits >>= 6
+    return (digest & 0xFFFFFFFFFFFFFFFF) % blocks, mask
+
+
+def _distinct_bits(hashes: int) -> list:
+    # P(a key's ``hashes`` 6-bit positions hit exactly d distinct bits)
+    dist = [1.0]
+    for _ in range(hashes):
+        step = [0.0] * (len(dist) + 1)
+        for d, p in enumerate(dist):
+            step[d] += p * d / 64
+            step[d + 1] += p * (64 - d) / 64
+        dist = step
+    return dist
+
+
+def _false_positive_rate(keys_per_block: float, hashes: int) -> float:
+    """
+    False-positive rate of a blocked Bloom filter with 64-bit blocks.
+
+    Block loads are Poisson-distributed around ``keys_per_block``, and
+    a query only fails if all of its bits are set in its one block, so
+    the rate is well above that of a classic filter of the same size.
+    """
+    distinct = _distinct_bits(hashes)
+    rate = 0.0
+    p_load = exp(-keys_per_block)
+    load = 0
+    while True:
+        q = 1 - (63 / 64) ** (hashes * load)
+        rate += p_load * sum(p * q ** d for d, p in enumerate(distinct))
+        load += 1
+        p_load *= keys_per_block / load
+        if load > keys_per_block and p_load < 1e-12:
+            return rate
+
+
+def _bloom_size(count: int, false_positive_rate: float):
+    """``(hashes, blocks)`` reaching ``false_positive_rate`` for ``count`` keys."""
+    # Start from the classic formula, then grow until the blocked
+    # filter meets the target
+    bits = ceil(-count * log(false_positive_rate) / (log(2) ** 2))
+    blocks = max(1, (bits + 63) // 64)
+    while True:
+        rate, hashes = min(
+            (_false_positive_rate(count / blocks, k), k) for k in range(1, _MAX_HASHES + 1)
+        )
+        if rate <= false_positive_rate:
+            return hashes, blocks
+        blocks += blocks // 20 + 1
+
+
+class Lexicon:
+    """
+    Read-only, memory-mapped lexicon opened from a file built by
+    :func:`build_lexicon`.
+
+    Args:
+        path: Path of the lexicon file.
+
+    Raises:
+        ValueError: If the file is not a lexicon of a supported version.
+
+    Example::
+
+        with Lexicon("names.hlex") as lexicon:
+            lexicon.get("ranjan")   # 'रंजन'
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._map) < _HEADER.size:
+            self._map.close()
+            raise ValueError("%s is not a hinlang lexicon" % (path,))
+        magic, version, hashes, count, bloom_bytes = _HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            self._map.close()
+            raise ValueError("%s is not a hinlang lexicon" % (path,))
+        if version != VERSION:
+            self._map.close()
+            raise ValueError("%s: unsupported lexicon version %d" % (path, version))
+
+        self._hashes = hashes
+        self._count = count
+        self._bloom = _HEADER.size
+        self._blocks = bloom_bytes // _BLOCK.size
+        self._index = self._bloom + bloom_bytes
+        self._data = self._index + count * _OFFSET.size
+        self._sample = None
+
+    def __len__(self):
+        return self._count
+
+    def __contains__(self, key):
+        return self.get(key) is not None
+
+    def get(self, key: str, default=None):
+        """Return the value stored for ``key``, or ``default``."""
+        raw = key.encode("utf-8")
+        if not self._blocks:
+            return default
+        block, mask = _bloom_probe(raw, self._hashes, self._blocks)
+        if _BLOCK.unpack_from(self._map, self._bloom + block * _BLOCK.size)[0] & mask != mask:
+            return default
+
+        # Narrow to one stretch of SAMPLE_EVERY keys, then binary search
+        sample = self._sample
+        if sample is None:
+            sample = self._sample = [
+                self._key_at(i) for i in range(0, self._count, SAMPLE_EVERY)
+            ]
+        stretch = bisect_right(sample, raw) - 1
+        if stretch < 0:
+            return default
+        lo = stretch * SAMPLE_EVERY
+        hi = min(lo + SAMPLE_EVERY, self._count)
+
+        buf = self._map
+        while lo < hi:
+            mid = (lo + hi) // 2
+            pos = self._entry(mid)
+            key_len, value_len = _LENGTHS.unpack_from(buf, pos)
+            start = pos + _LENGTHS.size
+            probe = buf[start:start + key_len]
+            if probe < raw:
+                lo = mid + 1
+            elif probe > raw:
+                hi = mid
+            else:
+                start += key_len
+                return buf[start:start + value_len].decode("utf-8")
+        return default
+
+    def close(self):
+        """Unmap the file."""
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ── Pickling: workers reopen (and share) the same mapping ──
+
+    def __getstate__(self):
+        return {"path": self.path}
+
+    def __setstate__(self, state):
+        self.__init__(state["path"])
+
+    def _entry(self, i):
+        return self._data + _OFFSET.unpack_from(self._map, self._index + i * _OFFSET.size)[0]
+
+    def _key_at(self, i):
+        pos = self._entry(i)
+        key_len = _LENGTHS.unpack_from(self._map, pos)[0]
+        start = pos + _LENGTHS.size
+        return self._map[start:start + key_len]
+
+
+def build_lexicon(entries, path, false_positive_rate: float = FALSE_POSITIVE_RATE,
+                  lowercase_keys: bool = False) -> int:
+    """
+    Write a lexicon file from ``(key, value)`` pairs.
+
+    Keys and values are stripped; later duplicates win, as with
+    ``add_words``.
+
+    Args:
+        entries: Mapping or iterable of ``(key, value)`` pairs.
+        path: Output file path.
+        false_positive_rate: Target Bloom filter false-positive rate.
+        lowercase_keys: Lowercase the keys, as ``RomanToHindi`` does
+            with the words it looks up. Use it for Roman-keyed lexicons.
+
+    Returns:
+        Number of entries written.
+
+    Raises:
+        ValueError: If a key or value exceeds 65535 UTF-8 bytes, or the
+            data section would exceed 4 GiB.
+    """
+    if not 0 < false_positive_rate < 1:
+        raise ValueError("false_positive_rate must be between 0 and 1")
+    if hasattr(entries, "items"):
+        entries = entries.items()
+
+    table = {}
+    for key, value in entries:
+        key = key.strip()
+        if lowercase_keys:
+            key = key.lower()
+        if key:
+            table[key.encode("utf-8")] = value.strip().encode("utf-8")
+    keys = sorted(table)
+    count = len(keys)
+
+    # Bloom filter sized for the requested false-positive rate
+    if count:
+        hashes, blocks = _bloom_size(count, false_positive_rate)
+    else:
+        hashes, blocks = 0, 0
+    bloom = [0] * blocks
+    for key in keys:
+        block, mask = _bloom_probe(key, hashes, blocks)
+        bloom[block] |= mask
+
+    offsets = []
+    data = []
+    size = 0
+    for key in keys:
+        value = table[key]
+        if len(key) > 0xFFFF or len(value) > 0xFFFF:
+            raise ValueError("lexicon keys and values are limited to 65535 bytes")
+        offsets.append(size)
+        data.append(_LENGTHS.pack(len(key), len(value)))
+        data.append(key)
+        data.append(value)
+        size += _LENGTHS.size + len(key) + len(value)
+    if size > 0xFFFFFFFF:
+        raise ValueError("lexicon data exceeds 4 GiB")
+
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, hashes, count, blocks * _BLOCK.size))
+        f.write(struct.pack("<%dQ" % blocks, *bloom))
+        f.write(struct.pack("<%dI" % count, *offsets))
+        f.writelines(data)
+    return count
+
+
+def read_tsv(lines):
+    """
+    Yield ``(key, value)`` pairs from ``key<TAB>value`` lines, skipping
+    blanks and ``#`` comments.
+    """
+    for line in lines:
+        line = line.rstrip("\r\n")
+        if not line.strip() or line.lstrip().startswith("#"):
+            continue
+        key, sep, value = line.partition("\t")
+        if not sep:
+            raise ValueError("expected key<TAB>value, got %r" % (line,))
+        yield key, value
+
+
+def main(argv=None):
+    """Command-line builder: ``python -m hinlang.lexicon SOURCE OUTPUT``."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="python -m hinlang.lexicon",
+        description="Build a memory-mapped hinlang lexicon from a TSV file.",
+    )
+    parser.add_argument("source", help="UTF-8 file of key<TAB>value lines")
+    parser.add_argument("output", help="Lexicon file to write")
+    parser.add_argument(
+        "--lowercase-keys", action="store_true",
+        help="Lowercase keys (for Roman → Devanagari lexicons)",
+    )
+    parser.add_argument(
+        "--false-positive-rate", type=float, default=FALSE_POSITIVE_RATE,
+        help="Bloom filter false-positive rate (default: %(default)s)",
+    )
+    args = parser.parse_args(argv)
+
+    with open(args.source, encoding="utf-8") as f:
+        count = build_lexicon(
+            read_tsv(f), args.output,
+            false_positive_rate=args.false_positive_rate,
+            lowercase_keys=args.lowercase_keys,
+        )
+    print("Wrote %d entries to %s" % (count, args.output), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,313 @@
+"""
+hinlang.parallel
+=================
+
+Process- and thread-pool batch conversion.
+
+Each worker process receives its engine exactly once, in the pool
+initializer. Engines pickle only their cache size and custom words (the
+shared tables are rebuilt from the package), so nothing but the input
+texts and results cross the process boundary per task.
+
+The thread backend shares the calling engine: reads never lock, since
+``add_word``/``add_words`` publish a new immutable snapshot of the
+custom words instead of mutating the one readers hold, and a word cache
+hit is a plain dict lookup (only cache insertions take its lock).
+
+Usage::
+
+    import hinlang
+
+    hinlang.to_hindi_batch(texts, workers=8, chunksize=2048)
+
+    converter = hinlang.RomanToHindi()
+    converter.add_word("bruh", "ब्रह")
+    converter.transliterate_batch(texts, workers=8)  # workers know "bruh"
+    converter.transliterate_batch(texts, workers=8, backend="thread")
+"""
+
+import mmap
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+# Default number of texts sent to a worker per task
+DEFAULT_CHUNKSIZE = 1024
+
+# Default bytes of a file sent to a worker per task (cut at a newline)
+DEFAULT_CHUNK_BYTES = 1 << 22
+
+_worker_engine = None
+_worker_engines = None
+_worker_map = None
+
+
+def _init_worker(engine):
+    global _worker_engine
+    _worker_engine = engine
+
+
+def _convert_chunk(texts, dedupe):
+    return _worker_engine.transliterate_batch(texts, dedupe=dedupe)
+
+
+def map_batch(engine, texts, workers: int, chunksize: int = DEFAULT_CHUNKSIZE,
+              backend: str = "process", dedupe: bool = True) -> list:
+    """
+    Transliterate ``texts`` across ``workers`` processes or threads.
+
+    Args:
+        engine: The calling engine. With ``backend="process"`` it is
+            pickled once into every worker; with ``backend="thread"``
+            all threads share it directly.
+        texts: Sequence of strings.
+        workers: Number of workers.
+        chunksize: Number of texts per task.
+        backend: ``"process"`` or ``"thread"``. Threads avoid process
+            start-up and pickling, and scale across cores on
+            free-threaded (no-GIL) Python builds.
+        dedupe: Deduplicate words within each chunk (see
+            :mod:`hinlang.batch`).
+
+    Returns:
+        List of converted strings, in input order.
+    """
+    if chunksize < 1:
+        raise ValueError("chunksize must be a positive integer")
+    if backend not in ("process", "thread"):
+        raise ValueError("backend must be 'process' or 'thread', not %r" % (backend,))
+
+    texts = list(texts)
+    chunks = [texts[i:i + chunksize] for i in range(0, len(texts), chunksize)]
+    if not chunks:
+        return []
+    workers = min(workers, len(chunks))
+
+    if backend == "thread":
+        def convert(chunk, dedupe):
+            return engine.transliterate_batch(chunk, dedupe=dedupe)
+
+        pool = ThreadPoolExecutor(max_workers=workers)
+        task = convert
+    else:
+        pool = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(engine,),
+        )
+        task = _convert_chunk
+
+    result = []
+    with pool:
+        for converted in pool.map(task, chunks, [dedupe] * len(chunks)):
+            result.extend(converted)
+    return result
+
+
+# ── Whole files ──
+
+def line_spans(buf, chunk_bytes: int = DEFAULT_CHUNK_BYTES):
+    """
+    Yield ``(start, end)`` byte ranges covering ``buf``, each ending just
+    after a newline (or at the end of ``buf``).
+
+    A range only exceeds ``chunk_bytes`` when a single line does. A
+    newline byte never occurs inside a multi-byte UTF-8 character, so
+    every range decodes on its own.
+    """
+    if chunk_bytes < 1:
+        raise ValueError("chunk_bytes must be a positive integer")
+    size = len(buf)
+    start = 0
+    while start < size:
+        end = buf.find(b"\n", min(start + chunk_bytes, size) - 1)
+        end = size if end < 0 else end + 1
+        yield start, end
+        start = end
+
+
+def convert_lines(engines, text: str) -> str:
+    """
+    Convert ``text`` preserving whitespace, as the streaming CLI does.
+
+    Args:
+        engines: ``(roman_to_hindi, hindi_to_roman)``. If one of them is
+            ``None`` everything goes through the other; otherwise each
+            line is converted in its detected direction.
+        text: Text made of whole lines.
+    """
+    r2h, h2r = engines
+    if r2h is None or h2r is None:
+        engine = r2h or h2r
+        return engine._tokenizer.pattern.sub(engine._sub_token, text)
+
+    from hinlang.detector import detect_script
+    from hinlang.stream import CHUNK_SIZE
+
+    # Newlines are whitespace, so no token spans two lines. The direction
+    # comes from the first CHUNK_SIZE characters, as in the streaming CLI.
+    out = []
+    for line in text.split("\n"):
+        engine = h2r if detect_script(line[:CHUNK_SIZE]) == "devanagari" else r2h
+        out.append(engine._tokenizer.pattern.sub(engine._sub_token, line))
+    return "\n".join(out)
+
+
+def _init_file_worker(path, engines):
+    global _worker_engines, _worker_map
+    _worker_engines = engines
+    with open(path, "rb") as f:
+        _worker_map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _convert_span(start, end):
+    text = _worker_map[start:end].decode("utf-8")
+    return convert_lines(_worker_engines, text).encode("utf-8")
+
+
+def map_file(engines, path, write, workers: int,
+             chunk_bytes: int = DEFAULT_CHUNK_BYTES) -> int:
+    """
+    Convert a UTF-8 file across ``workers`` processes, in order.
+
+    The file is memory-mapped and cut at line boundaries into chunks of
+    about ``chunk_bytes``. Workers map the same file and receive only
+    byte offsets, convert their chunk with :func:`convert_lines` and
+    return the encoded result, which is written in the original order.
+    At most ``2 * workers`` chunks are in flight, so memory stays bounded
+    however large the file is.
+
+    Args:
+        engines: ``(roman_to_hindi, hindi_to_roman)``, as for
+            :func:`convert_lines`; pickled once into every worker.
+        path: Input file path.
+        write: Callable receiving the converted ``bytes``, chunk by chunk.
+        workers: Number of worker processes.
+        chunk_bytes: Target chunk size in bytes.
+
+    Returns:
+        Number of input bytes converted.
+    """
+    if workers < 1:
+        raise ValueError("workers must be a positive integer")
+    with open(path, "rb") as f:
+        size = f.seek(0, 2)
+        if not size:
+            return 0
+        buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    with buf, ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_file_worker,
+        initargs=(path, engines),
+    ) as pool:
+        pending = deque()
+        for start, end in line_spans(buf, chunk_bytes):
+            pending.append(pool.submit(_convert_span, start, end))
+            if len(pending) >= 2 * workers:
+                write(pending.popleft().result())
+        while pending:
+            write(pending.popleft().result())
+    return size
+
+
+def convert_file(engines, src, dst, block_bytes: int = DEFAULT_CHUNK_BYTES):
+    """
+    Convert the UTF-8 file ``src`` into ``dst`` with :func:`convert_lines`.
+
+    The file is read in blocks of ``block_bytes`` cut after their last
+    newline, so memory stays bounded for large files too. Missing parent
+    directories of ``dst`` are created. If anything fails after ``dst``
+    was opened, it is removed before the exception propagates.
+
+    Returns:
+        ``(bytes_read, bytes_written)``.
+    """
+    parent = os.path.dirname(dst)
+    if parent:
+        os.makedirs(parent, exist_ok=True)
+    read = written = 0
+    carry = b""
+    with open(src, "rb") as fin:
+        fout = open(dst, "wb")
+        try:
+            with fout:
+                while True:
+                    block = fin.read(block_bytes)
+                    read += len(block)
+                    if block:
+                        block = carry + block
+                        cut = block.rfind(b"\n") + 1
+                        if not cut:
+                            carry = block
+                            continue
+                        block, carry = block[:cut], block[cut:]
+                    else:
+                        block, carry = carry, b""
+                        if not block:
+                            break
+                    out = convert_lines(engines, block.decode("utf-8")).encode("utf-8")
+                    fout.write(out)
+                    written += len(out)
+        except BaseException:
+            # Don't leave a half-converted file behind, whatever failed
+            try:
+                os.remove(dst)
+            except OSError:
+                pass
+            raise
+    return read, written
+
+
+def _init_files_worker(engines):
+    global _worker_engines
+    _worker_engines = engines
+
+
+def _convert_one(engines, pair):
+    src, dst = pair
+    try:
+        read, written = convert_file(engines, src, dst)
+    except (OSError, UnicodeDecodeError) as exc:
+        return src, 0, 0, "%s: %s" % (type(exc).__name__, exc)
+    return src, read, written, None
+
+
+def _convert_file_task(pair):
+    return _convert_one(_worker_engines, pair)
+
+
+def map_files(engines, pairs, workers: int, chunksize: int = 16):
+    """
+    Convert many files with :func:`convert_file` across ``workers`` processes.
+
+    Every worker receives the engines once, in the pool initializer, so
+    a file costs only its own conversion. With ``workers=1`` the files
+    are converted in the calling process.
+
+    Args:
+        engines: ``(roman_to_hindi, hindi_to_roman)``, as for
+            :func:`convert_lines`.
+        pairs: Iterable of ``(source_path, destination_path)``.
+        workers: Number of worker processes.
+        chunksize: Files sent to a worker per task.
+
+    Yields:
+        ``(source_path, bytes_read, bytes_written, error)`` per file, in
+        input order; ``error`` is ``None`` or a message for a file that
+        could not be read, decoded or written.
+    """
+    if workers < 1:
+        raise ValueError("workers must be a positive integer")
+    if workers == 1:
+        for pair in pairs:
+            yield _convert_one(engines, pair)
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_files_worker,
+        initargs=(engines,),
+    ) as pool:
+        for result in pool.map(_convert_file_task, pairs, chunksize=chunksize):
+            yield result
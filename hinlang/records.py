@@ -0,0 +1,329 @@
+"""
+hinlang.records
+================
+
+Field-level transliteration of JSON Lines, CSV and TSV streams.
+
+Only the selected fields (or columns) are converted; everything else is
+copied through byte for byte. A JSON line is never re-serialized: the
+selected string values are located in the original text and only those
+spans are replaced. A CSV row is written back through :mod:`csv` only
+when one of its selected cells actually changed; other rows, the header
+included, are copied verbatim.
+
+Records are processed in chunks of ``chunk_size``. All selected values
+of a chunk go through ``transliterate_batch`` together, so a value (or
+word) repeated across the chunk is converted once.
+
+Usage::
+
+    import hinlang
+
+    with open("chats.jsonl", encoding="utf-8") as src, \\
+            open("chats.hi.jsonl", "w", encoding="utf-8") as dst:
+        hinlang.transliterate_jsonl(src, dst, ["message", "title"])
+
+    with open("posts.csv", encoding="utf-8", newline="") as src, \\
+            open("posts.hi.csv", "w", encoding="utf-8", newline="") as dst:
+        hinlang.transliterate_csv(src, dst, ["title"], direction="hindi")
+"""
+
+import csv
+import io
+import json
+import re
+
+from hinlang import _get_h2r, _get_r2h, detect_script
+
+# Default number of records converted together
+CHUNK_SIZE = 1024
+
+DIRECTIONS = ("auto", "hindi", "roman")
+
+# JSON tokens around the values, which json's own scanner decodes
+_OPEN = re.compile(r"[ \t\n\r]*\{[ \t\n\r]*")
+_KEY = re.compile(r'"(?:([^"\\]*)|((?:[^"\\]|\\.)*))"[ \t\n\r]*:[ \t\n\r]*')
+_SEPARATOR = re.compile(r"[ \t\n\r]*([,}])[ \t\n\r]*")
+_decode_value = json.JSONDecoder().raw_decode
+
+
+# ── Conversion of a chunk's values ──
+
+def _check_direction(direction):
+    if direction not in DIRECTIONS:
+        raise ValueError("direction must be one of %s, not %r" % (", ".join(DIRECTIONS), direction))
+
+
+def convert_values(values: list, direction: str = "auto") -> list:
+    """
+    Transliterate a list of field values with the deduplicating batch path.
+
+    Args:
+        values: List of strings.
+        direction: ``"hindi"`` (Roman → Devanagari), ``"roman"``
+            (Devanagari → Roman) or ``"auto"`` to pick per value, as
+            :func:`hinlang.convert` does.
+
+    Returns:
+        List of converted strings, in input order.
+    """
+    _check_direction(direction)
+    if not values:
+        return []
+    if direction == "hindi":
+        return _get_r2h().transliterate_batch(values)
+    if direction == "roman":
+        return _get_h2r().transliterate_batch(values)
+
+    # Detect each distinct value once, then convert each group in one batch
+    scripts = {}
+    for value in values:
+        if value not in scripts:
+            scripts[value] = detect_script(value) == "devanagari"
+    roman = [value for value, hindi in scripts.items() if not hindi]
+    hindi = [value for value, hindi in scripts.items() if hindi]
+    converted = {}
+    if roman:
+        converted.update(zip(roman, _get_r2h().transliterate_batch(roman)))
+    if hindi:
+        converted.update(zip(hindi, _get_h2r().transliterate_batch(hindi)))
+    return [converted[value] for value in values]
+
+
+# ── JSON Lines ──
+
+def _string_spans(line, fields):
+    """
+    ``(start, end, value)`` of each top-level string value in the JSON
+    object ``line`` whose key is in ``fields``.
+
+    Raises:
+        ValueError: If ``line`` is not a JSON object.
+    """
+    match = _OPEN.match(line)
+    if match is None:
+        raise ValueError("expected a JSON object")
+    idx = match.end()
+    spans = []
+    if line.startswith("}", idx):
+        idx = _SEPARATOR.match(line, idx).end()
+    else:
+        while True:
+            match = _KEY.match(line, idx)
+            if match is None:
+                raise ValueError("expected a key at column %d" % (idx + 1))
+            key, start = match.group(1, 2), match.end()
+            key = key[0] if key[1] is None else json.loads('"%s"' % key[1])
+            value, idx = _decode_value(line, start)
+            if key in fields and isinstance(value, str):
+                spans.append((start, idx, value))
+            match = _SEPARATOR.match(line, idx)
+            if match is None:
+                raise ValueError("expected ',' or '}' at column %d" % (idx + 1))
+            idx = match.end()
+            if match.group(1) == "}":
+                break
+    if idx < len(line):
+        raise ValueError("extra data at column %d" % (idx + 1))
+    return spans
+
+
+def transliterate_jsonl(src, dst, fields, direction: str = "auto",
+                        chunk_size: int = CHUNK_SIZE) -> int:
+    """
+    Transliterate selected fields of a JSON Lines stream.
+
+    Only top-level string values are converted; a selected field holding
+    a number, list, object or ``null`` is left alone. Blank lines are
+    copied through.
+
+    Args:
+        src: Text file object (or any iterable of lines) to read.
+        dst: Text file object to write.
+        fields: Names of the fields to convert.
+        direction: ``"auto"`` (default), ``"hindi"`` or ``"roman"``;
+            see :func:`convert_values`.
+        chunk_size: Records converted together.
+
+    Returns:
+        Number of records (non-blank lines) read.
+
+    Raises:
+        ValueError: If a line is not a JSON object (the message names
+            the line number).
+
+    Example::
+
+        >>> src = io.StringIO('{"id": 7, "message": "Kya haal hai"}\\n')
+        >>> transliterate_jsonl(src, sys.stdout, ["message"])
+        {"id": 7, "message": "क्या हाल है"}
+    """
+    _check_direction(direction)
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer")
+    fields = frozenset(fields)
+    write = dst.write
+    records = 0
+    lines = []
+    spans = []
+
+    def flush():
+        values = [value for line_spans in spans for _, _, value in line_spans]
+        converted = iter(convert_values(values, direction))
+        for line, line_spans in zip(lines, spans):
+            if line_spans:
+                pieces = []
+                last = 0
+                for start, end, value in line_spans:
+                    result = next(converted)
+                    if result != value:
+                        pieces.append(line[last:start])
+                        pieces.append(json.dumps(result, ensure_ascii=False))
+                        last = end
+                pieces.append(line[last:])
+                line = "".join(pieces)
+            write(line)
+        lines.clear()
+        spans.clear()
+
+    for number, line in enumerate(src, 1):
+        if line.strip():
+            records += 1
+            try:
+                line_spans = _string_spans(line, fields)
+            except ValueError as exc:
+                raise ValueError("line %d: %s" % (number, exc)) from None
+        else:
+            line_spans = ()
+        lines.append(line)
+        spans.append(line_spans)
+        if len(lines) >= chunk_size:
+            flush()
+    flush()
+    return records
+
+
+# ── CSV / TSV ──
+
+class _LineRecorder:
+    """Iterate lines for :mod:`csv` while keeping the raw text of the current row."""
+
+    def __init__(self, lines):
+        self._lines = iter(lines)
+        self.raw = []
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        line = next(self._lines)
+        self.raw.append(line)
+        return line
+
+    def take(self):
+        raw = "".join(self.raw)
+        self.raw.clear()
+        return raw
+
+
+def _column_indexes(columns, header):
+    """Resolve column names (or 1-based numbers) against ``header``."""
+    names = {name: i for i, name in reversed(list(enumerate(header or ())))}
+    indexes = []
+    for column in columns:
+        if column in names:
+            indexes.append(names[column])
+        elif str(column).isdigit() and int(column) >= 1:
+            indexes.append(int(column) - 1)
+        else:
+            raise ValueError("no column named %r" % (column,))
+    return sorted(set(indexes))
+
+
+def transliterate_csv(src, dst, columns, direction: str = "auto", delimiter: str = ",",
+                      header: bool = True, chunk_size: int = CHUNK_SIZE) -> int:
+    """
+    Transliterate selected columns of a CSV or TSV stream.
+
+    Open both files with ``newline=""``, as :mod:`csv` requires. Rows
+    whose selected cells do not change are copied byte for byte; changed
+    rows are re-quoted by :mod:`csv` with the delimiter and line ending
+    the input uses.
+
+    Args:
+        src: Text file object (or any iterable of lines) to read.
+        dst: Text file object to write.
+        columns: Column names from the header row, or 1-based column
+            numbers (as ``int`` or digit strings, like ``cut -f``).
+        direction: ``"auto"`` (default), ``"hindi"`` or ``"roman"``;
+            see :func:`convert_values`.
+        delimiter: ``","`` for CSV, ``"\\t"`` for TSV.
+        header: Whether the first row is a header. It is always copied
+            through unconverted.
+        chunk_size: Rows converted together.
+
+    Returns:
+        Number of data rows read (the header not included).
+
+    Example::
+
+        >>> src = io.StringIO("id,title\\n1,Namaste dosto\\n")
+        >>> transliterate_csv(src, sys.stdout, ["title"])
+        id,title
+        1,नमस्ते दोस्तो
+    """
+    _check_direction(direction)
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer")
+    recorder = _LineRecorder(src)
+    reader = csv.reader(recorder, delimiter=delimiter)
+    write = dst.write
+
+    indexes = None
+    if header:
+        row = next(reader, None)
+        if row is None:
+            return 0
+        indexes = _column_indexes(columns, row)
+        write(recorder.take())
+    else:
+        indexes = _column_indexes(columns, None)
+
+    buf = io.StringIO()
+    writer = None
+    rows = 0
+    chunk = []    # (raw text, row)
+
+    def flush():
+        nonlocal writer
+        values = [row[i] for _, row in chunk for i in indexes if i < len(row)]
+        converted = iter(convert_values(values, direction))
+        for raw, row in chunk:
+            changed = False
+            for i in indexes:
+                if i < len(row):
+                    value = next(converted)
+                    if value != row[i]:
+                        row[i] = value
+                        changed = True
+            if not changed:
+                write(raw)
+                continue
+            if writer is None:
+                ending = "\r\n" if raw.endswith("\r\n") else "\n"
+                writer = csv.writer(buf, delimiter=delimiter, lineterminator=ending)
+            writer.writerow(row)
+            line = buf.getvalue()
+            buf.seek(0)
+            buf.truncate()
+            # A last row without a line ending stays without one
+            write(line if raw.endswith("\n") else line.rstrip("\r\n"))
+        chunk.clear()
+
+    for row in reader:
+        rows += 1
+        chunk.append((recorder.take(), row))
+        if len(chunk) >= chunk_size:
+            flush()
+    flush()
+    return rows
@@ -13,7 +13,194 @@ Usage::
     # नमस्ते दोस्तो
 """
 
+import threading
+
+from hinlang.batch import transliterate_deduped
+from hinlang.cache import WordCache
 from hinlang.dictionary import ROMAN_TO_HINDI, SPECIALS
+from hinlang.stream import iter_transliterate, read_chunks
+from hinlang.tokenizer import ROMAN_TOKENIZER
+
+
+# ════════════════════════════════════════════════
+#  PHONETIC TABLES  (shared, built once per process)
+# ════════════════════════════════════════════════
+
+_VOWELS = {
+    'aa': 'आ', 'ai': 'ऐ', 'au': 'औ',
+    'ee': 'ई', 'oo': 'ऊ', 'ou': 'औ',
+    'a':  'अ', 'e':  'ए', 'i':  'इ',
+    'o':  'ओ', 'u':  'उ',
+}
+
+_MATRAS = {
+    'aa': 'ा',  'ai': 'ै',  'au': 'ौ',
+    'ee': 'ी',  'oo': 'ू',  'ou': 'ौ',
+    'a':  '',    'e':  'े',  'i':  'ि',
+    'o':  'ो',  'u':  'ु',
+}
+
+_CONSONANTS = {
+    'shree': 'श्री',
+    'ksha': 'क्ष', 'gnya': 'ज्ञ', 'dnya': 'ज्ञ',
+    'shra': 'श्र', 'thra': 'थ्र', 'ttra': 'त्र',
+    'bha': 'भ',  'cha': 'च',  'chh': 'छ',
+    'dha': 'ध',  'gha': 'घ',  'jha': 'झ',
+    'kha': 'ख',  'nka': 'ंक', 'pha': 'फ',
+    'sha': 'श',  'shh': 'ष',  'tha': 'थ',
+    'tra': 'त्र', 'nga': 'ंग',
+    'nha': 'न्ह', 'lha': 'ल्ह',
+    'bh': 'भ',  'ch': 'च',  'dh': 'ध',
+    'gh': 'घ',  'jh': 'झ',  'kh': 'ख',
+    'ph': 'फ',  'sh': 'श',  'th': 'थ',
+    'tr': 'त्र', 'ng': 'ंग', 'nn': 'ण',
+    'ny': 'ञ',  'rh': 'ढ',
+    'b': 'ब',  'c': 'क',  'd': 'द',  'f': 'फ',
+    'g': 'ग',  'h': 'ह',  'j': 'ज',  'k': 'क',
+    'l': 'ल',  'm': 'म',  'n': 'न',  'p': 'प',
+    'q': 'क़', 'r': 'र',  's': 'स',  't': 'त',
+    'v': 'व',  'w': 'व',  'x': 'क्स', 'y': 'य',
+    'z': 'ज़',
+}
+
+_DIGITS = {
+    '0': '०', '1': '१', '2': '२', '3': '३', '4': '४',
+    '5': '५', '6': '६', '7': '७', '8': '८', '9': '९',
+}
+
+_PUNCTUATION = {
+    '.': '।', '|': '।', '||': '॥',
+}
+
+# Per-character table for trailing punctuation (``str.translate``)
+_SUFFIX_TABLE = {ord(k): v for k, v in _PUNCTUATION.items() if len(k) == 1}
+
+
+# ════════════════════════════════════════════════
+#  LONGEST-MATCH AUTOMATON
+# ════════════════════════════════════════════════
+
+def _compile_trie(table):
+    """
+    Compile a ``{key: value}`` table into a character trie.
+
+    Each node maps a character to a ``[value, children]`` pair, where
+    ``value`` is ``None`` unless a key ends at that character.
+    """
+    root = {}
+    for key, value in table.items():
+        node = root
+        entry = None
+        for ch in key:
+            entry = node.get(ch)
+            if entry is None:
+                entry = node[ch] = [None, {}]
+            node = entry[1]
+        entry[0] = value
+    return root
+
+
+def _longest_match(trie, text, pos, length):
+    """
+    Walk ``trie`` from ``text[pos]`` one character at a time.
+
+    Returns:
+        ``(matched_length, value)`` for the longest key found at ``pos``,
+        or ``(0, None)`` when nothing matches.
+    """
+    node = trie
+    best_len = 0
+    best = None
+    i = pos
+    while i < length:
+        entry = node.get(text[i])
+        if entry is None:
+            break
+        i += 1
+        if entry[0] is not None:
+            best_len = i - pos
+            best = entry[0]
+        node = entry[1]
+    return best_len, best
+
+
+_CONSONANT_TRIE = _compile_trie(_CONSONANTS)
+
+# Vowel and matra tables share their keys, so one walk yields both forms:
+# value is ``(independent_vowel, matra)``.
+_VOWEL_TRIE = _compile_trie({
+    key: (_VOWELS[key], _MATRAS[key]) for key in _VOWELS
+})
+
+
+# ════════════════════════════════════════════════
+#  INFLECTED FORMS  (dictionary stem + suffix)
+# ════════════════════════════════════════════════
+
+# Stem endings a suffix may replace: (Roman ending restored to the stem,
+# Devanagari ending dropped from the stem's dictionary form).
+# e.g. bachch|on <- bachcha (बच्चा) -> बच्च + ों
+_BARE_STEM = (('', ''),)
+_A_STEM = (('', ''), ('a', 'ा'))
+_I_STEM = (('i', 'ी'),)
+
+# Roman suffix -> (Devanagari suffix, stem endings)
+_INFLECTIONS = {
+    # Plural and oblique nouns and adjectives
+    'on':    ('ों', _A_STEM),
+    'o':     ('ो', _A_STEM),
+    'e':     ('े', _A_STEM),
+    'en':    ('ें', _BARE_STEM),
+    'ein':   ('ें', _BARE_STEM),
+    'iyan':  ('ियाँ', _I_STEM),
+    'iyaan': ('ियाँ', _I_STEM),
+    'iyon':  ('ियों', _I_STEM),
+    # Verb forms on a bare verb stem
+    'ta':    ('ता', _BARE_STEM),
+    'te':    ('ते', _BARE_STEM),
+    'ti':    ('ती', _BARE_STEM),
+    'na':    ('ना', _BARE_STEM),
+    'ne':    ('ने', _BARE_STEM),
+    'enge':  ('ेंगे', _BARE_STEM),
+    'ega':   ('ेगा', _BARE_STEM),
+    'egi':   ('ेगी', _BARE_STEM),
+    'oge':   ('ोगे', _BARE_STEM),
+    'unga':  ('ूँगा', _BARE_STEM),
+    'ungi':  ('ूँगी', _BARE_STEM),
+    'yenge': ('एंगे', _BARE_STEM),
+    'yega':  ('एगा', _BARE_STEM),
+    'yegi':  ('एगी', _BARE_STEM),
+    # Compounds
+    'wala':  ('वाला', _BARE_STEM),
+    'wale':  ('वाले', _BARE_STEM),
+    'wali':  ('वाली', _BARE_STEM),
+}
+
+# Shortest Roman stem a suffix is split from
+_MIN_STEM = 2
+
+# Dictionary words that never take these suffixes: pronouns, question
+# words, postpositions and connectors, and English loanwords. Without
+# this, "kate" would read as ka|te (काते) and "hine" as hi|ne (हायने).
+_NOT_STEMS = frozenset("""
+    aap main mein mai hum tum tu woh wo yeh ye
+    kya kyu kyon kyun kaun kon kab kahan kahaan idhar udhar kidhar
+    ki ka ke ko se me pe par ne ya aur or lekin magar agar toh to bhi
+    nahi nhi nahin na mat sirf bas ab tab jab phir fir
+    hello hi bye goodbye sorry please welcome thankyou thanks
+    school time phone computer train sir
+""".split())
+
+# Suffixes reversed, so one walk from the end of a word finds them all
+_INFLECTION_TRIE = _compile_trie({
+    suffix[::-1]: value for suffix, value in _INFLECTIONS.items()
+})
+
+
+def _ends_in_consonant(hindi):
+    # A matra suffix may only follow a consonant (or nukta consonant)
+    last = hindi[-1]
+    return 'क' <= last <= 'ह' or last == '़' or 'क़' <= last <= 'य़'
 
 
 class RomanToHindi:
@@ -24,6 +211,16 @@ class RomanToHindi:
       1. Dictionary lookup (500+ common words)
       2. Character-level phonetic transliteration (for unknown words)
 
+    Args:
+        cache_size: Number of character-level conversions to memoize in
+            an LRU cache. ``0`` (default) disables the cache.
+
+    Thread safety:
+        One engine may be shared by any number of threads, including on
+        free-threaded Python. Conversions read an immutable snapshot of
+        the custom words without locking; ``add_word``/``add_words``
+        build a new snapshot and swap it in atomically.
+
     Example::
 
         converter = RomanToHindi()
@@ -31,57 +228,19 @@ class RomanToHindi:
         converter.transliterate("Kya haal hai")    # 'क्या हाल है'
     """
 
-    def __init__(self):
-        # ── Phonetic maps ──
-        self._vowels = {
-            'aa': 'आ', 'ai': 'ऐ', 'au': 'औ',
-            'ee': 'ई', 'oo': 'ऊ', 'ou': 'औ',
-            'a':  'अ', 'e':  'ए', 'i':  'इ',
-            'o':  'ओ', 'u':  'उ',
-        }
-
-        self._matras = {
-            'aa': 'ा',  'ai': 'ै',  'au': 'ौ',
-            'ee': 'ी',  'oo': 'ू',  'ou': 'ौ',
-            'a':  '',    'e':  'े',  'i':  'ि',
-            'o':  'ो',  'u':  'ु',
-        }
-
-        self._consonants = {
-            'shree': 'श्री',
-            'ksha': 'क्ष', 'gnya': 'ज्ञ', 'dnya': 'ज्ञ',
-            'shra': 'श्र', 'thra': 'थ्र', 'ttra': 'त्र',
-            'bha': 'भ',  'cha': 'च',  'chh': 'छ',
-            'dha': 'ध',  'gha': 'घ',  'jha': 'झ',
-            'kha': 'ख',  'nka': 'ंक', 'pha': 'फ',
-            'sha': 'श',  'shh': 'ष',  'tha': 'थ',
-            'tra': 'त्र', 'nga': 'ंग',
-            'nha': 'न्ह', 'lha': 'ल्ह',
-            'bh': 'भ',  'ch': 'च',  'dh': 'ध',
-            'gh': 'घ',  'jh': 'झ',  'kh': 'ख',
-            'ph': 'फ',  'sh': 'श',  'th': 'थ',
-            'tr': 'त्र', 'ng': 'ंग', 'nn': 'ण',
-            'ny': 'ञ',  'rh': 'ढ',
-            'b': 'ब',  'c': 'क',  'd': 'द',  'f': 'फ',
-            'g': 'ग',  'h': 'ह',  'j': 'ज',  'k': 'क',
-            'l': 'ल',  'm': 'म',  'n': 'न',  'p': 'प',
-            'q': 'क़', 'r': 'र',  's': 'स',  't': 'त',
-            'v': 'व',  'w': 'व',  'x': 'क्स', 'y': 'य',
-            'z': 'ज़',
-        }
-
-        self._digits = {
-            '0': '०', '1': '१', '2': '२', '3': '३', '4': '४',
-            '5': '५', '6': '६', '7': '७', '8': '८', '9': '९',
-        }
-
-        self._punctuation = {
-            '.': '।', '|': '।', '||': '॥',
-        }
+    _suffix_table = _SUFFIX_TABLE
+    _tokenizer = ROMAN_TOKENIZER
 
-        # Word dictionary
-        self._dictionary = dict(ROMAN_TO_HINDI)
-        self._specials = dict(SPECIALS)
+    def __init__(self, cache_size: int = 0):
+        # Word dictionary: shared read-only base + per-instance overlay.
+        # Phonetic tables and tries are module-level and never copied.
+        self._base = ROMAN_TO_HINDI
+        self._specials = SPECIALS
+        self._custom = {}
+        self._lexicons = ()
+        self._write_lock = threading.Lock()
+        self._cache = WordCache(cache_size) if cache_size else None
+        self._stats = None
 
     # ── Public API ──
 
@@ -97,7 +256,7 @@ class RomanToHindi:
 
             converter.add_word("bruh", "ब्रह")
         """
-        self._dictionary[roman.lower().strip()] = hindi
+        self._publish({roman.lower().strip(): hindi})
 
     def add_words(self, mapping: dict):
         """
@@ -110,8 +269,89 @@ class RomanToHindi:
 
             converter.add_words({"bruh": "ब्रह", "vibe": "वाइब"})
         """
-        for roman, hindi in mapping.items():
-            self._dictionary[roman.lower().strip()] = hindi
+        self._publish({
+            roman.lower().strip(): hindi for roman, hindi in mapping.items()
+        })
+
+    def open_lexicon(self, path):
+        """
+        Attach a memory-mapped lexicon (see :mod:`hinlang.lexicon`).
+
+        Lexicons are consulted, in the order they were opened, for words
+        that are neither custom words nor in the built-in dictionary;
+        hits are memoized in the word cache like any other conversion.
+        Process-pool workers reopen the same file and share its pages.
+
+        Args:
+            path: Lexicon file path, or an open ``Lexicon``.
+
+        Returns:
+            The attached ``Lexicon``.
+
+        Example::
+
+            converter.open_lexicon("names.hlex")   # built with --lowercase-keys
+        """
+        from hinlang.lexicon import Lexicon
+
+        lexicon = path if isinstance(path, Lexicon) else Lexicon(path)
+        with self._write_lock:
+            self._lexicons = self._lexicons + (lexicon,)
+        if self._cache is not None:
+            self._cache.clear()
+        return lexicon
+
+    def cache_info(self):
+        """
+        Return word-cache statistics, or ``None`` if caching is disabled.
+
+        Example::
+
+            >>> RomanToHindi(cache_size=1024).cache_info()
+            CacheInfo(hits=0, misses=0, evictions=0, maxsize=1024, currsize=0)
+        """
+        if self._cache is None:
+            return None
+        return self._cache.info()
+
+    def cache_clear(self):
+        """Drop all memoized word conversions."""
+        if self._cache is not None:
+            self._cache.clear()
+
+    def enable_stats(self, enabled: bool = True):
+        """
+        Turn the runtime counters (see :mod:`hinlang.counters`) on or off.
+
+        Enabling starts from zero; enabling again keeps counting.
+        Disabled (the default) counting costs nothing.
+
+        Args:
+            enabled: ``True`` to start counting, ``False`` to stop and
+                discard the counters.
+        """
+        from hinlang.counters import instrument, uninstrument
+
+        if not enabled:
+            uninstrument(self)
+            self._stats = None
+        elif self._stats is None:
+            self._stats = instrument(self, self._classify_word)
+
+    def stats(self):
+        """
+        Return the runtime counters, or ``None`` if stats are disabled.
+
+        Example::
+
+            >>> converter.enable_stats()
+            >>> converter.transliterate("Namaste dosto")
+            >>> converter.stats().dictionary_hits
+            2
+        """
+        if self._stats is None:
+            return None
+        return self._stats.snapshot()
 
     def transliterate(self, text: str) -> str:
         """
@@ -131,55 +371,132 @@ class RomanToHindi:
         if not text:
             return ""
 
-        words = text.split()
-        result = []
+        return ' '.join(self._convert_tokens(self._tokenizer.tokenize(text)))
 
-        for word in words:
-            prefix, core, suffix = self._strip_punctuation(word)
-            converted_suffix = ''.join(
-                self._punctuation.get(ch, ch) for ch in suffix
-            )
-            if core:
-                dev_word = self._convert_word(core)
-            else:
-                dev_word = ''
-            result.append(prefix + dev_word + converted_suffix)
+    def transliterate_batch(self, texts, workers: int = 1, chunksize: int = 1024,
+                            backend: str = "process", dedupe: bool = True) -> list:
+        """
+        Transliterate a list of strings.
+
+        Args:
+            texts: List of input strings.
+            workers: Number of workers. ``1`` (default) converts
+                in the calling process. With more, each worker process
+                gets its own copy of this engine (custom words included)
+                once; worker threads share this engine.
+            chunksize: Number of strings sent to a worker per task.
+            backend: ``"process"`` (default) or ``"thread"``. Threads
+                share this engine and scale on free-threaded Python.
+            dedupe: Convert each distinct word (and each distinct text)
+                only once per batch or chunk and share repeated output
+                strings. Output is the same either way.
+
+        Returns:
+            List of converted strings, in input order.
+
+        Example::
+
+            >>> converter.transliterate_batch(["Namaste", "Kya haal hai"])
+            ['नमस्ते', 'क्या हाल है']
+        """
+        if workers > 1:
+            from hinlang.parallel import map_batch
+            return map_batch(self, texts, workers, chunksize, backend, dedupe)
+        if dedupe:
+            return transliterate_deduped(self, texts)
+        transliterate = self.transliterate
+        return [transliterate(t) for t in texts]
+
+    def transliterate_iter(self, chunks):
+        """
+        Lazily transliterate an iterable of text chunks.
+
+        Whitespace (spaces, tabs, newlines) is preserved exactly, and a
+        word split across two chunks is converted as one word.
+
+        Args:
+            chunks: Iterable of strings, e.g. an open text file.
+
+        Yields:
+            Converted text pieces, in order.
+
+        Example::
+
+            >>> ''.join(converter.transliterate_iter(["Namaste\n  Dosto"]))
+            'नमस्ते\n  दोस्तो'
+        """
+        return iter_transliterate(self._tokenizer.pattern, self._sub_token, chunks)
+
+    def transliterate_to(self, source, writer) -> int:
+        """
+        Stream-transliterate ``source`` into ``writer``.
+
+        Args:
+            source: A string, a readable text file object, or an
+                iterable of strings.
+            writer: Object with a ``write(str)`` method.
+
+        Returns:
+            Number of characters written.
+        """
+        write = writer.write
+        written = 0
+        for piece in self.transliterate_iter(read_chunks(source)):
+            write(piece)
+            written += len(piece)
+        return written
+
+    # ── Pickling (used by process pools) ──
+
+    def __getstate__(self):
+        # Only the per-instance state travels; shared tables stay behind
+        cache = self._cache
+        return {
+            "cache_size": cache.maxsize if cache is not None else 0,
+            "custom": self._custom,
+            "lexicons": [lexicon.path for lexicon in self._lexicons],
+        }
 
-        return ' '.join(result)
+    def __setstate__(self, state):
+        self.__init__(cache_size=state["cache_size"])
+        self._custom = dict(state["custom"])
+        for path in state.get("lexicons", ()):
+            self.open_lexicon(path)
 
     # ── Internal ──
 
-    def _strip_punctuation(self, word):
-        prefix = ''
-        suffix = ''
-        while word and not word[0].isalnum():
-            prefix += word[0]
-            word = word[1:]
-        while word and not word[-1].isalnum():
-            suffix = word[-1] + suffix
-            word = word[:-1]
-        return prefix, word, suffix
-
-    def _match_consonant(self, text, pos):
-        for length in (5, 4, 3, 2, 1):
-            chunk = text[pos:pos + length]
-            if chunk in self._consonants:
-                return chunk, self._consonants[chunk]
-        return None, None
-
-    def _match_matra(self, text, pos):
-        for length in (2, 1):
-            chunk = text[pos:pos + length]
-            if chunk in self._matras:
-                return chunk, self._matras[chunk]
-        return None, None
-
-    def _match_vowel(self, text, pos):
-        for length in (2, 1):
-            chunk = text[pos:pos + length]
-            if chunk in self._vowels:
-                return chunk, self._vowels[chunk]
-        return None, None
+    def _publish(self, entries):
+        # Copy-on-write: readers always see a complete snapshot of the
+        # custom words, and the swap itself is a single attribute store.
+        with self._write_lock:
+            snapshot = dict(self._custom)
+            snapshot.update(entries)
+            self._custom = snapshot
+        if self._cache is not None:
+            self._cache.clear()
+
+    def _convert_tokens(self, tokens):
+        # ``tokens`` are (prefix, core, suffix) tuples from the tokenizer
+        convert = self._convert_word
+        table = _SUFFIX_TABLE
+        result = []
+        for prefix, core, suffix in tokens:
+            if core:
+                result.append(prefix + convert(core) + suffix.translate(table))
+            else:
+                result.append(prefix)
+        return result
+
+    def _convert_words(self, words):
+        # Bulk hook used by batch conversion; subclasses may vectorize it
+        convert = self._convert_word
+        return [convert(word) for word in words]
+
+    def _sub_token(self, match):
+        prefix, core, suffix = match.groups()
+        if core:
+            return prefix + self._convert_word(core) + suffix.translate(_SUFFIX_TABLE)
+        return prefix
 
     def _convert_word(self, word):
         lower = word.lower().strip()
@@ -187,12 +504,87 @@ class RomanToHindi:
             return word
 
         # Dictionary lookup
-        if lower in self._dictionary:
-            return self._dictionary[lower]
+        custom = self._custom
+        if lower in custom:
+            return custom[lower]
+        if lower in self._base:
+            return self._base[lower]
         if lower in self._specials:
             return self._specials[lower]
 
-        # Character-level transliteration
+        cache = self._cache
+        if cache is None:
+            return self._convert_unknown(lower)
+        converted = cache.get(lower)
+        if converted is None:
+            converted = self._convert_unknown(lower)
+            cache.put(lower, converted)
+        return converted
+
+    def _classify_word(self, word):
+        # Stats: the counter a lookup of ``word`` stops at before the
+        # out-of-dictionary path, mirroring _convert_word
+        lower = word.lower().strip()
+        if lower in self._custom or lower in self._base:
+            return "dictionary_hits"
+        if lower in self._specials:
+            return "special_hits"
+        if lower and self._cache is not None and lower in self._cache:
+            return "cache_hits"
+        return None
+
+    def _convert_unknown(self, lower):
+        # Out-of-dictionary word: attached lexicons, a dictionary stem with
+        # a known suffix, then the character rules
+        for lexicon in self._lexicons:
+            converted = lexicon.get(lower)
+            if converted is not None:
+                return converted
+        if lower[-1] in _INFLECTION_TRIE:
+            converted = self._convert_inflected(lower)
+            if converted is not None:
+                return converted
+        return self._convert_chars(lower)
+
+    def _convert_inflected(self, lower):
+        # Collect every suffix ending ``lower`` that leaves a long enough
+        # stem, then try them longest first
+        node = _INFLECTION_TRIE
+        splits = []
+        i = len(lower)
+        while i > _MIN_STEM:
+            entry = node.get(lower[i - 1])
+            if entry is None:
+                break
+            i -= 1
+            if entry[0] is not None:
+                splits.append((i, entry[0]))
+            node = entry[1]
+        if not splits:
+            return None
+
+        custom = self._custom
+        base = self._base
+        for end, (suffix, stems) in reversed(splits):
+            stem = lower[:end]
+            for restore, drop in stems:
+                key = stem + restore
+                hindi = custom.get(key)
+                if hindi is None and key not in _NOT_STEMS:
+                    hindi = base.get(key)
+                if hindi is None or not hindi.endswith(drop):
+                    continue
+                if drop:
+                    hindi = hindi[:-len(drop)]
+                if not hindi:
+                    continue
+                if 'ा' <= suffix[0] <= 'ौ' and not _ends_in_consonant(hindi):
+                    continue
+                return hindi + suffix
+        return None
+
+    def _convert_chars(self, lower):
+        # Character-level transliteration (trie-driven longest match)
         result = []
         i = 0
         length = len(lower)
@@ -203,7 +595,7 @@ class RomanToHindi:
 
             # Digit
             if ch.isdigit():
-                result.append(self._digits.get(ch, ch))
+                result.append(_DIGITS.get(ch, ch))
                 last_was_consonant = False
                 i += 1
                 continue
@@ -224,36 +616,29 @@ class RomanToHindi:
                     continue
 
             # Consonant
-            cons_match, cons_dev = self._match_consonant(lower, i)
-            if cons_match:
+            matched, cons_dev = _longest_match(_CONSONANT_TRIE, lower, i, length)
+            if matched:
                 if last_was_consonant:
                     result.append('्')
                 result.append(cons_dev)
-                i += len(cons_match)
+                i += matched
 
                 if i < length:
-                    matra_match, matra_dev = self._match_matra(lower, i)
-                    if matra_match:
-                        result.append(matra_dev)
-                        i += len(matra_match)
+                    matched, vowel = _longest_match(_VOWEL_TRIE, lower, i, length)
+                    if matched:
+                        result.append(vowel[1])
+                        i += matched
                         last_was_consonant = False
                         continue
 
                 last_was_consonant = True
                 continue
 
-            # Vowel
-            vowel_match, vowel_dev = self._match_vowel(lower, i)
-            if vowel_match:
-                if last_was_consonant:
-                    matra_match, matra_dev = self._match_matra(lower, i)
-                    if matra_match:
-                        result.append(matra_dev)
-                        i += len(matra_match)
-                        last_was_consonant = False
-                        continue
-                result.append(vowel_dev)
-                i += len(vowel_match)
+            # Vowel (matra when it follows a bare consonant)
+            matched, vowel = _longest_match(_VOWEL_TRIE, lower, i, length)
+            if matched:
+                result.append(vowel[1] if last_was_consonant else vowel[0])
+                i += matched
                 last_was_consonant = False
                 continue
 
@@ -0,0 +1,176 @@
+"""
+hinlang.snapshot
+=================
+
+Persistent engine snapshots for fast process start.
+
+Building an engine with a large custom dictionary means reading the
+word file and normalizing every entry through ``add_words`` on each
+start. :func:`load_engine` does that once, saves the built engine state
+(the custom-word overlay) to a versioned snapshot file, and afterwards
+restores it with a single read and unpickle.
+
+Snapshots are keyed on a hash of everything they are built from: the
+package version, the snapshot format, the engine class, the engine and
+dictionary sources, and the bytes of the custom word file. Any change
+produces a new key, so a stale snapshot is never loaded; it is simply
+rebuilt. The phonetic tables are module-level and built at import, so
+they are not part of the snapshot.
+
+Usage::
+
+    from hinlang import RomanToHindi
+    from hinlang.snapshot import load_engine
+
+    converter = load_engine(RomanToHindi, words="slang.tsv", cache_size=4096)
+
+A snapshot file is a header line (magic, format, key and the SHA-256
+of the payload) followed by the pickled state. The digest is checked
+before unpickling, so a truncated or corrupted file is rebuilt instead
+of loading wrong words. Snapshots are still pickles: keep the cache
+directory private to the service.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+
+# Bump when the snapshot layout changes
+FORMAT_VERSION = 2
+
+_MAGIC = b"HINLANG-SNAPSHOT"
+
+# Package sources the engine state is derived from
+_SOURCES = ("roman_to_hindi.py", "hindi_to_roman.py", "dictionary.py")
+
+
+def default_cache_dir() -> str:
+    """``$HINLANG_CACHE_DIR``, or ``~/.cache/hinlang``."""
+    return os.environ.get("HINLANG_CACHE_DIR") or os.path.join(
+        os.path.expanduser("~"), ".cache", "hinlang"
+    )
+
+
+def snapshot_key(cls, words: bytes = b"") -> str:
+    """
+    Return the hex key of a snapshot of ``cls`` built from ``words``.
+
+    Args:
+        cls: Engine class.
+        words: Raw bytes of the custom word file (``b""`` for none).
+
+    Raises:
+        OSError: If the package sources cannot be read (e.g. an install
+            with only ``.pyc`` files, or a zipped or frozen one).
+    """
+    from hinlang import __version__
+
+    digest = hashlib.sha256()
+    digest.update(("%s|%d|%s.%s|" % (
+        __version__, FORMAT_VERSION, cls.__module__, cls.__qualname__,
+    )).encode("utf-8"))
+    package = os.path.dirname(os.path.abspath(__file__))
+    for name in _SOURCES:
+        with open(os.path.join(package, name), "rb") as f:
+            digest.update(f.read())
+    digest.update(words)
+    return digest.hexdigest()
+
+
+def load_engine(cls, words=None, cache_dir=None, cache_size: int = 0):
+    """
+    Build an engine with custom words, or restore it from a snapshot.
+
+    Args:
+        cls: ``RomanToHindi``, ``HindiToRoman`` or a subclass.
+        words: Optional custom word file: a JSON object, or
+            ``key<TAB>value`` lines (``.tsv`` or any other extension).
+        cache_dir: Snapshot directory (default: :func:`default_cache_dir`).
+        cache_size: Word-cache size of the returned engine.
+
+    Returns:
+        An engine equivalent to ``cls(cache_size)`` after
+        ``add_words(<words>)``.
+
+    A snapshot that cannot be read (missing, corrupt, other format) is
+    rebuilt; one that cannot be written (e.g. a read-only directory) is
+    skipped, and the freshly built engine is returned either way. When
+    the package sources are not readable, no snapshot is used at all.
+    """
+    raw = b""
+    if words is not None:
+        with open(words, "rb") as f:
+            raw = f.read()
+
+    try:
+        key = snapshot_key(cls, raw)
+    except OSError:
+        # No readable sources to key on: always build, never snapshot
+        key = path = None
+    else:
+        directory = cache_dir or default_cache_dir()
+        path = os.path.join(directory, "%s-%s.snapshot" % (cls.__name__, key[:32]))
+        engine = _restore(cls, path, key, cache_size)
+        if engine is not None:
+            return engine
+
+    engine = cls(cache_size=cache_size)
+    if words is not None:
+        engine.add_words(_parse_words(words, raw))
+    if path is not None:
+        _save(engine, path, key)
+    return engine
+
+
+def _parse_words(name, raw):
+    text = raw.decode("utf-8")
+    if str(name).endswith(".json"):
+        return json.loads(text)
+    from hinlang.lexicon import read_tsv
+    return dict(read_tsv(text.splitlines()))
+
+
+def _restore(cls, path, key, cache_size):
+    try:
+        with open(path, "rb") as f:
+            header = f.readline(256)
+            payload = f.read()
+    except OSError:
+        return None
+    expected = b"%s %d %s " % (_MAGIC, FORMAT_VERSION, key.encode("ascii"))
+    if not header.startswith(expected) \
+            or header[len(expected):].rstrip(b"\n") != _digest(payload):
+        return None
+
+    # The digest matched, so this only fails for a file that was written
+    # wrong in the first place; rebuild rather than fail the start
+    try:
+        state = dict(pickle.loads(payload), cache_size=cache_size)
+        engine = cls.__new__(cls)
+        engine.__setstate__(state)
+    except Exception:
+        return None
+    return engine
+
+
+def _digest(payload):
+    return hashlib.sha256(payload).hexdigest().encode("ascii")
+
+
+def _save(engine, path, key):
+    payload = pickle.dumps(engine.__getstate__(), pickle.HIGHEST_PROTOCOL)
+    header = b"%s %d %s %s\n" % (_MAGIC, FORMAT_VERSION, key.encode("ascii"), _digest(payload))
+    temp = "%s.%d.tmp" % (path, os.getpid())
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(temp, "wb") as f:
+            f.write(header)
+            f.write(payload)
+        # Atomic: concurrent starters never see a half-written snapshot
+        os.replace(temp, path)
+    except OSError:
+        try:
+            os.remove(temp)
+        except OSError:
+            pass
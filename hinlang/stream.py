@@ -0,0 +1,118 @@
+"""
+hinlang.stream
+===============
+
+Incremental, whitespace-preserving transliteration.
+
+Unlike ``transliterate``, which splits on whitespace and re-joins with
+single spaces, the helpers here keep every space, tab and newline of the
+input exactly and never hold more than one chunk (plus the word that
+straddles the chunk boundary) in memory.
+
+Usage::
+
+    from hinlang import RomanToHindi
+
+    converter = RomanToHindi()
+    with open("chat.log", encoding="utf-8") as src, \\
+            open("chat.hi.log", "w", encoding="utf-8") as dst:
+        converter.transliterate_to(src, dst)
+"""
+
+# Characters read per ``read()`` call when streaming from a file object
+CHUNK_SIZE = 1 << 16
+
+
+def read_chunks(source, size: int = CHUNK_SIZE):
+    """
+    Yield text chunks from a string, a file object or an iterable.
+
+    - A ``str`` is yielded as-is.
+    - An object with ``read()`` is read ``size`` characters at a time.
+    - Anything else is treated as an iterable of strings.
+    """
+    if isinstance(source, str):
+        yield source
+    elif hasattr(source, "read"):
+        read = source.read
+        while True:
+            chunk = read(size)
+            if not chunk:
+                break
+            yield chunk
+    else:
+        for chunk in source:
+            yield chunk
+
+
+class ChunkSplitter:
+    """
+    Re-cut arbitrary text chunks at whitespace boundaries.
+
+    ``feed()`` returns the longest prefix of the text seen so far that
+    ends in whitespace (so no word in it can continue in a later chunk)
+    and keeps the unfinished tail for the next call. ``flush()`` returns
+    whatever is left at end of input.
+    """
+
+    def __init__(self):
+        self._carry = []
+
+    def feed(self, chunk: str) -> str:
+        """Add ``chunk`` and return the text that is now complete (maybe ``''``)."""
+        if not chunk:
+            return ""
+
+        # Everything up to the last whitespace character is complete
+        cut = len(chunk)
+        while cut and not chunk[cut - 1].isspace():
+            cut -= 1
+
+        carry = self._carry
+        if cut == 0:
+            carry.append(chunk)
+            return ""
+
+        head = chunk[:cut]
+        if carry:
+            carry.append(head)
+            head = "".join(carry)
+            carry = self._carry = []
+        if cut < len(chunk):
+            carry.append(chunk[cut:])
+        return head
+
+    def flush(self) -> str:
+        """Return the unfinished tail and reset."""
+        tail = "".join(self._carry)
+        self._carry = []
+        return tail
+
+
+def iter_transliterate(pattern, repl, chunks):
+    """
+    Rewrite every token of ``chunks`` with ``repl``, chunk by chunk.
+
+    Args:
+        pattern: Compiled token pattern (``Tokenizer.pattern``). It never
+            matches whitespace, so whitespace is copied through verbatim.
+        repl: Callable taking a token match and returning its conversion.
+        chunks: Iterable of text chunks.
+
+    Yields:
+        Converted text pieces. Concatenated, they form the full output.
+
+    A token that is cut by a chunk boundary is carried over and converted
+    once the next chunk completes it.
+    """
+    sub = pattern.sub
+    splitter = ChunkSplitter()
+
+    for chunk in chunks:
+        head = splitter.feed(chunk)
+        if head:
+            yield sub(repl, head)
+
+    tail = splitter.flush()
+    if tail:
+        yield sub(repl, tail)
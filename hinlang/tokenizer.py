@@ -0,0 +1,73 @@
+"""
+hinlang.tokenizer
+==================
+
+Single-pass tokenizer shared by both transliteration engines.
+
+Text is split on whitespace and each token is broken into
+``(prefix, core, suffix)``: the leading punctuation, the word itself,
+and the trailing punctuation. The whole input is handled by one
+precompiled regular expression, so long punctuation runs (``"!!!!!!"``,
+emoji strings) cost linear time.
+
+Usage::
+
+    from hinlang.tokenizer import ROMAN_TOKENIZER
+
+    ROMAN_TOKENIZER.tokenize('"Kya!" haal...')
+    # [('"', 'Kya', '!"'), ('', 'haal', '...')]
+"""
+
+import re
+
+DEVANAGARI_RANGE = "\u0900-\u097F"
+
+
+class Tokenizer:
+    """
+    Precompiled ``(prefix, core, suffix)`` scanner.
+
+    A *word character* is any character for which ``str.isalnum()`` is
+    true, plus the characters in ``extra_word_chars`` (a regex character
+    class body such as ``"\\u0900-\\u097F"``). Everything else that is
+    not whitespace is treated as punctuation.
+
+    Args:
+        extra_word_chars: Additional character ranges counted as word
+            characters.
+    """
+
+    def __init__(self, extra_word_chars: str = ""):
+        if extra_word_chars:
+            word = "(?:[^\\W_]|[%s])" % extra_word_chars
+            punct = "(?:[^\\w\\s%s]|_)" % extra_word_chars
+        else:
+            word = "[^\\W_]"
+            punct = "(?:[^\\w\\s]|_)"
+
+        # The core runs from the first to the last word character of the
+        # token; ``\S*`` is greedy and only backtracks to that last word
+        # character, which keeps the scan linear.
+        self.pattern = re.compile(
+            "(?=\\S)(%s*)(%s(?:\\S*%s)?)?(%s*)" % (punct, word, word, punct)
+        )
+        self._findall = self.pattern.findall
+
+    def tokenize(self, text: str) -> list:
+        """
+        Split ``text`` into ``(prefix, core, suffix)`` tuples.
+
+        A token made only of punctuation is returned as
+        ``(token, '', '')``.
+
+        Example::
+
+            >>> ROMAN_TOKENIZER.tokenize("Hi!! ...")
+            [('', 'Hi', '!!'), ('...', '', '')]
+        """
+        return self._findall(text)
+
+
+# ── Shared instances ──
+ROMAN_TOKENIZER = Tokenizer()
+DEVANAGARI_TOKENIZER = Tokenizer(DEVANAGARI_RANGE)
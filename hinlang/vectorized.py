@@ -0,0 +1,228 @@
+"""
+hinlang.vectorized
+===================
+
+Optional NumPy-backed Devanagari → Roman engine.
+
+:class:`NumpyHindiToRoman` romanizes out-of-dictionary words in bulk:
+all words of a batch are laid end to end in one code-point array, every
+code point is classified through lookup tables indexed by its offset
+from U+0900, and the inherent-'a' and matra/virama decisions are made
+with shifted neighbour comparisons instead of a per-character loop.
+Output is identical to :class:`~hinlang.HindiToRoman`.
+
+NumPy is an optional extra::
+
+    pip install hinlangpy[numpy]
+
+Usage::
+
+    from hinlang.vectorized import NumpyHindiToRoman
+
+    converter = NumpyHindiToRoman()
+    converter.transliterate_batch(corpus_lines)
+"""
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None
+
+from hinlang.hindi_to_roman import (
+    HindiToRoman,
+    _AKSHARA_TABLE, _CONSONANT_MAP, _MATRA_MAP,
+)
+
+_BLOCK_START = 0x0900
+_BLOCK_SIZE = 0x80
+_VIRAMA = '्'
+
+# Lookup-table variants (multiples of _BLOCK_SIZE added to the offset)
+_PLAIN = 0            # character on its own
+_AFTER_CONSONANT = 1  # matra/virama attached to the preceding consonant
+_WITH_A = 2           # consonant followed by a Devanagari letter: inherent 'a'
+
+
+def _build_tables():
+    # Single-character romanizations come from the scalar akshara table
+    plain = [_AKSHARA_TABLE[chr(_BLOCK_START + offset)] for offset in range(_BLOCK_SIZE)]
+
+    after_consonant = list(plain)
+    with_a = list(plain)
+    is_consonant = [False] * _BLOCK_SIZE
+    is_mark = [False] * _BLOCK_SIZE
+    for offset in range(_BLOCK_SIZE):
+        ch = chr(_BLOCK_START + offset)
+        if ch in _MATRA_MAP:
+            after_consonant[offset] = _MATRA_MAP[ch]
+            is_mark[offset] = True
+        elif ch == _VIRAMA:
+            after_consonant[offset] = ''
+            is_mark[offset] = True
+        if ch in _CONSONANT_MAP:
+            with_a[offset] = _CONSONANT_MAP[ch] + 'a'
+            is_consonant[offset] = True
+
+    pieces = np.array(plain + after_consonant + with_a + [None], dtype=object)
+    return pieces, np.array(is_consonant), np.array(is_mark)
+
+
+_TABLES = None
+
+
+def _tables():
+    global _TABLES
+    if _TABLES is None:
+        _TABLES = _build_tables()
+    return _TABLES
+
+
+def romanize_words(words) -> list:
+    """
+    Character-level romanization of many words in one vectorized pass.
+
+    Equivalent to ``[HindiToRoman()._convert_chars(w) for w in words]``.
+
+    Args:
+        words: List of non-empty strings.
+
+    Returns:
+        List of romanized strings, in input order.
+    """
+    if not words:
+        return []
+    pieces_table, is_consonant, is_mark = _tables()
+
+    text = ''.join(words)
+    n = len(text)
+    cp = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32).astype(np.int64)
+
+    lengths = np.fromiter((len(w) for w in words), dtype=np.int64, count=len(words))
+    ends = np.cumsum(lengths)
+    starts = ends - lengths
+
+    offset = cp - _BLOCK_START
+    dev = (offset >= 0) & (offset < _BLOCK_SIZE)
+    offset[~dev] = 0
+
+    consonant = dev & is_consonant[offset]
+    mark = dev & is_mark[offset]
+
+    # Neighbours, never looking across a word boundary
+    prev_consonant = np.zeros(n, dtype=bool)
+    prev_consonant[1:] = consonant[:-1]
+    prev_consonant[starts] = False
+
+    next_dev = np.zeros(n, dtype=bool)
+    next_dev[:-1] = dev[1:]
+    next_mark = np.zeros(n, dtype=bool)
+    next_mark[:-1] = mark[1:]
+    next_dev[ends - 1] = False
+
+    variant = np.where(
+        consonant & next_dev & ~next_mark, _WITH_A,
+        np.where(mark & prev_consonant, _AFTER_CONSONANT, _PLAIN),
+    )
+    index = offset + variant * _BLOCK_SIZE
+    index[~dev] = 3 * _BLOCK_SIZE  # placeholder, filled with the raw char
+
+    pieces = pieces_table[index].tolist()
+    for i in np.flatnonzero(~dev).tolist():
+        pieces[i] = text[i]
+
+    return [''.join(pieces[a:b]) for a, b in zip(starts.tolist(), ends.tolist())]
+
+
+class NumpyHindiToRoman(HindiToRoman):
+    """
+    :class:`~hinlang.HindiToRoman` with a NumPy-vectorized character path.
+
+    Dictionary, custom words and caching behave exactly as in the base
+    class. Inputs whose out-of-dictionary words total fewer than
+    ``min_chars`` characters use the scalar path, where NumPy's per-call
+    overhead would not pay off.
+
+    Args:
+        cache_size: As for :class:`~hinlang.HindiToRoman`.
+        min_chars: Minimum characters to romanize before vectorizing.
+
+    Raises:
+        ImportError: If NumPy is not installed.
+    """
+
+    def __init__(self, cache_size: int = 0, min_chars: int = 256):
+        if np is None:
+            raise ImportError(
+                "NumpyHindiToRoman requires NumPy: pip install hinlangpy[numpy]"
+            )
+        super().__init__(cache_size=cache_size)
+        self.min_chars = min_chars
+
+    def transliterate(self, text: str) -> str:
+        """Transliterate ``text``, romanizing its unknown words in one pass."""
+        if not text:
+            return ""
+        tokens = self._tokenizer.tokenize(text)
+        cores = list(dict.fromkeys(core for _, core, _ in tokens if core))
+        vocab = dict(zip(cores, self._convert_words(cores)))
+        table = self._suffix_table
+        return ' '.join([
+            prefix + vocab[core] + suffix.translate(table) if core else prefix
+            for prefix, core, suffix in tokens
+        ])
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        state["min_chars"] = self.min_chars
+        return state
+
+    def __setstate__(self, state):
+        self.__init__(cache_size=state["cache_size"], min_chars=state["min_chars"])
+        self._custom = dict(state["custom"])
+        for path in state.get("lexicons", ()):
+            self.open_lexicon(path)
+
+    def _convert_words(self, words):
+        if self._stats is not None:
+            # Counted word by word on the scalar path
+            return super()._convert_words(words)
+        custom = self._custom
+        base = self._base
+        lexicons = self._lexicons
+        cache = self._cache
+        result = [None] * len(words)
+        pending = []
+        pending_chars = 0
+
+        for i, word in enumerate(words):
+            if word in custom:
+                result[i] = custom[word]
+            elif word in base:
+                result[i] = base[word]
+            else:
+                converted = cache.get(word) if cache is not None else None
+                if converted is None and lexicons:
+                    for lexicon in lexicons:
+                        converted = lexicon.get(word)
+                        if converted is not None:
+                            if cache is not None:
+                                cache.put(word, converted)
+                            break
+                if converted is None:
+                    pending.append(i)
+                    pending_chars += len(word)
+                else:
+                    result[i] = converted
+
+        if pending:
+            missing = [words[i] for i in pending]
+            if pending_chars >= self.min_chars:
+                converted = romanize_words(missing)
+            else:
+                converted = [self._convert_chars(w) for w in missing]
+            for i, word, roman in zip(pending, missing, converted):
+                result[i] = roman
+                if cache is not None:
+                    cache.put(word, roman)
+
+        return result
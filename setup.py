@@ -28,6 +28,9 @@ setup(
     packages=find_packages(exclude=["tests", "tests.*", "examples", "docs"]),
     python_requires=">=3.7",
     install_requires=[],  # Zero dependencies!
+    extras_require={
+        "numpy": ["numpy>=1.17"],  # Optional vectorized HindiToRoman
+    },
     entry_points={
         "console_scripts": [
             "hinlangpy=hinlang.cli:main",
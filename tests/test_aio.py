@@ -0,0 +1,99 @@
+"""Tests for the asyncio API."""
+
+import asyncio
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import pytest
+
+import hinlang
+from hinlang import RomanToHindi
+from hinlang.aio import Offload, atransliterate, aiter_transliterate
+
+
+def run(coro):
+    return asyncio.new_event_loop().run_until_complete(coro)
+
+
+class TestAsyncConvert:
+    """Test ato_hindi / ato_roman / aconvert."""
+
+    def test_ato_hindi(self):
+        assert run(hinlang.ato_hindi("Namaste Dosto")) == "नमस्ते दोस्तो"
+
+    def test_ato_roman(self):
+        assert run(hinlang.ato_roman("नमस्ते दोस्तो")) == "namaste dosto"
+
+    def test_aconvert(self):
+        assert run(hinlang.aconvert("Kya haal hai")) == "क्या हाल है"
+        assert run(hinlang.aconvert("क्या हाल है")) == "kya haal hai"
+
+    def test_matches_sync_across_slices(self):
+        text = "Kya haal hai!  zorawar\tdost... " * 50
+        assert run(hinlang.ato_hindi(text, yield_every=7)) == hinlang.to_hindi(text)
+
+    def test_yields_to_loop(self):
+        ticks = []
+
+        async def ticker():
+            for _ in range(5):
+                ticks.append(1)
+                await asyncio.sleep(0)
+
+        async def main():
+            task = asyncio.ensure_future(ticker())
+            await hinlang.ato_hindi("dost " * 100, yield_every=10)
+            done_ticks = len(ticks)
+            await task
+            return done_ticks
+
+        assert run(main()) > 0
+
+    def test_offload(self):
+        offload = Offload(max_concurrent=2, min_chars=1)
+        converter = RomanToHindi()
+
+        async def main():
+            texts = ["Shukriya dost"] * 6
+            return await asyncio.gather(
+                *(atransliterate(converter, t, offload=offload) for t in texts)
+            )
+
+        assert run(main()) == ["शुक्रिया दोस्त"] * 6
+
+    def test_invalid_yield_every(self):
+        with pytest.raises(ValueError):
+            run(hinlang.ato_hindi("dost", yield_every=0))
+
+
+class TestAsyncIter:
+    """Test async-iterator streaming."""
+
+    def test_sync_chunks(self):
+        async def main():
+            return [p async for p in hinlang.aiter_hindi(["Nam", "aste\n  Do", "sto"])]
+
+        assert "".join(run(main())) == "नमस्ते\n  दोस्तो"
+
+    def test_async_chunks(self):
+        async def source():
+            for chunk in ["नमस्ते ", "दो", "स्तो\n"]:
+                yield chunk
+
+        async def main():
+            return [p async for p in hinlang.aiter_roman(source())]
+
+        assert "".join(run(main())) == "namaste dosto\n"
+
+    def test_splits_large_chunk(self):
+        async def main():
+            return [p async for p in aiter_transliterate(RomanToHindi(), ["a b c d e "], 2)]
+
+        pieces = run(main())
+        assert len(pieces) == 3
+        assert "".join(pieces) == "अ ब क द ए "
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,56 @@
+"""Tests for vocabulary-deduplicated batch conversion."""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import hinlang
+from hinlang import RomanToHindi, HindiToRoman
+from hinlang.batch import transliterate_deduped
+
+
+class CountingRomanToHindi(RomanToHindi):
+    """Engine that records every core word it converts."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.calls = []
+
+    def _convert_word(self, word):
+        self.calls.append(word)
+        return super()._convert_word(word)
+
+
+class TestDedupedBatch:
+    """Test transliterate_deduped and the default batch path."""
+
+    def test_matches_per_text(self):
+        texts = ["Kya haal hai!", "", "kya HAAL hai", "(dost) dost...", "!!!", "Kya haal hai!"]
+        engine = RomanToHindi()
+        expected = [engine.transliterate(t) for t in texts]
+        assert transliterate_deduped(engine, texts) == expected
+        assert hinlang.to_hindi_batch(texts) == expected
+
+    def test_each_core_converted_once(self):
+        engine = CountingRomanToHindi()
+        transliterate_deduped(engine, ["dost dost!", "(dost) yaar", "yaar dost"])
+        assert sorted(engine.calls) == ["dost", "yaar"]
+
+    def test_repeated_outputs_are_shared(self):
+        result = hinlang.to_roman_batch(["नमस्ते दोस्तो", "नमस्ते  दोस्तो", "नमस्ते दोस्तो"])
+        assert result[0] is result[1] is result[2]
+
+    def test_opt_out(self):
+        engine = CountingRomanToHindi()
+        engine.transliterate_batch(["dost dost"], dedupe=False)
+        assert engine.calls == ["dost", "dost"]
+
+    def test_h2r(self):
+        texts = ["मेरा नाम रंजन है।", "मेरा नाम"] * 3
+        engine = HindiToRoman()
+        assert engine.transliterate_batch(texts) == [engine.transliterate(t) for t in texts]
+
+
+if __name__ == "__main__":
+    import pytest
+    pytest.main([__file__, "-v"])
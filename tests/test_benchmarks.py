@@ -0,0 +1,99 @@
+"""Smoke tests for the benchmark suite and its corpus generator."""
+
+import sys
+import os
+import json
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'benchmarks'))
+
+import pytest
+
+from hinlang import detect_script
+from corpus import zipf_messages, zipf_vocab
+import bench_import_time
+import bench_suite
+
+
+class TestCorpus:
+    """Test the synthetic Zipfian corpus generator."""
+
+    def test_deterministic(self):
+        first = zipf_messages(50, vocab_size=500, seed=1)
+        assert first == zipf_messages(50, vocab_size=500, seed=1)
+        assert first != zipf_messages(50, vocab_size=500, seed=2)
+
+    def test_vocab_size(self):
+        assert len(zipf_vocab(100)) == 100
+        assert len(set(zipf_vocab(5000))) > 4000
+
+    def test_scripts(self):
+        assert {detect_script(m) for m in zipf_messages(50, 500, script="roman")} == {"roman"}
+        devanagari = zipf_messages(50, 500, script="devanagari")
+        assert {detect_script(m) for m in devanagari} == {"devanagari"}
+        mixed = ' '.join(zipf_messages(200, 500, script="mixed", mix=0.5))
+        assert detect_script(mixed) == "mixed"
+
+    def test_unknown_script(self):
+        with pytest.raises(ValueError):
+            zipf_messages(1, script="latin")
+
+
+class TestBenchSuite:
+    """Test the benchmark suite on a tiny corpus."""
+
+    def test_percentile(self):
+        values = list(range(100))
+        assert bench_suite.percentile(values, 0.5) == 50
+        assert bench_suite.percentile(values, 0.99) == 99
+        assert bench_suite.percentile([], 0.5) == 0.0
+
+    def test_calls_keep_every_latency(self):
+        # Two slow calls in the last round must reach p99
+        count = [0]
+
+        def func(text):
+            count[0] += 1
+            if count[0] > 298:
+                time.sleep(0.01)
+
+        stats = bench_suite.bench_calls(func, ["ek do"] * 100, repeat=2)
+        assert count[0] == 300    # warm-up round + 2 timed rounds
+        assert stats["calls"] == 200
+        assert stats["tokens"] == 400
+        assert stats["p99_us"] >= 10000 > stats["p50_us"]
+        assert stats["seconds"] >= 0.02
+        assert stats["tokens_per_sec"] == pytest.approx(400 / stats["seconds"])
+
+    def test_json_output(self, tmp_path):
+        path = tmp_path / "results.json"
+        bench_suite.main(["--messages", "20", "--vocab", "500", "--repeat", "1",
+                          "--output", str(path)])
+        results = json.loads(path.read_text(encoding="utf-8"))
+        assert results["schema"] == bench_suite.SCHEMA_VERSION
+        assert set(results["calls"]) == {"to_hindi", "to_roman", "convert", "detect_script"}
+        assert set(results["batch"]) == {"to_hindi_batch", "to_roman_batch"}
+        for stats in results["calls"].values():
+            assert stats["calls"] == 20
+            assert stats["p99_us"] >= stats["p50_us"] > 0
+        for paths in results["paths"].values():
+            assert paths["dictionary"]["words"] > 0
+            assert paths["character"]["words"] > 0
+
+
+class TestImportTime:
+    """Test the import-time budget check without timing anything."""
+
+    def test_cumulative_us(self):
+        stderr = (
+            "import time: self [us] | cumulative | imported package\n"
+            "import time:       120 |        120 |   hinlang.tokenizer\n"
+            "import time:       310 |       2480 | hinlang\n"
+        )
+        assert bench_import_time.cumulative_us(stderr, "hinlang") == 2480
+        with pytest.raises(ValueError):
+            bench_import_time.cumulative_us(stderr, "hinlang.dictionary")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,108 @@
+"""Tests for the per-word LRU cache."""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import pytest
+
+from hinlang import RomanToHindi, HindiToRoman
+from hinlang.cache import WordCache
+
+
+class TestWordCache:
+    """Test the WordCache LRU directly."""
+
+    def test_hit_and_miss(self):
+        cache = WordCache(maxsize=4)
+        assert cache.get("dosto") is None
+        cache.put("dosto", "दोस्तो")
+        assert cache.get("dosto") == "दोस्तो"
+        info = cache.info()
+        assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+    def test_eviction_is_lru(self):
+        cache = WordCache(maxsize=2)
+        cache.put("a", "1")
+        cache.put("b", "2")
+        cache.get("a")
+        cache.put("c", "3")
+        assert cache.get("b") is None
+        assert cache.get("a") == "1"
+        assert cache.info().evictions == 1
+
+    def test_unread_entries_evicted_first(self):
+        cache = WordCache(maxsize=3)
+        for key in "abc":
+            cache.put(key, key.upper())
+        cache.get("a")
+        cache.get("b")
+        cache.put("d", "D")
+        assert len(cache) == 3
+        assert cache.get("c") is None
+        cache.put("e", "E")    # a and b were moved behind d
+        assert cache.get("d") is None
+        assert cache.get("a") == "A"
+
+    def test_hits_do_not_lock(self):
+        cache = WordCache(maxsize=4)
+        cache.put("dosto", "दोस्तो")
+
+        class Locked:
+            def __enter__(self):
+                raise AssertionError("lock taken on a read")
+
+        cache._lock = Locked()
+        assert cache.get("dosto") == "दोस्तो"
+        assert cache.get("dosto") == "दोस्तो"
+        assert cache.get("ghar") is None
+
+    def test_invalid_size(self):
+        with pytest.raises(ValueError):
+            WordCache(maxsize=0)
+
+
+class TestEngineCache:
+    """Test caching inside the engines."""
+
+    def test_disabled_by_default(self):
+        assert RomanToHindi().cache_info() is None
+        assert HindiToRoman().cache_info() is None
+
+    def test_repeated_word_hits(self):
+        converter = RomanToHindi(cache_size=16)
+        first = converter.transliterate("zorawar zorawar")
+        assert first == "ज़ोरवर ज़ोरवर"
+        info = converter.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
+    def test_dictionary_words_bypass_cache(self):
+        converter = HindiToRoman(cache_size=16)
+        converter.transliterate("नमस्ते")
+        assert converter.cache_info().currsize == 0
+
+    def test_add_word_clears_cache(self):
+        converter = RomanToHindi(cache_size=16)
+        converter.transliterate("bruh")
+        assert converter.cache_info().currsize == 1
+        converter.add_word("bruh", "ब्रह")
+        assert converter.cache_info().currsize == 0
+        assert converter.transliterate("bruh") == "ब्रह"
+
+    def test_add_words_clears_cache(self):
+        converter = HindiToRoman(cache_size=16)
+        converter.transliterate("ब्रह")
+        converter.add_words({"ब्रह": "bruh"})
+        assert converter.cache_info().currsize == 0
+        assert converter.transliterate("ब्रह") == "bruh"
+
+    def test_singletons_cached(self):
+        import hinlang
+        hinlang.to_hindi("Namaste")
+        hinlang.to_roman("नमस्ते")
+        assert hinlang._get_r2h().cache_info() is not None
+        assert hinlang._get_h2r().cache_info() is not None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,171 @@
+"""Tests for the hinlangpy command-line interface."""
+
+import sys
+import os
+import io
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import pytest
+
+from hinlang import cli
+
+
+def run_cli(monkeypatch, capsys, *argv, stdin=None):
+    monkeypatch.setattr(sys, "argv", ["hinlangpy", *argv])
+    if stdin is not None:
+        monkeypatch.setattr(sys, "stdin", io.StringIO(stdin))
+    cli.main()
+    return capsys.readouterr()
+
+
+class FlushCounter(io.StringIO):
+    """StringIO that records how often it was flushed."""
+
+    flushes = 0
+
+    def flush(self):
+        self.flushes += 1
+
+
+class TestTextMode:
+    """Test converting text given as arguments."""
+
+    def test_auto(self, monkeypatch, capsys):
+        assert run_cli(monkeypatch, capsys, "Namaste", "Dosto").out == "नमस्ते दोस्तो\n"
+
+    def test_forced(self, monkeypatch, capsys):
+        assert run_cli(monkeypatch, capsys, "-R", "नमस्ते").out == "namaste\n"
+
+
+class TestStreaming:
+    """Test streaming stdin and --file input."""
+
+    def test_stdin_preserves_whitespace(self, monkeypatch, capsys):
+        out = run_cli(monkeypatch, capsys, stdin="Namaste  dosto\n\n\tkya haal hai\n").out
+        assert out == "नमस्ते  दोस्तो\n\n\tक्या हाल है\n"
+
+    def test_direction_per_line(self, monkeypatch, capsys):
+        out = run_cli(monkeypatch, capsys, stdin="Namaste dosto\nनमस्ते दोस्तो\n").out
+        assert out == "नमस्ते दोस्तो\nnamaste dosto\n"
+
+    def test_forced_direction(self, monkeypatch, capsys):
+        out = run_cli(monkeypatch, capsys, "--to-hindi", stdin="namaste\nnamaste").out
+        assert out == "नमस्ते\nनमस्ते"
+
+    def test_long_line_in_pieces(self, monkeypatch, capsys):
+        import hinlang.stream
+
+        monkeypatch.setattr(hinlang.stream, "CHUNK_SIZE", 5)
+        line = "namaste dosto kya haal hai " * 20 + "\n"
+        out = run_cli(monkeypatch, capsys, stdin=line * 2).out
+        assert out == ("नमस्ते दोस्तो क्या हाल है " * 20 + "\n") * 2
+
+    def test_line_buffered_flushes(self, monkeypatch):
+        import argparse
+        import hinlang
+
+        out = FlushCounter()
+        args = argparse.Namespace(force_hindi=False, force_roman=False, line_buffered=True)
+        cli._stream(hinlang, args, io.StringIO("namaste\ndosto\nkya\n"), out)
+        assert out.getvalue() == "नमस्ते\nदोस्तो\nक्या\n"
+        assert out.flushes == 3
+
+    def test_file_to_file(self, monkeypatch, capsys, tmp_path):
+        src = tmp_path / "in.txt"
+        dst = tmp_path / "out.txt"
+        src.write_bytes("Namaste dosto\r\nनमस्ते\r\n".encode("utf-8"))
+        out = run_cli(monkeypatch, capsys, "--file", str(src), "--output", str(dst)).out
+        assert out.startswith("Translated:")
+        assert dst.read_bytes() == "नमस्ते दोस्तो\r\nnamaste\r\n".encode("utf-8")
+
+    def test_file_to_stdout(self, monkeypatch, capsys, tmp_path):
+        src = tmp_path / "in.txt"
+        src.write_text("kya haal hai\n", encoding="utf-8")
+        assert run_cli(monkeypatch, capsys, "-f", str(src)).out == "क्या हाल है\n"
+
+    def test_missing_file(self, monkeypatch, capsys, tmp_path):
+        with pytest.raises(SystemExit):
+            run_cli(monkeypatch, capsys, "--file", str(tmp_path / "missing.txt"))
+        assert "File not found" in capsys.readouterr().err
+
+
+class TestParallelFileMode:
+    """Test --jobs on a single file."""
+
+    def test_jobs_matches_serial(self, monkeypatch, capsys, tmp_path):
+        src = tmp_path / "in.txt"
+        src.write_text("Namaste dosto\nनमस्ते  दोस्तो\nkya haal hai", encoding="utf-8")
+        serial = tmp_path / "serial.txt"
+        parallel = tmp_path / "parallel.txt"
+        run_cli(monkeypatch, capsys, "-f", str(src), "-o", str(serial))
+        err = run_cli(monkeypatch, capsys, "-f", str(src), "-o", str(parallel), "--jobs", "2").err
+        assert parallel.read_bytes() == serial.read_bytes()
+        assert "MB/s" in err
+
+    def test_jobs_to_stdout(self, monkeypatch, capsysbinary, tmp_path):
+        src = tmp_path / "in.txt"
+        src.write_text("namaste\n", encoding="utf-8")
+        monkeypatch.setattr(sys, "argv", ["hinlangpy", "-H", "-f", str(src), "-j", "2"])
+        cli.main()
+        assert capsysbinary.readouterr().out == "नमस्ते\n".encode("utf-8")
+
+    def test_jobs_requires_file(self, monkeypatch, capsys):
+        with pytest.raises(SystemExit):
+            run_cli(monkeypatch, capsys, "--jobs", "2", "namaste")
+
+
+class TestDirectoryMode:
+    """Test --input-dir/--output-dir."""
+
+    def make_tree(self, root):
+        (root / "a" / "b").mkdir(parents=True)
+        (root / "top.txt").write_text("Namaste dosto\n", encoding="utf-8")
+        (root / "a" / "b" / "deep.txt").write_text("नमस्ते\nkya haal", encoding="utf-8")
+        (root / "a" / "notes.md").write_text("namaste\n", encoding="utf-8")
+
+    @pytest.mark.parametrize("jobs", ["1", "2"])
+    def test_tree_preserved(self, monkeypatch, capsys, tmp_path, jobs):
+        src, dst = tmp_path / "in", tmp_path / "out"
+        self.make_tree(src)
+        err = run_cli(monkeypatch, capsys, "--input-dir", str(src), "--output-dir", str(dst),
+                      "--jobs", jobs).err
+        assert (dst / "top.txt").read_text(encoding="utf-8") == "नमस्ते दोस्तो\n"
+        assert (dst / "a" / "b" / "deep.txt").read_text(encoding="utf-8") == "namaste\nक्या हाल"
+        assert not (dst / "a" / "notes.md").exists()
+        assert err.startswith("Converted 2 files")
+        assert "files/s" in err
+
+    def test_glob(self, monkeypatch, capsys, tmp_path):
+        src, dst = tmp_path / "in", tmp_path / "out"
+        self.make_tree(src)
+        run_cli(monkeypatch, capsys, "--input-dir", str(src), "--output-dir", str(dst),
+                "--glob", "*.md")
+        assert [p.name for p in dst.rglob("*") if p.is_file()] == ["notes.md"]
+
+    def test_output_inside_input(self, monkeypatch, capsys, tmp_path):
+        self.make_tree(tmp_path)
+        dst = tmp_path / "out"
+        argv = ("--input-dir", str(tmp_path), "--output-dir", str(dst))
+        run_cli(monkeypatch, capsys, *argv)
+        err = run_cli(monkeypatch, capsys, *argv).err
+        assert err.startswith("Converted 2 files")
+        assert not (dst / "out").exists()
+
+    def test_failed_file_exits_nonzero(self, monkeypatch, capsys, tmp_path):
+        src = tmp_path / "in"
+        self.make_tree(src)
+        (src / "bad.txt").write_bytes(b"\xff")
+        with pytest.raises(SystemExit):
+            run_cli(monkeypatch, capsys, "--input-dir", str(src),
+                    "--output-dir", str(tmp_path / "out"))
+        err = capsys.readouterr().err
+        assert "bad.txt" in err
+        assert "1 failed" in err
+
+    def test_requires_output_dir(self, monkeypatch, capsys, tmp_path):
+        with pytest.raises(SystemExit):
+            run_cli(monkeypatch, capsys, "--input-dir", str(tmp_path))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
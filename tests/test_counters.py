@@ -0,0 +1,199 @@
+"""Tests for the opt-in runtime counters."""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import pytest
+
+import hinlang
+from hinlang import RomanToHindi, HindiToRoman
+from hinlang.counters import Stats, format_stats
+
+
+@pytest.fixture
+def module_stats():
+    hinlang.enable_stats()
+    yield
+    hinlang.enable_stats(False)
+
+
+class TestEngineStats:
+    """Test per-engine counters."""
+
+    def test_disabled_by_default(self):
+        converter = RomanToHindi()
+        assert converter.stats() is None
+        converter.transliterate("Namaste dosto")
+        assert converter.stats() is None
+
+    def test_roman_stages(self):
+        converter = RomanToHindi(cache_size=16)
+        converter.enable_stats()
+        converter.transliterate("Namaste om gharon xyzzy xyzzy :)")
+        stats = converter.stats()
+        assert stats.tokens == 6
+        assert stats.words == 5
+        assert stats.characters == len("Namasteomgharonxyzzyxyzzy")
+        assert stats.dictionary_hits == 1
+        assert stats.special_hits == 1
+        assert stats.inflected_words == 1
+        assert stats.character_words == 1
+        assert stats.cache_hits == 1
+        assert stats.lexicon_hits == 0
+        assert stats.convert_seconds >= stats.character_seconds > 0
+        assert stats.tokenize_seconds > 0
+
+    def test_devanagari_stages(self):
+        converter = HindiToRoman()
+        converter.enable_stats()
+        converter.transliterate("नमस्ते क्ष्ज्ञ")
+        stats = converter.stats()
+        assert (stats.words, stats.dictionary_hits, stats.character_words) == (2, 1, 1)
+
+    def test_lexicon_hits(self, tmp_path):
+        from hinlang.lexicon import build_lexicon
+
+        path = str(tmp_path / "names.hlex")
+        build_lexicon({"ranjan": "रंजन"}, path)
+        converter = RomanToHindi()
+        converter.open_lexicon(path)
+        converter.enable_stats()
+        assert converter.transliterate("Ranjan") == "रंजन"
+        assert converter.stats().lexicon_hits == 1
+
+    def test_batch_counts_distinct_words(self):
+        converter = RomanToHindi()
+        converter.enable_stats()
+        converter.transliterate_batch(["namaste dosto", "namaste", "dosto!"])
+        assert converter.stats().words == 2
+
+    def test_batch_counts_distinct_tokens(self):
+        converter = RomanToHindi()
+        converter.enable_stats()
+        converter.transliterate_batch(["namaste dosto", "namaste", "dosto!"])
+        stats = converter.stats()
+        assert stats.tokens == 3    # namaste, dosto, dosto!
+        assert stats.tokenize_seconds > 0
+
+    def test_iter_counts_tokens(self):
+        converter = RomanToHindi()
+        converter.enable_stats()
+        out = "".join(converter.transliterate_iter(["Namaste  dos", "to\nkya haal :)"]))
+        assert out == "नमस्ते  दोस्तो\nक्या हाल :)"
+        stats = converter.stats()
+        assert (stats.tokens, stats.words) == (5, 4)
+        assert stats.tokenize_seconds > 0
+
+    def test_aiter_counts_tokens(self):
+        import asyncio
+        from hinlang.aio import aiter_transliterate
+
+        async def collect():
+            return [piece async for piece in aiter_transliterate(converter, ["kya haal hai"], 1)]
+
+        converter = RomanToHindi()
+        converter.enable_stats()
+        asyncio.run(collect())
+        stats = converter.stats()
+        assert (stats.tokens, stats.words) == (3, 3)
+        assert stats.tokenize_seconds > 0
+
+    def test_undeduped_batch_counts_every_token(self):
+        converter = RomanToHindi()
+        converter.enable_stats()
+        converter.transliterate_batch(["namaste dosto"] * 3, dedupe=False)
+        assert converter.stats().tokens == 6
+
+    def test_output_unchanged(self):
+        text = "Namaste dosto, gharon mein xyzzy hai!"
+        converter = RomanToHindi(cache_size=16)
+        expected = converter.transliterate(text)
+        converter.enable_stats()
+        assert converter.transliterate(text) == expected
+        streamed = list(RomanToHindi().transliterate_iter([text]))
+        assert list(converter.transliterate_iter([text])) == streamed
+
+    def test_disable_removes_instrumentation(self):
+        converter = RomanToHindi()
+        attributes = set(vars(converter))
+        converter.enable_stats()
+        converter.enable_stats(False)
+        assert converter.stats() is None
+        assert set(vars(converter)) == attributes
+
+    def test_reenable_resets(self):
+        converter = RomanToHindi()
+        converter.enable_stats()
+        converter.transliterate("namaste")
+        converter.enable_stats()
+        assert converter.stats().words == 1
+        converter.enable_stats(False)
+        converter.enable_stats()
+        assert converter.stats().words == 0
+
+    def test_not_pickled(self):
+        import pickle
+
+        converter = RomanToHindi()
+        converter.enable_stats()
+        assert pickle.loads(pickle.dumps(converter)).stats() is None
+
+    def test_format(self):
+        line = format_stats("roman_to_hindi", Stats(*([0] * 9 + [0.0] * 3)))
+        assert line.startswith("roman_to_hindi: 0 tokens, 0 words")
+
+
+class TestModuleStats:
+    """Test hinlang.stats() and the CLI --stats flag."""
+
+    def test_module_stats(self, module_stats):
+        hinlang.to_hindi("namaste")   # engines are created on first use
+        before = hinlang.stats()["roman_to_hindi"].words
+        hinlang.to_hindi("Namaste dosto")
+        assert hinlang.stats()["roman_to_hindi"].words == before + 2
+
+    def test_module_stats_disabled(self):
+        assert hinlang.stats() == {"roman_to_hindi": None, "hindi_to_roman": None}
+
+    def test_cli_stats(self, module_stats, monkeypatch, capsys):
+        from hinlang import cli
+
+        monkeypatch.setattr(sys, "argv", ["hinlangpy", "--stats", "--to-hindi", "Namaste dosto"])
+        cli.main()
+        out, err = capsys.readouterr()
+        assert out.strip() == "नमस्ते दोस्तो"
+        assert err.startswith("roman_to_hindi: ")
+        assert "2 dictionary" in err
+
+    def test_cli_stats_file(self, module_stats, monkeypatch, capsys, tmp_path):
+        from hinlang import cli
+
+        src = tmp_path / "chat.txt"
+        src.write_text("Namaste dosto\nkya haal hai\n", encoding="utf-8")
+        monkeypatch.setattr(sys, "argv", ["hinlangpy", "--stats", "--to-hindi", "--file", str(src)])
+        cli.main()
+        out, err = capsys.readouterr()
+        assert out == "नमस्ते दोस्तो\nक्या हाल है\n"
+        assert err.startswith("roman_to_hindi: 5 tokens, 5 words")
+        assert hinlang.stats()["roman_to_hindi"].tokenize_seconds > 0
+
+    def test_cli_stats_stdin(self, module_stats, monkeypatch, capsys):
+        import io
+        from hinlang import cli
+
+        monkeypatch.setattr(sys, "stdin", io.StringIO("Namaste dosto\nनमस्ते\n"))
+        monkeypatch.setattr(sys, "argv", ["hinlangpy", "--stats"])
+        cli.main()
+        out, err = capsys.readouterr()
+        assert out == "नमस्ते दोस्तो\nnamaste\n"
+        lines = err.splitlines()
+        assert lines[0].startswith("roman_to_hindi: 2 tokens, 2 words")
+        assert lines[1].startswith("hindi_to_roman: 1 tokens, 1 words")
+        stats = hinlang.stats()
+        assert stats["roman_to_hindi"].tokenize_seconds > 0
+        assert stats["hindi_to_roman"].tokenize_seconds > 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
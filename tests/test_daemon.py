@@ -0,0 +1,197 @@
+"""Tests for the Unix socket daemon and its client."""
+
+import sys
+import os
+import socket
+import threading
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import pytest
+
+import hinlang
+from hinlang.client import Client, frame, parse_header
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="needs Unix sockets")
+
+
+@pytest.fixture
+def server(tmp_path):
+    from hinlang.daemon import Server
+
+    server = Server(str(tmp_path / "h.sock"))
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,))
+    thread.start()
+    yield server
+    server.shutdown()
+    thread.join()
+    server.server_close()
+
+
+def raw_exchange(path, data):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(path)
+        sock.sendall(data)
+        sock.shutdown(socket.SHUT_WR)
+        chunks = []
+        while True:
+            chunk = sock.recv(4096)
+            if not chunk:
+                return b"".join(chunks)
+            chunks.append(chunk)
+
+
+class TestProtocol:
+    """Test the frame format."""
+
+    def test_frame_roundtrip(self):
+        data = frame(b"hindi", "नमस्ते\n".encode("utf-8"))
+        header, _, payload = data.partition(b"\n")
+        assert parse_header(header + b"\n") == ("hindi", len(payload))
+
+    @pytest.mark.parametrize("line", [
+        b"hindi\n", b"hindi x\n", b" 3\n", b"hindi 3", b"hindi 99999999999\n",
+    ])
+    def test_malformed_header(self, line):
+        with pytest.raises(ValueError):
+            parse_header(line)
+
+
+class TestServer:
+    """Test conversions answered by a running server."""
+
+    def test_ops_match_local(self, server):
+        texts = ["Namaste dosto", "क्या हाल है", "Aaj मौसम accha hai", ""]
+        with Client(server.server_address) as client:
+            for text in texts:
+                assert client.to_hindi(text) == hinlang.to_hindi(text)
+                assert client.to_roman(text) == hinlang.to_roman(text)
+                assert client.convert(text) == hinlang.convert(text)
+
+    def test_large_payload(self, server):
+        text = "namaste dosto\n" * 20000
+        with Client(server.server_address) as client:
+            assert client.to_hindi(text) == hinlang.to_hindi(text)
+            assert client.to_hindi("kya") == "क्या"
+
+    def test_unknown_op_keeps_connection(self, server):
+        with Client(server.server_address) as client:
+            with pytest.raises(ValueError, match="unknown op"):
+                client.request("shout", "namaste")
+            assert client.to_hindi("namaste") == "नमस्ते"
+
+    def test_conversion_error_keeps_connection(self, server, monkeypatch):
+        from hinlang import daemon
+
+        def broken(text):
+            raise RuntimeError("engine failed")
+
+        monkeypatch.setitem(daemon._FUNCTIONS, "hindi", broken)
+        with Client(server.server_address) as client:
+            with pytest.raises(ValueError, match="RuntimeError: engine failed"):
+                client.to_hindi("namaste")
+            assert client.to_roman("नमस्ते") == "namaste"
+
+    def test_pipelined_raw_requests(self, server):
+        data = frame(b"hindi", b"namaste") + frame(b"roman", "दोस्तो".encode("utf-8"))
+        reply = raw_exchange(server.server_address, data)
+        assert reply == frame(b"ok", "नमस्ते".encode("utf-8")) + frame(b"ok", b"dosto")
+
+    def test_malformed_request_closes(self, server):
+        reply = raw_exchange(server.server_address, b"hello\n" + frame(b"hindi", b"namaste"))
+        assert reply.startswith(b"error ")
+        assert b"\xe0" not in reply
+
+    def test_socket_private(self, server):
+        assert os.stat(server.server_address).st_mode & 0o777 == 0o600
+
+    def test_socket_removed_on_close(self, tmp_path):
+        from hinlang.daemon import Server
+
+        path = str(tmp_path / "h.sock")
+        Server(path).server_close()
+        assert not os.path.exists(path)
+
+    def test_stale_socket_replaced(self, tmp_path):
+        from hinlang.daemon import Server
+
+        path = str(tmp_path / "h.sock")
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(path)
+        stale.close()
+        Server(path).server_close()
+
+    def test_refuses_second_server(self, server):
+        from hinlang.daemon import Server
+
+        with pytest.raises(OSError, match="already listening"):
+            Server(server.server_address)
+
+    def test_no_daemon(self, tmp_path):
+        with pytest.raises(OSError):
+            Client(str(tmp_path / "missing.sock"))
+
+
+class TestDaemonCli:
+    """Test hinlangpy talking to the daemon."""
+
+    def run(self, monkeypatch, capsys, *argv):
+        from hinlang import cli
+
+        monkeypatch.setattr(sys, "argv", ["hinlangpy", *argv])
+        cli.main()
+        return capsys.readouterr()
+
+    def test_fast_path(self, server, monkeypatch, capsys):
+        from hinlang import cli
+
+        monkeypatch.setenv("HINLANG_SOCKET", server.server_address)
+        assert cli._daemon_fast_path(["-H", "Kya", "haal"])
+        assert capsys.readouterr().out == "क्या हाल\n"
+        assert not cli._daemon_fast_path(["--stats", "Kya"])
+
+    def test_options_use_daemon(self, server, monkeypatch, capsys, tmp_path):
+        dst = tmp_path / "out.txt"
+        self.run(monkeypatch, capsys, "--client", "--socket", server.server_address,
+                 "-R", "नमस्ते", "-o", str(dst))
+        assert dst.read_text(encoding="utf-8") == "namaste\n"
+
+    def test_falls_back_without_daemon(self, monkeypatch, capsys, tmp_path):
+        monkeypatch.setenv("HINLANG_SOCKET", str(tmp_path / "missing.sock"))
+        assert self.run(monkeypatch, capsys, "Namaste").out == "नमस्ते\n"
+
+    def test_falls_back_when_daemon_hangs(self, monkeypatch, capsys, tmp_path):
+        from hinlang import cli
+
+        # A listening socket that never accepts: connect succeeds, reads time out
+        path = str(tmp_path / "hung.sock")
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as hung:
+            hung.bind(path)
+            hung.listen(1)
+            monkeypatch.setattr(cli, "_DAEMON_TIMEOUT", 0.05)
+            monkeypatch.setenv("HINLANG_SOCKET", path)
+            assert self.run(monkeypatch, capsys, "Namaste").out == "नमस्ते\n"
+
+    def test_falls_back_on_daemon_error(self, server, monkeypatch, capsys):
+        from hinlang import daemon
+
+        def broken(text):
+            raise RuntimeError("engine failed")
+
+        monkeypatch.setitem(daemon._FUNCTIONS, "convert", broken)
+        monkeypatch.setenv("HINLANG_SOCKET", server.server_address)
+        assert self.run(monkeypatch, capsys, "Namaste").out == "नमस्ते\n"
+
+    def test_client_requires_daemon(self, monkeypatch, capsys, tmp_path):
+        with pytest.raises(SystemExit):
+            self.run(monkeypatch, capsys, "--client", "--socket", str(tmp_path / "missing.sock"),
+                     "Namaste")
+        assert "no hinlangpy daemon" in capsys.readouterr().err
+
+    def test_serve_requires_socket(self, monkeypatch, capsys):
+        monkeypatch.delenv("HINLANG_SOCKET", raising=False)
+        with pytest.raises(SystemExit):
+            self.run(monkeypatch, capsys, "--serve")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
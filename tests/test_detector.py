@@ -4,7 +4,7 @@ import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from hinlang import detect_script
+from hinlang import detect_script, detect_script_info, segment_scripts
 
 
 class TestDetectScript:
@@ -22,6 +22,10 @@ class TestDetectScript:
     def test_empty(self):
         assert detect_script("") == "empty"
 
+    def test_none_is_empty(self):
+        assert detect_script(None) == "empty"
+        assert detect_script_info(None).script == "empty"
+
     def test_whitespace(self):
         assert detect_script("   ") == "empty"
 
@@ -41,6 +45,38 @@ class TestDetectScript:
         assert detect_script("नमस्ते") == "devanagari"
 
 
+class TestDetectScriptInfo:
+    """Test confidence reporting and opt-in early exit."""
+
+    def test_counts_letters_only(self):
+        info = detect_script_info("Hello दोस्तो")
+        assert info.script == "mixed"
+        assert (info.roman, info.devanagari) == (5, 3)
+        assert info.confidence == 0.75
+
+    def test_pure_script_is_fully_confident(self):
+        assert detect_script_info("Hello Dosto").confidence == 1.0
+        assert detect_script_info("नमस्ते दोस्तो").confidence == 1.0
+
+    def test_empty(self):
+        assert detect_script_info("  12 ").script == "empty"
+
+    def test_sample_stops_early(self):
+        text = "नमस्ते दोस्तो " * 10000
+        info = detect_script_info(text, sample=256)
+        assert info.script == "devanagari"
+        assert info.devanagari < 1000
+
+    def test_sample_matches_full_scan_on_short_text(self):
+        for text in ("Hello दोस्तो", "Kya हाल hai", "नमस्ते ji"):
+            assert detect_script(text, sample=4) == detect_script(text)
+
+    def test_negative_sample_rejected(self):
+        import pytest
+        with pytest.raises(ValueError):
+            detect_script_info("नमस्ते", sample=-1)
+
+
 class TestConvertAutoDetect:
     """Test the convert() auto-detection function."""
 
@@ -55,6 +91,51 @@ class TestConvertAutoDetect:
         assert result == "namaste dosto"
 
 
+class TestSegmentScripts:
+    """Test the segment_scripts() function."""
+
+    def test_runs_cover_text(self):
+        text = "Hello दोस्तो, kaise ho?"
+        spans = segment_scripts(text)
+        assert spans == [(0, 6, "roman"), (6, 14, "devanagari"), (14, 23, "roman")]
+        assert "".join(text[a:b] for a, b, _ in spans) == text
+
+    def test_single_script(self):
+        assert segment_scripts("नमस्ते दोस्तो") == [(0, 13, "devanagari")]
+
+    def test_split_inside_word(self):
+        assert segment_scripts("दोस्तोji") == [(0, 6, "devanagari"), (6, 8, "roman")]
+
+    def test_punctuation_stays_with_word(self):
+        assert segment_scripts('Bhai "दोस्त"') == [(0, 5, "roman"), (5, 12, "devanagari")]
+
+    def test_no_letters(self):
+        assert segment_scripts("") == []
+        assert segment_scripts("123 !") == []
+
+
+class TestConvertSpans:
+    """Test convert(..., mode="spans")."""
+
+    def test_mixed_keeps_devanagari_runs(self):
+        from hinlang import convert
+        assert convert("Aaj मौसम accha hai", mode="spans") == "आज मौसम अच्छा है"
+
+    def test_devanagari_text_romanized(self):
+        from hinlang import convert
+        assert convert("नमस्ते दोस्तो", mode="spans") == "namaste dosto"
+
+    def test_whitespace_preserved(self):
+        from hinlang import convert
+        assert convert("Kya  haal\nhai", mode="spans") == "क्या  हाल\nहै"
+
+    def test_unknown_mode(self):
+        import pytest
+        from hinlang import convert
+        with pytest.raises(ValueError):
+            convert("Kya haal hai", mode="words")
+
+
 if __name__ == "__main__":
     import pytest
     pytest.main([__file__, "-v"])
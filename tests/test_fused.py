@@ -0,0 +1,68 @@
+"""Tests for the fused detect-and-convert path behind convert()."""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import hinlang
+from hinlang import HindiToRoman, RomanToHindi, detect_script
+from hinlang.fused import SPECULATE_MAX_CHARS, convert_fused
+
+
+def two_pass(r2h, h2r, text):
+    if detect_script(text) == "devanagari":
+        return h2r.transliterate(text)
+    return r2h.transliterate(text)
+
+
+class TestConvertFused:
+    """convert_fused() must match detect-then-convert exactly."""
+
+    TEXTS = [
+        "",
+        "   ",
+        "12345 !!",
+        "Kya haal hai",
+        "नमस्ते दोस्तो",
+        "Hello दोस्तो",
+        "मेरा नाम Ranjan है",
+        "Aaj मौसम बहुत accha hai, chalo घर चलते hain",
+        "“Kya” haal hai 😀 bhai",
+        "दोस्तोji kaise ho?",
+        "१२३ ।",
+    ]
+
+    def setup_method(self):
+        self.r2h = RomanToHindi()
+        self.h2r = HindiToRoman()
+
+    def get_r2h(self):
+        return self.r2h
+
+    def get_h2r(self):
+        return self.h2r
+
+    def test_matches_two_pass(self):
+        for text in self.TEXTS:
+            expected = two_pass(self.r2h, self.h2r, text)
+            assert convert_fused(self.get_r2h, self.get_h2r, text) == expected
+
+    def test_wrong_guess_falls_back(self):
+        # Starts in Devanagari, but Roman letters dominate
+        text = "मेरा name is Ranjan and I live here"
+        assert detect_script(text) == "roman"
+        assert convert_fused(self.get_r2h, self.get_h2r, text) == self.r2h.transliterate(text)
+
+    def test_large_input(self):
+        text = "नमस्ते दोस्तो " * (SPECULATE_MAX_CHARS // 10)
+        assert len(text) > SPECULATE_MAX_CHARS
+        assert convert_fused(self.get_r2h, self.get_h2r, text) == self.h2r.transliterate(text)
+
+    def test_convert_uses_fused_path(self):
+        assert hinlang.convert("नमस्ते दोस्तो") == "namaste dosto"
+        assert hinlang.convert("Hello दोस्तो") == hinlang.to_hindi("Hello दोस्तो")
+
+
+if __name__ == "__main__":
+    import pytest
+    pytest.main([__file__, "-v"])
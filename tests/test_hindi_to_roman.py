@@ -86,6 +86,44 @@ class TestHindiToRomanClass:
         assert converter.transliterate("क्रिंज") == "cringe"
         assert converter.transliterate("सिग्मा") == "sigma"
 
+    def test_custom_word_isolated_per_instance(self):
+        c1 = HindiToRoman()
+        c2 = HindiToRoman()
+        c1.add_word("है", "h")
+        assert c1.transliterate("है") == "h"
+        assert c2.transliterate("है") == "hai"
+        assert c1._base is c2._base
+
+
+class TestAksharaTable:
+    """Test character-level romanization of out-of-dictionary words."""
+
+    def setup_method(self):
+        self.converter = HindiToRoman()
+
+    def test_inherent_a_between_letters(self):
+        assert self.converter._convert_chars("कमल") == "kamal"
+
+    def test_matra_and_virama_clusters(self):
+        assert self.converter._convert_chars("किताब") == "kitaab"
+        assert self.converter._convert_chars("क्या") == "kyaa"
+        assert self.converter._convert_chars("क्") == "k"
+
+    def test_conjunct(self):
+        assert self.converter._convert_chars("क्षमा") == "kshamaa"
+
+    def test_stray_matra_kept(self):
+        assert self.converter._convert_chars("ा") == "ा"
+
+    def test_no_inherent_a_before_latin(self):
+        assert self.converter._convert_chars("कa") == "ka"
+
+    def test_every_cluster_in_table(self):
+        from hinlang.hindi_to_roman import _AKSHARA_TABLE
+        assert _AKSHARA_TABLE["की"] == "kee"
+        assert _AKSHARA_TABLE["क्"] == "k"
+        assert all(chr(cp) in _AKSHARA_TABLE for cp in range(0x0900, 0x0980))
+
 
 if __name__ == "__main__":
     import pytest
@@ -0,0 +1,54 @@
+"""Tests for cold-start cost: lazy submodules.
+
+The wall-clock import budgets are checked by
+``benchmarks/bench_import_time.py``, not here.
+"""
+
+import sys
+import os
+import subprocess
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+ROOT = os.path.join(os.path.dirname(__file__), '..')
+
+
+def run(code):
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+
+
+class TestLazyImports:
+    """``import hinlang`` must not load the engines or the dictionary."""
+
+    def test_no_submodules_on_import(self):
+        out = run(
+            "import sys, hinlang;"
+            "print(sorted(m for m in sys.modules if m.startswith('hinlang.')))"
+        ).stdout
+        assert out.strip() == "[]"
+
+    def test_roman_use_skips_reverse_dictionary(self):
+        out = run(
+            "import sys, hinlang; hinlang.to_hindi('kya haal hai');"
+            "from hinlang import dictionary;"
+            "print('hinlang.hindi_to_roman' in sys.modules, dictionary._hindi_to_roman is None)"
+        ).stdout
+        assert out.split() == ["False", "True"]
+
+    def test_lazy_names_resolve(self):
+        import hinlang
+        from hinlang.roman_to_hindi import RomanToHindi
+        assert hinlang.RomanToHindi is RomanToHindi
+        assert "HindiToRoman" in dir(hinlang)
+
+    def test_reverse_dictionary_attribute(self):
+        from hinlang import dictionary
+        assert dictionary.HINDI_TO_ROMAN is dictionary.hindi_to_roman()
+        assert dictionary.HINDI_TO_ROMAN["नमस्ते"] == "namaste"
+
+
+if __name__ == "__main__":
+    import pytest
+    pytest.main([__file__, "-v"])
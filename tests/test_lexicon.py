@@ -0,0 +1,126 @@
+"""Tests for memory-mapped binary lexicons."""
+
+import sys
+import os
+import pickle
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import pytest
+
+from hinlang import RomanToHindi, HindiToRoman
+from hinlang.lexicon import Lexicon, build_lexicon, main
+
+
+@pytest.fixture
+def roman_lexicon(tmp_path):
+    path = str(tmp_path / "names.hlex")
+    build_lexicon({"Ranjan": "रंजन", "bengaluru": "बेंगलुरु", "zomato ": "ज़ोमैटो"},
+                  path, lowercase_keys=True)
+    return path
+
+
+class TestLexicon:
+    """Test building and reading lexicon files."""
+
+    def test_lookup(self, roman_lexicon):
+        with Lexicon(roman_lexicon) as lexicon:
+            assert len(lexicon) == 3
+            assert lexicon.get("ranjan") == "रंजन"
+            assert lexicon.get("zomato") == "ज़ोमैटो"
+            assert lexicon.get("unknown") is None
+            assert lexicon.get("unknown", "-") == "-"
+            assert "bengaluru" in lexicon
+
+    def test_many_entries(self, tmp_path):
+        path = str(tmp_path / "many.hlex")
+        entries = {"w%05d" % i: "v%d" % i for i in range(5000)}
+        assert build_lexicon(entries, path) == 5000
+        with Lexicon(path) as lexicon:
+            assert all(lexicon.get(k) == v for k, v in entries.items())
+            misses = sum(lexicon.get("x%05d" % i) is not None for i in range(5000))
+            assert misses == 0
+
+    @pytest.mark.parametrize("rate", [0.1, 0.01])
+    def test_bloom_false_positive_rate(self, tmp_path, rate):
+        from hinlang.lexicon import _BLOCK, _bloom_probe
+
+        path = str(tmp_path / "bloom.hlex")
+        build_lexicon({"w%d" % i: "v" for i in range(20000)}, path, false_positive_rate=rate)
+        with Lexicon(path) as lexicon:
+            passed = 0
+            for i in range(50000):
+                block, mask = _bloom_probe(b"x%d" % i, lexicon._hashes, lexicon._blocks)
+                word = _BLOCK.unpack_from(lexicon._map, lexicon._bloom + block * _BLOCK.size)[0]
+                passed += word & mask == mask
+        # Allow for sampling noise around the target
+        assert passed / 50000 <= rate * 1.15
+
+    def test_later_duplicates_win(self, tmp_path):
+        path = str(tmp_path / "dup.hlex")
+        build_lexicon([("a", "1"), ("a", "2")], path)
+        with Lexicon(path) as lexicon:
+            assert lexicon.get("a") == "2"
+
+    def test_empty_lexicon(self, tmp_path):
+        path = str(tmp_path / "empty.hlex")
+        build_lexicon({}, path)
+        with Lexicon(path) as lexicon:
+            assert len(lexicon) == 0
+            assert lexicon.get("a") is None
+
+    def test_rejects_other_files(self, tmp_path):
+        path = tmp_path / "not.hlex"
+        path.write_bytes(b"x" * 64)
+        with pytest.raises(ValueError):
+            Lexicon(str(path))
+
+    def test_build_from_tsv(self, tmp_path):
+        source = tmp_path / "names.tsv"
+        source.write_text("# name\tdevanagari\nRanjan\tरंजन\n\nDelhi\tदिल्ली\n", encoding="utf-8")
+        output = str(tmp_path / "names.hlex")
+        main([str(source), output, "--lowercase-keys"])
+        with Lexicon(output) as lexicon:
+            assert lexicon.get("delhi") == "दिल्ली"
+
+
+class TestEngineLexicon:
+    """Test lexicons attached to the engines."""
+
+    def test_roman_to_hindi(self, roman_lexicon):
+        converter = RomanToHindi(cache_size=16)
+        converter.open_lexicon(roman_lexicon)
+        assert converter.transliterate("Ranjan Bengaluru hai") == "रंजन बेंगलुरु है"
+
+    def test_precedence(self, roman_lexicon, tmp_path):
+        path = str(tmp_path / "override.hlex")
+        build_lexicon({"hai": "हाई"}, path)
+        converter = RomanToHindi()
+        converter.open_lexicon(path)
+        assert converter.transliterate("hai") == "है"   # built-in dictionary wins
+        converter.add_word("hai", "हय")
+        assert converter.transliterate("hai") == "हय"   # custom words win
+
+    def test_hindi_to_roman(self, tmp_path):
+        path = str(tmp_path / "hi.hlex")
+        build_lexicon({"रंजन": "ranjan"}, path)
+        converter = HindiToRoman()
+        converter.open_lexicon(path)
+        assert converter.transliterate("रंजन") == "ranjan"
+        assert converter.transliterate_batch(["रंजन जी"]) == ["ranjan jee"]
+
+    def test_pickled_engine_reopens_lexicon(self, roman_lexicon):
+        converter = RomanToHindi()
+        converter.open_lexicon(roman_lexicon)
+        clone = pickle.loads(pickle.dumps(converter))
+        assert clone._lexicons[0] is not converter._lexicons[0]
+        assert clone.transliterate("ranjan") == "रंजन"
+
+    def test_process_workers_use_lexicon(self, roman_lexicon):
+        converter = RomanToHindi()
+        converter.open_lexicon(roman_lexicon)
+        texts = ["Ranjan"] * 4
+        assert converter.transliterate_batch(texts, workers=2, chunksize=2) == ["रंजन"] * 4
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
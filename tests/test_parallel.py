@@ -0,0 +1,174 @@
+"""Tests for process-pool batch conversion."""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import pytest
+
+import hinlang
+from hinlang import RomanToHindi, HindiToRoman
+
+
+ROMAN = ["Namaste Dosto", "Kya haal hai", "Main theek hoon", "zorawar", ""] * 7
+HINDI = ["नमस्ते दोस्तो", "क्या हाल है", "मैं ठीक हूँ", "ज़ोरवर", ""] * 7
+
+
+class TestParallelBatch:
+    """Test workers= / chunksize= on the batch APIs."""
+
+    def test_to_hindi_batch_matches_serial(self):
+        serial = hinlang.to_hindi_batch(ROMAN)
+        assert hinlang.to_hindi_batch(ROMAN, workers=2, chunksize=4) == serial
+
+    def test_to_roman_batch_matches_serial(self):
+        serial = hinlang.to_roman_batch(HINDI)
+        assert hinlang.to_roman_batch(HINDI, workers=2, chunksize=3) == serial
+
+    def test_custom_words_reach_workers(self):
+        converter = RomanToHindi(cache_size=64)
+        converter.add_word("Bruh", "ब्रह")
+        result = converter.transliterate_batch(["bruh"] * 10, workers=2, chunksize=2)
+        assert result == ["ब्रह"] * 10
+
+    def test_custom_words_reach_workers_h2r(self):
+        converter = HindiToRoman()
+        converter.add_words({"है": "h"})
+        assert converter.transliterate_batch(["है"] * 4, workers=2, chunksize=1) == ["h"] * 4
+
+    def test_empty_batch(self):
+        assert hinlang.to_hindi_batch([], workers=4) == []
+
+    def test_invalid_chunksize(self):
+        with pytest.raises(ValueError):
+            hinlang.to_hindi_batch(ROMAN, workers=2, chunksize=0)
+
+
+class TestParallelFile:
+    """Test line-boundary chunking and in-order parallel file conversion."""
+
+    def test_line_spans_cover_input(self):
+        from hinlang.parallel import line_spans
+
+        for data in [b"", b"a", b"a\nb\n", b"aaaa\nbb\nc", b"\n\n\n"]:
+            for chunk_bytes in (1, 2, 3, 100):
+                spans = list(line_spans(data, chunk_bytes))
+                assert b"".join(data[a:b] for a, b in spans) == data
+                assert all(b == len(data) or data[b - 1:b] == b"\n" for a, b in spans)
+        assert list(line_spans(b"aaaa\nbb\nc", 2)) == [(0, 5), (5, 8), (8, 9)]
+
+    def test_convert_lines_per_line_direction(self):
+        from hinlang.parallel import convert_lines
+
+        engines = (RomanToHindi(), HindiToRoman())
+        text = "Namaste  dosto\r\nनमस्ते दोस्तो\n\n"
+        assert convert_lines(engines, text) == "नमस्ते  दोस्तो\r\nnamaste dosto\n\n"
+        assert convert_lines((None, engines[1]), "नमस्ते\nhi") == "namaste\nhi"
+
+    def test_long_line_direction_matches_streaming(self):
+        # Roman for the first CHUNK_SIZE characters, Devanagari overall
+        import argparse
+        import io
+        from hinlang import cli
+        from hinlang.parallel import convert_lines
+        from hinlang.stream import CHUNK_SIZE
+
+        line = "namaste " * (CHUNK_SIZE // 8) + "नमस्ते " * 40000
+        text = line + "\nनमस्ते\n"
+        args = argparse.Namespace(force_hindi=False, force_roman=False, line_buffered=False)
+        streamed = io.StringIO()
+        cli._stream(hinlang, args, io.StringIO(text, newline=""), streamed)
+
+        converted = convert_lines((RomanToHindi(), HindiToRoman()), text)
+        assert converted == streamed.getvalue()
+        assert converted.startswith("नमस्ते नमस्ते")
+        assert converted.endswith("\nnamaste\n")
+
+    def test_map_file_in_order(self, tmp_path):
+        from hinlang.parallel import convert_lines, map_file
+
+        lines = ["%s %d\n" % (line, i) for i, line in enumerate(ROMAN + HINDI)]
+        path = tmp_path / "in.txt"
+        path.write_text("".join(lines) * 5, encoding="utf-8")
+        engines = (RomanToHindi(), HindiToRoman())
+
+        out = []
+        size = map_file(engines, str(path), out.append, workers=2, chunk_bytes=64)
+        assert size == path.stat().st_size
+        assert len(out) > 10
+        expected = convert_lines(engines, path.read_text(encoding="utf-8"))
+        assert b"".join(out).decode("utf-8") == expected
+
+    def test_map_file_empty(self, tmp_path):
+        from hinlang.parallel import map_file
+
+        path = tmp_path / "empty.txt"
+        path.write_bytes(b"")
+        out = []
+        assert map_file((RomanToHindi(), None), str(path), out.append, workers=2) == 0
+        assert out == []
+
+
+class TestParallelFiles:
+    """Test converting many files, one engine set per worker."""
+
+    def test_convert_file_blocks(self, tmp_path):
+        from hinlang.parallel import convert_file, convert_lines
+
+        engines = (RomanToHindi(), HindiToRoman())
+        text = "".join("%s %d\n" % (line, i) for i, line in enumerate(ROMAN + HINDI)) + "kya haal"
+        src = tmp_path / "in.txt"
+        src.write_text(text, encoding="utf-8")
+        dst = tmp_path / "a" / "b" / "out.txt"
+        read, written = convert_file(engines, str(src), str(dst), block_bytes=7)
+        assert read == src.stat().st_size
+        assert written == dst.stat().st_size
+        assert dst.read_text(encoding="utf-8") == convert_lines(engines, text)
+
+    def test_map_files_in_order(self, tmp_path):
+        from hinlang.parallel import map_files
+
+        pairs = []
+        for i in range(6):
+            src = tmp_path / ("in%d.txt" % i)
+            src.write_text("namaste %d\n" % i, encoding="utf-8")
+            pairs.append((str(src), str(tmp_path / "out" / src.name)))
+        results = list(map_files((RomanToHindi(), None), pairs, workers=2, chunksize=2))
+        assert [r[0] for r in results] == [src for src, _ in pairs]
+        assert all(error is None for *_, error in results)
+        assert (tmp_path / "out" / "in4.txt").read_text(encoding="utf-8") == "नमस्ते ४\n"
+
+    def test_map_files_reports_errors(self, tmp_path):
+        from hinlang.parallel import map_files
+
+        bad = tmp_path / "bad.txt"
+        bad.write_bytes(b"\xff\xfe")
+        pairs = [(str(bad), str(tmp_path / "bad.out")),
+                 (str(tmp_path / "missing.txt"), str(tmp_path / "missing.out"))]
+        results = list(map_files((RomanToHindi(), None), pairs, workers=1))
+        assert results[0][3].startswith("UnicodeDecodeError")
+        assert results[1][3].startswith("FileNotFoundError")
+        assert not (tmp_path / "bad.out").exists()
+
+    def test_failed_conversion_removes_output(self, tmp_path):
+        from hinlang.parallel import convert_file
+
+        engine = RomanToHindi()
+        sub_token = engine._sub_token
+
+        def failing(match):
+            if match.group(2) == "boom":
+                raise RuntimeError("engine failed")
+            return sub_token(match)
+
+        engine._sub_token = failing
+        src = tmp_path / "in.txt"
+        src.write_text("namaste dosto\n" * 100 + "boom\n", encoding="utf-8")
+        dst = tmp_path / "out.txt"
+        with pytest.raises(RuntimeError):
+            convert_file((engine, None), str(src), str(dst), block_bytes=64)
+        assert not dst.exists()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
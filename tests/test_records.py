@@ -0,0 +1,153 @@
+"""Tests for field-level JSONL/CSV/TSV transliteration."""
+
+import sys
+import os
+import io
+import json
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import pytest
+
+import hinlang
+from hinlang.records import convert_values, transliterate_csv, transliterate_jsonl
+
+
+def run_jsonl(text, fields, **kwargs):
+    out = io.StringIO()
+    count = transliterate_jsonl(io.StringIO(text), out, fields, **kwargs)
+    return count, out.getvalue()
+
+
+def run_csv(text, columns, **kwargs):
+    out = io.StringIO(newline="")
+    count = transliterate_csv(io.StringIO(text, newline=""), out, columns, **kwargs)
+    return count, out.getvalue()
+
+
+class TestConvertValues:
+    """Test the batched conversion behind both formats."""
+
+    def test_directions(self):
+        values = ["Kya haal hai", "नमस्ते", "Kya haal hai"]
+        assert convert_values(values) == ["क्या हाल है", "namaste", "क्या हाल है"]
+        assert convert_values(values[:1], "hindi") == [hinlang.to_hindi(values[0])]
+        assert convert_values(values[1:2], "roman") == ["namaste"]
+
+    def test_repeated_values_share_output(self):
+        first, second = convert_values(["Namaste dosto", "Namaste dosto"])
+        assert first is second
+
+    def test_invalid_direction(self):
+        with pytest.raises(ValueError):
+            convert_values(["a"], "auto-detect")
+
+
+class TestJsonLines:
+    """Test JSON Lines field conversion."""
+
+    def test_only_selected_fields_change(self):
+        line = '{"id": 7,  "message": "Kya haal hai", "user":"ram", "meta": {"message": "x"}}\n'
+        count, out = run_jsonl(line, ["message"])
+        assert count == 1
+        assert out == line.replace('"Kya haal hai"', '"क्या हाल है"')
+
+    def test_per_value_direction(self):
+        text = ('{"a": "namaste", "b": "नमस्ते"}\n'
+                '{"a": "\\u0928\\u092e\\u0938\\u094d\\u0924\\u0947"}\n')
+        _, out = run_jsonl(text, ["a", "b"])
+        rows = [json.loads(line) for line in out.splitlines()]
+        assert rows == [{"a": "नमस्ते", "b": "namaste"}, {"a": "namaste"}]
+
+    def test_escaped_key(self):
+        _, out = run_jsonl('{"m\\u0073g": "namaste", "msg\\"": "namaste"}\n', ["msg"])
+        assert json.loads(out) == {"msg": "नमस्ते", 'msg"': "namaste"}
+
+    def test_passthrough(self):
+        text = '{"message": null}\r\n\n{"message": 3, "x": "namaste"}\n{}'
+        count, out = run_jsonl(text, ["message"])
+        assert (count, out) == (3, text)
+
+    def test_empty_objects(self):
+        text = '{"m": "namaste"}\n{}\n{ }\r\n{"m": "dosto"}\n { } \n{}'
+        count, out = run_jsonl(text, ["m"])
+        assert count == 6
+        assert out == text.replace("namaste", "नमस्ते").replace("dosto", "दोस्तो")
+
+    def test_chunks_match_single_pass(self):
+        text = "".join('{"n": %d, "m": "namaste dosto %d"}\n' % (i, i % 3) for i in range(50))
+        assert run_jsonl(text, ["m"], chunk_size=7) == run_jsonl(text, ["m"])
+
+    @pytest.mark.parametrize("line", [
+        '[1, 2]', '{"a": 1,}', '{"a": 1} {}', '{"a" 1}', '{"a": tru}',
+    ])
+    def test_invalid_line(self, line):
+        with pytest.raises(ValueError, match="line 2"):
+            run_jsonl('{"a": "x"}\n' + line + "\n", ["a"])
+
+
+class TestCsv:
+    """Test CSV and TSV column conversion."""
+
+    def test_columns_by_name(self):
+        text = 'id,title,body\r\n1,Namaste dosto,"a,b"\r\n2,"नमस्ते, दोस्तो",x\r\n'
+        count, out = run_csv(text, ["title"])
+        assert count == 2
+        assert out == 'id,title,body\r\n1,नमस्ते दोस्तो,"a,b"\r\n2,"namaste, dosto",x\r\n'
+
+    def test_unchanged_rows_copied_verbatim(self):
+        text = 'id,title\n"1","—"\n"2",""\n'
+        assert run_csv(text, ["title"]) == (2, text)
+
+    def test_tsv_without_header(self):
+        text = "1\tNamaste\n2\tdosto"
+        _, out = run_csv(text, ["2"], delimiter="\t", header=False)
+        assert out == "1\tनमस्ते\n2\tदोस्तो"
+
+    def test_short_rows(self):
+        _, out = run_csv("a,b\n1\n2,namaste\n", ["b"])
+        assert out == "a,b\n1\n2,नमस्ते\n"
+
+    def test_unknown_column(self):
+        with pytest.raises(ValueError, match="no column"):
+            run_csv("a,b\n1,2\n", ["c"])
+
+    def test_empty_input(self):
+        assert run_csv("", ["a"]) == (0, "")
+
+
+class TestRecordsCli:
+    """Test hinlangpy --fields."""
+
+    def run(self, monkeypatch, capsys, *argv, stdin=None):
+        from hinlang import cli
+
+        monkeypatch.setattr(sys, "argv", ["hinlangpy", *argv])
+        if stdin is not None:
+            monkeypatch.setattr(sys, "stdin", io.StringIO(stdin))
+        cli.main()
+        return capsys.readouterr()
+
+    def test_jsonl_file(self, monkeypatch, capsys, tmp_path):
+        src = tmp_path / "chats.jsonl"
+        dst = tmp_path / "out.jsonl"
+        src.write_text('{"message": "Kya haal hai", "user": "ram"}\n', encoding="utf-8")
+        self.run(monkeypatch, capsys, "-f", str(src), "-o", str(dst), "--fields", "message")
+        assert dst.read_text(encoding="utf-8") == '{"message": "क्या हाल है", "user": "ram"}\n'
+
+    def test_tsv_stdin_forced(self, monkeypatch, capsys):
+        out = self.run(monkeypatch, capsys, "--fields", "b", "--format", "tsv", "-H",
+                       stdin="a\tb\nram\tnamaste\n").out
+        assert out == "a\tb\nram\tनमस्ते\n"
+
+    def test_format_required_for_stdin(self, monkeypatch, capsys):
+        with pytest.raises(SystemExit):
+            self.run(monkeypatch, capsys, "--fields", "a", stdin="{}\n")
+
+    def test_bad_record(self, monkeypatch, capsys):
+        with pytest.raises(SystemExit):
+            self.run(monkeypatch, capsys, "--fields", "a", "--format", "jsonl", stdin="nope\n")
+        assert "line 1" in capsys.readouterr().err
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
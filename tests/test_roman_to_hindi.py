@@ -93,6 +93,107 @@ class TestRomanToHindiClass:
         # c2 should NOT have this word
         assert c1.transliterate("yolo") == "योलो"
         # c2 will transliterate phonetically (not from dict)
+        c1.add_word("dost", "दोस्त्त")
+        assert c2.transliterate("dost") == "दोस्त"
+
+    def test_custom_word_overrides_base(self):
+        converter = RomanToHindi()
+        converter.add_word("Hai", "हैं")
+        assert converter.transliterate("hai") == "हैं"
+        assert RomanToHindi().transliterate("hai") == "है"
+
+    def test_base_tables_shared(self):
+        from hinlang.dictionary import ROMAN_TO_HINDI
+        c1 = RomanToHindi()
+        c2 = RomanToHindi()
+        c1.add_word("bruh", "ब्रह")
+        assert c1._base is c2._base is ROMAN_TO_HINDI
+        assert "bruh" not in ROMAN_TO_HINDI
+
+
+class TestLongestMatch:
+    """Test the trie-based longest-match automaton."""
+
+    def test_prefers_longest_consonant(self):
+        from hinlang.roman_to_hindi import _CONSONANT_TRIE, _longest_match
+        assert _longest_match(_CONSONANT_TRIE, "kshatriya", 0, 9) == (4, "क्ष")
+        assert _longest_match(_CONSONANT_TRIE, "shree", 0, 5) == (5, "श्री")
+        assert _longest_match(_CONSONANT_TRIE, "kal", 0, 3) == (1, "क")
+
+    def test_no_match(self):
+        from hinlang.roman_to_hindi import _CONSONANT_TRIE, _longest_match
+        assert _longest_match(_CONSONANT_TRIE, "aa", 0, 2) == (0, None)
+
+    def test_vowel_and_matra_forms(self):
+        from hinlang.roman_to_hindi import _VOWEL_TRIE, _longest_match
+        assert _longest_match(_VOWEL_TRIE, "aap", 0, 3) == (2, ("आ", "ा"))
+        assert _longest_match(_VOWEL_TRIE, "ap", 0, 2) == (1, ("अ", ""))
+
+    def test_character_path(self):
+        converter = RomanToHindi()
+        assert converter.transliterate("bhool") == "भूल"
+        assert converter.transliterate("chhota") == "छोटा"
+        assert converter.transliterate("sooraj") == "सूरज"
+
+
+class TestInflectedForms:
+    """Test dictionary stem + suffix lookup for inflected words."""
+
+    def test_noun_plurals(self):
+        converter = RomanToHindi()
+        assert converter.transliterate("gharon") == "घरों"
+        assert converter.transliterate("doston") == "दोस्तों"
+        assert converter.transliterate("baaten") == "बातें"
+
+    def test_a_stem_replaced(self):
+        converter = RomanToHindi()
+        assert converter.transliterate("bachchon") == "बच्चों"
+        assert converter.transliterate("ladke") == "लड़के"
+
+    def test_i_stem_replaced(self):
+        converter = RomanToHindi()
+        assert converter.transliterate("ladkiyan") == "लड़कियाँ"
+
+    def test_verb_forms(self):
+        converter = RomanToHindi()
+        assert converter.transliterate("hote") == "होते"
+        assert converter.transliterate("jayenge") == "जाएंगे"
+        assert converter.transliterate("gharwale") == "घरवाले"
+
+    def test_short_verb_stems(self):
+        converter = RomanToHindi()
+        assert converter.transliterate("deta") == "देता"
+        assert converter.transliterate("leti") == "लेती"
+        assert converter.transliterate("hota") == "होता"
+
+    def test_function_words_not_stems(self):
+        # hi|ne, ka|te, ki|ne, to|ne ... are not inflections
+        converter = RomanToHindi()
+        for word in ("hine", "kate", "kine", "tone", "hie", "phoneon"):
+            assert converter._convert_inflected(word) is None, word
+        assert converter.transliterate("kate") == "कते"
+
+    def test_dictionary_forms_win(self):
+        # Listed inflections are used as they are
+        converter = RomanToHindi()
+        assert converter.transliterate("dosto") == "दोस्तो"
+        assert converter.transliterate("karenge") == "करेंगे"
+
+    def test_custom_stems(self):
+        converter = RomanToHindi(cache_size=16)
+        assert converter.transliterate("yaaron") != "यारों"
+        converter.add_word("yaar", "यार")
+        assert converter.transliterate("yaaron") == "यारों"
+
+    def test_no_split_uses_character_path(self):
+        converter = RomanToHindi()
+        assert converter._convert_inflected("sooraj") is None
+        assert converter._convert_inflected("on") is None
+        assert converter.transliterate("sooraj") == "सूरज"
+
+    def test_matra_suffix_needs_consonant_stem(self):
+        # आ + ों is not a valid split
+        assert RomanToHindi()._convert_inflected("aaon") is None
 
 
 if __name__ == "__main__":
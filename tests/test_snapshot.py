@@ -0,0 +1,148 @@
+"""Tests for persistent engine snapshots."""
+
+import sys
+import os
+import json
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import pytest
+
+import hinlang.snapshot as snapshot
+from hinlang import RomanToHindi, HindiToRoman
+from hinlang.snapshot import load_engine, snapshot_key
+
+
+@pytest.fixture
+def words(tmp_path):
+    path = tmp_path / "slang.tsv"
+    path.write_text("# slang\nbruh\tब्रह\nVibe \tवाइब\n", encoding="utf-8")
+    return str(path)
+
+
+def _snapshots(directory):
+    return sorted(p for p in os.listdir(directory) if p.endswith(".snapshot"))
+
+
+class TestLoadEngine:
+    """Test building, saving and restoring engine snapshots."""
+
+    def test_builds_then_restores(self, tmp_path, words):
+        cache_dir = str(tmp_path / "cache")
+        built = load_engine(RomanToHindi, words, cache_dir)
+        assert built.transliterate("bruh vibe") == "ब्रह वाइब"
+        assert len(_snapshots(cache_dir)) == 1
+
+        restored = load_engine(RomanToHindi, words, cache_dir, cache_size=64)
+        assert restored._custom == built._custom
+        assert restored.cache_info().maxsize == 64
+        assert restored.transliterate("bruh vibe") == "ब्रह वाइब"
+
+    def test_restore_skips_add_words(self, tmp_path, words, monkeypatch):
+        cache_dir = str(tmp_path / "cache")
+        load_engine(RomanToHindi, words, cache_dir)
+
+        def fail(self, mapping):
+            raise AssertionError("snapshot not used")
+        monkeypatch.setattr(RomanToHindi, "add_words", fail)
+        assert load_engine(RomanToHindi, words, cache_dir).transliterate("bruh") == "ब्रह"
+
+    def test_json_words(self, tmp_path):
+        path = tmp_path / "slang.json"
+        path.write_text(json.dumps({"ब्रह": "Bruh"}), encoding="utf-8")
+        engine = load_engine(HindiToRoman, str(path), str(tmp_path / "cache"))
+        assert engine.transliterate("ब्रह") == "bruh"
+
+    def test_no_words(self, tmp_path):
+        engine = load_engine(HindiToRoman, cache_dir=str(tmp_path))
+        assert engine.transliterate("नमस्ते") == HindiToRoman().transliterate("नमस्ते")
+
+    def test_changed_words_rebuild(self, tmp_path, words):
+        cache_dir = str(tmp_path / "cache")
+        load_engine(RomanToHindi, words, cache_dir)
+        with open(words, "a", encoding="utf-8") as f:
+            f.write("yaar\tयार्र\n")
+        engine = load_engine(RomanToHindi, words, cache_dir)
+        assert engine.transliterate("yaar") == "यार्र"
+        assert len(_snapshots(cache_dir)) == 2
+
+    def test_key_covers_version_and_class(self, monkeypatch):
+        key = snapshot_key(RomanToHindi, b"a\tb")
+        assert key == snapshot_key(RomanToHindi, b"a\tb")
+        assert key != snapshot_key(RomanToHindi, b"a\tc")
+        assert key != snapshot_key(HindiToRoman, b"a\tb")
+        monkeypatch.setattr(snapshot, "FORMAT_VERSION", snapshot.FORMAT_VERSION + 1)
+        assert key != snapshot_key(RomanToHindi, b"a\tb")
+        monkeypatch.undo()
+        monkeypatch.setattr("hinlang.__version__", "0.0.0-test")
+        assert key != snapshot_key(RomanToHindi, b"a\tb")
+
+    def test_corrupt_snapshot_rebuilt(self, tmp_path, words):
+        cache_dir = str(tmp_path / "cache")
+        load_engine(RomanToHindi, words, cache_dir)
+        path = os.path.join(cache_dir, _snapshots(cache_dir)[0])
+        with open(path, "wb") as f:
+            f.write(b"not a snapshot")
+        assert load_engine(RomanToHindi, words, cache_dir).transliterate("bruh") == "ब्रह"
+        assert load_engine(RomanToHindi, words, cache_dir).transliterate("bruh") == "ब्रह"
+
+    def test_corrupted_bytes_never_load(self, tmp_path, words):
+        import random
+
+        cache_dir = str(tmp_path / "cache")
+        load_engine(RomanToHindi, words, cache_dir)
+        path = os.path.join(cache_dir, _snapshots(cache_dir)[0])
+        with open(path, "rb") as f:
+            good = f.read()
+        rng = random.Random(7)
+        for _ in range(200):
+            data = bytearray(good)
+            for _ in range(rng.randint(1, 4)):
+                data[rng.randrange(len(data))] = rng.randrange(256)
+            if rng.random() < 0.3:
+                data = data[:rng.randrange(len(data))]
+            with open(path, "wb") as f:
+                f.write(data)
+            engine = load_engine(RomanToHindi, words, cache_dir)
+            assert engine.transliterate("bruh vibe") == "ब्रह वाइब"
+
+    def test_unusable_state_rebuilt(self, tmp_path, words):
+        import pickle
+
+        cache_dir = str(tmp_path / "cache")
+        load_engine(RomanToHindi, words, cache_dir)
+        path = os.path.join(cache_dir, _snapshots(cache_dir)[0])
+        with open(path, "rb") as f:
+            header = f.readline().rsplit(b" ", 1)[0]
+        payload = pickle.dumps(["not", "a", "state"])
+        with open(path, "wb") as f:
+            f.write(header + b" " + snapshot._digest(payload) + b"\n" + payload)
+        assert load_engine(RomanToHindi, words, cache_dir).transliterate("bruh") == "ब्रह"
+
+    def test_unwritable_cache_dir(self, tmp_path, words):
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        engine = load_engine(RomanToHindi, words, str(blocker / "cache"))
+        assert engine.transliterate("bruh") == "ब्रह"
+
+    def test_unreadable_sources_build_without_snapshot(self, tmp_path, words, monkeypatch):
+        # An install with bytecode only: no .py files next to the module
+        package = tmp_path / "site-packages" / "hinlang"
+        package.mkdir(parents=True)
+        monkeypatch.setattr(snapshot, "__file__", str(package / "snapshot.pyc"))
+        with pytest.raises(OSError):
+            snapshot_key(RomanToHindi)
+
+        cache_dir = str(tmp_path / "cache")
+        engine = load_engine(RomanToHindi, words, cache_dir)
+        assert engine.transliterate("bruh vibe") == "ब्रह वाइब"
+        assert not os.path.exists(cache_dir)
+
+    def test_default_cache_dir(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("HINLANG_CACHE_DIR", str(tmp_path))
+        assert snapshot.default_cache_dir() == str(tmp_path)
+        load_engine(RomanToHindi)
+        assert len(_snapshots(str(tmp_path))) == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
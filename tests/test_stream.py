@@ -0,0 +1,69 @@
+"""Tests for streaming, whitespace-preserving transliteration."""
+
+import io
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from hinlang import RomanToHindi, HindiToRoman
+from hinlang.stream import read_chunks
+
+
+class TestTransliterateIter:
+    """Test the chunked iterator API."""
+
+    def test_preserves_whitespace(self):
+        converter = RomanToHindi()
+        text = "Namaste\tDosto\n\n  Kya haal hai\n"
+        out = "".join(converter.transliterate_iter([text]))
+        assert out == "नमस्ते\tदोस्तो\n\n  क्या हाल है\n"
+
+    def test_word_split_across_chunks(self):
+        converter = RomanToHindi()
+        out = "".join(converter.transliterate_iter(["Nam", "as", "te Do", "sto"]))
+        assert out == "नमस्ते दोस्तो"
+
+    def test_whitespace_at_chunk_edges(self):
+        converter = HindiToRoman()
+        out = "".join(converter.transliterate_iter(["नमस्ते ", " ", "\nदोस्तो", ""]))
+        assert out == "namaste  \ndosto"
+
+    def test_matches_transliterate(self):
+        converter = HindiToRoman()
+        text = "(मेरा) नाम  रंजन है।"
+        out = "".join(converter.transliterate_iter(text[i:i + 3] for i in range(0, len(text), 3)))
+        assert " ".join(out.split()) == converter.transliterate(text)
+
+    def test_is_lazy(self):
+        def chunks():
+            yield "hai "
+            raise RuntimeError("should not be consumed yet")
+
+        pieces = RomanToHindi().transliterate_iter(chunks())
+        assert next(pieces) == "है "
+
+
+class TestTransliterateTo:
+    """Test writing to a file-like object."""
+
+    def test_from_file(self):
+        src = io.StringIO("Main theek hoon\nShukriya dost\n")
+        dst = io.StringIO()
+        written = RomanToHindi().transliterate_to(src, dst)
+        assert dst.getvalue() == "मैं ठीक हूँ\nशुक्रिया दोस्त\n"
+        assert written == len(dst.getvalue())
+
+    def test_from_string(self):
+        dst = io.StringIO()
+        HindiToRoman().transliterate_to("क्या\tहाल है", dst)
+        assert dst.getvalue() == "kya\thaal hai"
+
+    def test_read_chunks_sizes(self):
+        assert list(read_chunks(io.StringIO("abcde"), size=2)) == ["ab", "cd", "e"]
+        assert list(read_chunks(["a", "b"])) == ["a", "b"]
+        assert list(read_chunks("abc")) == ["abc"]
+
+
+if __name__ == "__main__":
+    import pytest
+    pytest.main([__file__, "-v"])
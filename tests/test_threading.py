@@ -0,0 +1,98 @@
+"""Tests for sharing one engine across threads."""
+
+import pickle
+import sys
+import os
+import threading
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import pytest
+
+import hinlang
+from hinlang import RomanToHindi, HindiToRoman
+
+
+class TestSnapshots:
+    """Test copy-on-write custom-word snapshots."""
+
+    def test_add_word_publishes_new_snapshot(self):
+        converter = RomanToHindi()
+        before = converter._custom
+        converter.add_word("bruh", "ब्रह")
+        assert converter._custom is not before
+        assert "bruh" not in before
+
+    def test_concurrent_readers_and_writer(self):
+        converter = RomanToHindi(cache_size=64)
+        errors = []
+        stop = threading.Event()
+
+        def reader():
+            try:
+                while not stop.is_set():
+                    assert converter.transliterate("Namaste Dosto") == "नमस्ते दोस्तो"
+            except Exception as exc:  # pragma: no cover - surfaced below
+                errors.append(exc)
+
+        threads = [threading.Thread(target=reader) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for i in range(300):
+            converter.add_word("word%d" % i, "शब्द")
+        stop.set()
+        for t in threads:
+            t.join()
+
+        assert not errors
+        assert len(converter._custom) == 300
+
+    def test_concurrent_writers_lose_nothing(self):
+        converter = HindiToRoman()
+
+        def writer(n):
+            for i in range(100):
+                converter.add_word("क%d_%d" % (n, i), "k")
+
+        threads = [threading.Thread(target=writer, args=(n,)) for n in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len(converter._custom) == 400
+
+
+class TestThreadBatch:
+    """Test the thread-pool batch backend."""
+
+    def test_thread_backend_matches_serial(self):
+        texts = ["Kya haal hai", "zorawar", "Shukriya dost"] * 20
+        serial = hinlang.to_hindi_batch(texts)
+        assert hinlang.to_hindi_batch(texts, workers=4, chunksize=5, backend="thread") == serial
+
+    def test_thread_backend_uses_custom_words(self):
+        converter = HindiToRoman()
+        converter.add_word("है", "h")
+        result = converter.transliterate_batch(["है"] * 9, workers=3, chunksize=2, backend="thread")
+        assert result == ["h"] * 9
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError):
+            hinlang.to_roman_batch(["है"], workers=2, backend="gpu")
+
+
+class TestPickle:
+    """Test that engines pickle only their own state."""
+
+    def test_roundtrip_keeps_custom_words_and_cache_size(self):
+        converter = RomanToHindi(cache_size=32)
+        converter.add_word("bruh", "ब्रह")
+        clone = pickle.loads(pickle.dumps(converter))
+        assert clone.transliterate("bruh") == "ब्रह"
+        assert clone.cache_info().maxsize == 32
+
+    def test_pickle_is_small(self):
+        assert len(pickle.dumps(HindiToRoman())) < 200
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
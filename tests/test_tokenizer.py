@@ -0,0 +1,59 @@
+"""Tests for the shared single-pass tokenizer."""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from hinlang import to_hindi, to_roman
+from hinlang.tokenizer import ROMAN_TOKENIZER, DEVANAGARI_TOKENIZER
+
+
+class TestTokenizer:
+    """Test (prefix, core, suffix) splitting."""
+
+    def test_plain_words(self):
+        assert ROMAN_TOKENIZER.tokenize("Kya haal") == [
+            ("", "Kya", ""), ("", "haal", ""),
+        ]
+
+    def test_punctuation_around_word(self):
+        assert ROMAN_TOKENIZER.tokenize('"Kya!?"') == [('"', "Kya", '!?"')]
+
+    def test_inner_punctuation_kept_in_core(self):
+        assert ROMAN_TOKENIZER.tokenize("(a.b)") == [("(", "a.b", ")")]
+
+    def test_punctuation_only_token(self):
+        assert ROMAN_TOKENIZER.tokenize("hai !!!") == [
+            ("", "hai", ""), ("!!!", "", ""),
+        ]
+
+    def test_underscore_is_punctuation(self):
+        assert ROMAN_TOKENIZER.tokenize("_dost_") == [("_", "dost", "_")]
+
+    def test_any_whitespace_separates(self):
+        assert len(ROMAN_TOKENIZER.tokenize(" a\tb\nc  ")) == 3
+
+    def test_devanagari_marks_are_word_chars(self):
+        # Matras and virama are not isalnum() but belong to the word
+        assert DEVANAGARI_TOKENIZER.tokenize("(नमस्ते)") == [("(", "नमस्ते", ")")]
+        assert ROMAN_TOKENIZER.tokenize("नमस्ते") == [("", "नमस्त", "े")]
+
+    def test_long_punctuation_run(self):
+        run = "!" * 100000
+        assert ROMAN_TOKENIZER.tokenize("a" + run) == [("", "a", run)]
+
+
+class TestEnginePunctuation:
+    """Test punctuation handling through the engines."""
+
+    def test_hindi_suffix_danda(self):
+        assert to_hindi("Namaste.") == "नमस्ते।"
+
+    def test_emoji_passthrough(self):
+        assert to_hindi("🙂🙂 dosto!!") == "🙂🙂 दोस्तो!!"
+        assert to_roman("🙂 दोस्तो") == "🙂 dosto"
+
+
+if __name__ == "__main__":
+    import pytest
+    pytest.main([__file__, "-v"])
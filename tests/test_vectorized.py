@@ -0,0 +1,63 @@
+"""Tests for the optional NumPy-vectorized Hindi → Roman engine."""
+
+import random
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from hinlang import HindiToRoman
+from hinlang.vectorized import NumpyHindiToRoman, romanize_words
+
+
+class TestRomanizeWords:
+    """romanize_words must match the scalar character path exactly."""
+
+    def test_known_words(self):
+        words = ["नमस्ते", "रंजन", "क्षत्रिय", "ज़िंदगी", "ओम्", "१२३।"]
+        scalar = HindiToRoman()
+        assert romanize_words(words) == [scalar._convert_chars(w) for w in words]
+
+    def test_random_block(self):
+        rng = random.Random(0)
+        alphabet = [chr(cp) for cp in range(0x0900, 0x0980)] + list("ab1_🙂")
+        words = [
+            ''.join(rng.choice(alphabet) for _ in range(rng.randint(1, 10)))
+            for _ in range(2000)
+        ]
+        scalar = HindiToRoman()
+        assert romanize_words(words) == [scalar._convert_chars(w) for w in words]
+
+    def test_no_lookahead_across_words(self):
+        # A consonant at the end of one word must not take an 'a' from the next
+        assert romanize_words(["क", "ा"]) == ["k", "ा"]
+
+    def test_empty(self):
+        assert romanize_words([]) == []
+
+
+class TestNumpyHindiToRoman:
+    """Test the engine subclass."""
+
+    SENTENCES = ["नमस्ते दोस्तो", "मेरा नाम रंजन है।", "(ज़ोरावर) गढ़वाल!!", ""]
+
+    def test_matches_base_engine(self):
+        base = HindiToRoman()
+        fast = NumpyHindiToRoman(min_chars=0)
+        for text in self.SENTENCES:
+            assert fast.transliterate(text) == base.transliterate(text)
+        assert fast.transliterate_batch(self.SENTENCES) == base.transliterate_batch(self.SENTENCES)
+
+    def test_custom_words_and_cache(self):
+        fast = NumpyHindiToRoman(cache_size=16, min_chars=0)
+        fast.add_word("है", "h")
+        expected = "h " + HindiToRoman().transliterate("गढ़वाल गढ़वाल")
+        assert fast.transliterate("है गढ़वाल गढ़वाल") == expected
+        assert fast.cache_info().currsize == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])